@@ -7,12 +7,12 @@ with support for both simple and advanced context-aware generation.
 import json
 import re
 import shlex
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, cast
 
-import questionary
 from rich import print as rprint
-from rich.panel import Panel
 
 from git_acp.ai.client import AIClient
 from git_acp.config import (
@@ -22,7 +22,6 @@ from git_acp.config import (
     DEFAULT_NUM_RECENT_COMMITS,
     DEFAULT_NUM_RELATED_COMMITS,
     MIN_CHANGES_CONTEXT,
-    QUESTIONARY_STYLE,
     SIMPLE_PROMPT_CONTEXT_RATIO,
 )
 from git_acp.git import (
@@ -36,9 +35,12 @@ from git_acp.git import (
 from git_acp.utils import (
     GitConfig,
     OptionalConfig,
+    call_with_deferred_debug,
     debug_header,
     debug_item,
     debug_preview,
+    flush_debug_output,
+    questionary_style,
 )
 
 
@@ -54,7 +56,45 @@ def estimate_tokens(text: str) -> int:
     Returns:
         Estimated token count.
     """
-    return max(1, len(text) // 4)
+    return _estimate_tokens_for_length(len(text))
+
+
+def _estimate_tokens_for_length(length: int) -> int:
+    """Apply the :func:`estimate_tokens` heuristic to a known text length.
+
+    Args:
+        length: Number of characters in the text.
+
+    Returns:
+        Estimated token count.
+    """
+    return max(1, length // 4)
+
+
+def _estimate_context_tokens(
+    context: dict[str, Any], encoded_changes_len: int | None
+) -> int:
+    """Estimate tokens of ``json.dumps(context, indent=2)``.
+
+    When the length of the JSON-encoded ``staged_changes`` string is known,
+    the rest of the context is serialized with an empty placeholder in its
+    place and the known length is added back. JSON strings are encoded the
+    same way at any nesting level, so the result is identical to encoding the
+    full context.
+
+    Args:
+        context: Context dictionary to measure.
+        encoded_changes_len: ``len(json.dumps(context["staged_changes"]))``,
+            or None to serialize the full context.
+
+    Returns:
+        Estimated token count.
+    """
+    if encoded_changes_len is None:
+        return estimate_tokens(json.dumps(context, indent=2))
+    skeleton = json.dumps({**context, "staged_changes": ""}, indent=2)
+    # Swap the two characters of the empty placeholder for the real string.
+    return _estimate_tokens_for_length(len(skeleton) - 2 + encoded_changes_len)
 
 
 def calculate_context_budget(
@@ -80,6 +120,22 @@ def calculate_context_budget(
     return max_prompt_tokens, reserved_response_tokens
 
 
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of ``text`` exactly as splitting on newlines would.
+
+    Args:
+        text: Text to split.
+
+    Yields:
+        Each line without its trailing newline.
+    """
+    start = 0
+    while (end := text.find("\n", start)) != -1:
+        yield text[start:end]
+        start = end + 1
+    yield text[start:]
+
+
 def truncate_context_for_window(
     context: dict[str, Any], max_tokens: int, prompt_type: str = "simple"
 ) -> dict[str, Any]:
@@ -96,8 +152,13 @@ def truncate_context_for_window(
     # Start with full context
     truncated = context.copy()
 
+    # The staged diff dominates the payload and is left untouched while the
+    # history keys are trimmed, so encode it once instead of on every pass.
+    changes = truncated.get("staged_changes")
+    encoded_changes_len = len(json.dumps(changes)) if isinstance(changes, str) else None
+
     # Calculate current token usage
-    current_tokens = estimate_tokens(json.dumps(truncated, indent=2))
+    current_tokens = _estimate_context_tokens(truncated, encoded_changes_len)
 
     if current_tokens <= max_tokens:
         return truncated
@@ -135,7 +196,7 @@ def truncate_context_for_window(
                 truncated[key] = patterns
 
             # Recalculate tokens
-            current_tokens = estimate_tokens(json.dumps(truncated, indent=2))
+            current_tokens = _estimate_context_tokens(truncated, encoded_changes_len)
 
     # Final check - if still over budget, truncate staged changes
     if current_tokens > max_tokens and "staged_changes" in truncated:
@@ -149,19 +210,21 @@ def truncate_context_for_window(
 
         # Truncate changes to fit
         if changes_tokens > allowed_changes_tokens:
-            lines = changes.split("\n")
+            # Walk the diff lazily: only the kept prefix is ever copied, so a
+            # huge diff is not split into a full list of lines first.
+            total_lines = changes.count("\n") + 1
             truncated_lines = []
             current_line_tokens = 0
 
-            for line in lines:
-                line_tokens = estimate_tokens(line + "\n")
+            for line in _iter_lines(changes):
+                line_tokens = _estimate_tokens_for_length(len(line) + 1)
                 if current_line_tokens + line_tokens <= allowed_changes_tokens:
                     truncated_lines.append(line)
                     current_line_tokens += line_tokens
                 else:
                     # Add truncated indicator
                     truncated_lines.append(
-                        f"... [truncated {len(lines) - len(truncated_lines)} lines]"
+                        f"... [truncated {total_lines - len(truncated_lines)} lines]"
                     )
                     break
 
@@ -170,6 +233,72 @@ def truncate_context_for_window(
     return truncated
 
 
+# Static tails of the structured prompts. They never depend on the context, so
+# they are defined once and only the dynamic sections are formatted per call.
+_ADVANCED_PROMPT_INSTRUCTIONS = """<requirements>
+1. Match repository commit style and patterns
+2. Be specific about changes and rationale
+3. Reference related commits when relevant
+4. Use optional scope text in the subject only when helpful
+5. Keep title under 72 chars, body well-formatted
+6. Output only the commit message, no additional text, comments or explanations.
+7. Do not mention these instructions, formatting rules, or the prompt itself.
+8. Avoid meta commentary about following guidelines.
+9. Do NOT include a commit type prefix (for example `feat:`, `fix:`,
+   `refactor(scope):`, or emoji-prefixed types) in the title.
+</requirements>
+
+<output_format>
+descriptive title
+[optional scope in plain text, no conventional prefix]
+
+Explain what changed and why (no meta commentary).
+Reference to related work if applicable.
+</output_format>"""
+
+_SIMPLE_PROMPT_INSTRUCTIONS = """<requirements>
+1. Be specific about what changed
+2. Keep under 72 characters for title
+3. Add body only if explanation needed
+4. Output only the commit description, no additional text, comments or explanations.
+5. Do not mention these instructions, formatting rules, or the prompt itself.
+6. Avoid meta commentary about following guidelines.
+7. Do NOT include a conventional commit type prefix in the title (for example
+   `feat:`, `fix:`, `docs(scope):`, or emoji-prefixed types).
+</requirements>
+
+<output_format>
+brief description
+
+[Optional explanation of what changed and why, no meta commentary]
+</output_format>"""
+
+# Body lines an AI model adds about its own instructions rather than the change.
+_META_COMMENTARY_PATTERN = re.compile(
+    r"(guideline|prompt|instruction|format|conventional commit|meta commentary|"
+    r"adhere|adherence|best practice|requirements)",
+    re.IGNORECASE,
+)
+
+
+def _format_commit_messages(commits: list[dict[str, str]]) -> str:
+    """Render commit messages as an indented bullet list for the prompt.
+
+    The model only needs readable text, so this avoids building an
+    intermediate list and JSON-encoding it.
+
+    Args:
+        commits: Commit dictionaries with a ``message`` key.
+
+    Returns:
+        A newline followed by one bullet per message, or ``" (none)"``.
+    """
+    bullets = "\n".join(
+        "  - " + commit["message"].replace("\n", "\n    ") for commit in commits
+    )
+    return "\n" + bullets if bullets else " (none)"
+
+
 def create_structured_advanced_commit_message_prompt(
     context: dict[str, Any],
     config: OptionalConfig = None,
@@ -186,13 +315,12 @@ def create_structured_advanced_commit_message_prompt(
     # Get most common commit type from recent commits
     commit_types = context["commit_patterns"]["types"]
     common_type = (
-        max(commit_types.items(), key=lambda x: x[1])[0] if commit_types else "feat"
+        max(commit_types, key=commit_types.__getitem__) if commit_types else "feat"
     )
 
     # Format recent commit messages for context
-    recent_messages = [c["message"] for c in context["recent_commits"]]
-    related_messages = [c["message"] for c in context["related_commits"]]
-    related_json = json.dumps(related_messages, indent=2) if related_messages else "[]"
+    recent_text = _format_commit_messages(context["recent_commits"])
+    related_text = _format_commit_messages(context["related_commits"])
 
     # Get commit patterns for style guidance
     patterns = context["commit_patterns"]
@@ -208,8 +336,8 @@ for the provided git changes.
 
 <repository_context>
 - Most common commit type: `{common_type}`
-- Recent commit patterns: {json.dumps(recent_messages, indent=2)}
-- Related work: {related_json}
+- Recent commit patterns:{recent_text}
+- Related work:{related_text}
 - Common scopes: {scope_text}
 </repository_context>
 
@@ -223,26 +351,7 @@ Follow repository patterns:
 - Message length: Keep title under 72 characters
 </style_guide>
 
-<requirements>
-1. Match repository commit style and patterns
-2. Be specific about changes and rationale
-3. Reference related commits when relevant
-4. Use optional scope text in the subject only when helpful
-5. Keep title under 72 chars, body well-formatted
-6. Output only the commit message, no additional text, comments or explanations.
-7. Do not mention these instructions, formatting rules, or the prompt itself.
-8. Avoid meta commentary about following guidelines.
-9. Do NOT include a commit type prefix (for example `feat:`, `fix:`,
-   `refactor(scope):`, or emoji-prefixed types) in the title.
-</requirements>
-
-<output_format>
-descriptive title
-[optional scope in plain text, no conventional prefix]
-
-Explain what changed and why (no meta commentary).
-Reference to related work if applicable.
-</output_format>"""
+{_ADVANCED_PROMPT_INSTRUCTIONS}"""
 
     if config and config.verbose:
         debug_header("Generated structured advanced prompt preview:")
@@ -272,22 +381,7 @@ Generate a commit message subject and optional body for the provided git changes
 {context["staged_changes"]}
 </changes>
 
-<requirements>
-1. Be specific about what changed
-2. Keep under 72 characters for title
-3. Add body only if explanation needed
-4. Output only the commit description, no additional text, comments or explanations.
-5. Do not mention these instructions, formatting rules, or the prompt itself.
-6. Avoid meta commentary about following guidelines.
-7. Do NOT include a conventional commit type prefix in the title (for example
-   `feat:`, `fix:`, `docs(scope):`, or emoji-prefixed types).
-</requirements>
-
-<output_format>
-brief description
-
-[Optional explanation of what changed and why, no meta commentary]
-</output_format>"""
+{_SIMPLE_PROMPT_INSTRUCTIONS}"""
 
     if config and config.verbose:
         debug_header("Generated structured simple prompt preview:")
@@ -328,6 +422,46 @@ def _diff_for_untracked_files(file_paths: list[str]) -> str:
     return "\n".join(parts)
 
 
+def _gather_changes(config: GitConfig) -> str:
+    """Return the staged diff, falling back to the scoped working-tree diff.
+
+    Args:
+        config (GitConfig): Configuration options.
+
+    Returns:
+        str: Diff text describing the changes to commit.
+
+    Raises:
+        GitError: If ``config.files`` cannot be parsed.
+    """
+    # Get staged changes
+    staged_changes = get_diff("staged", config)
+    if not staged_changes:
+        if config and config.verbose:
+            debug_header("No staged changes, checking working directory")
+        # Scope the unstaged diff to the user's selected files so the AI
+        # only sees changes relevant to the intended commit (important in
+        # dry-run mode where files are never actually staged).
+        selected_files: list[str] | None = None
+        if config and config.files and config.files != ".":
+            try:
+                selected_files = shlex.split(config.files)
+            except ValueError as e:
+                raise GitError(f"Malformed config.files value: {e}") from e
+        staged_changes = get_diff("unstaged", config, files=selected_files)
+
+        # git diff does not show untracked files.  When the diff is
+        # still empty and the user selected specific files, generate
+        # diff-like content for any untracked files among them so the
+        # AI can reason about new files.
+        if not staged_changes and selected_files:
+            all_changed = get_changed_files(config, staged_only=False)
+            untracked = [f for f in selected_files if f in all_changed]
+            if untracked:
+                staged_changes = _diff_for_untracked_files(untracked)
+    return staged_changes
+
+
 def get_commit_context(config: GitConfig) -> dict[str, Any]:
     """Gather git context information for commit message generation.
 
@@ -344,35 +478,34 @@ def get_commit_context(config: GitConfig) -> dict[str, Any]:
         if config and config.verbose:
             debug_header("Starting context gathering")
 
-        # Get staged changes
-        staged_changes = get_diff("staged", config)
-        if not staged_changes:
+        # History does not depend on the diff, so the recent-commits log runs
+        # in a worker while the diff and related-commit lookups run here. Its
+        # debug output is held back until the result is collected.
+        recent_debug: list[str] = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            recent_future = executor.submit(
+                call_with_deferred_debug,
+                recent_debug,
+                get_recent_commits,
+                DEFAULT_NUM_RECENT_COMMITS,
+                config,
+            )
+
+            staged_changes = _gather_changes(config)
+
             if config and config.verbose:
-                debug_header("No staged changes, checking working directory")
-            # Scope the unstaged diff to the user's selected files so the AI
-            # only sees changes relevant to the intended commit (important in
-            # dry-run mode where files are never actually staged).
-            selected_files: list[str] | None = None
-            if config and config.files and config.files != ".":
-                try:
-                    selected_files = shlex.split(config.files)
-                except ValueError as e:
-                    raise GitError(f"Malformed config.files value: {e}") from e
-            staged_changes = get_diff("unstaged", config, files=selected_files)
-
-            # git diff does not show untracked files.  When the diff is
-            # still empty and the user selected specific files, generate
-            # diff-like content for any untracked files among them so the
-            # AI can reason about new files.
-            if not staged_changes and selected_files:
-                all_changed = get_changed_files(config, staged_only=False)
-                untracked = [f for f in selected_files if f in all_changed]
-                if untracked:
-                    staged_changes = _diff_for_untracked_files(untracked)
+                debug_header("Analyzing commit patterns")
 
-        if config and config.verbose:
-            debug_header("Fetching commit history")
-        recent_commits = get_recent_commits(DEFAULT_NUM_RECENT_COMMITS, config)
+            # Find related commits based on staged changes
+            related_commits = find_related_commits(
+                staged_changes, DEFAULT_NUM_RELATED_COMMITS, config
+            )
+
+            if config and config.verbose:
+                debug_header("Fetching commit history")
+            wait((recent_future,))
+            flush_debug_output(recent_debug)
+            recent_commits = recent_future.result()
 
         if config and config.verbose:
             debug_header("Validating commit data")
@@ -392,14 +525,6 @@ def get_commit_context(config: GitConfig) -> dict[str, Any]:
                 ", ".join(commit_patterns["scopes"].keys()),
             )
 
-        if config and config.verbose:
-            debug_header("Analyzing commit patterns")
-
-        # Find related commits based on staged changes
-        related_commits = find_related_commits(
-            staged_changes, DEFAULT_NUM_RELATED_COMMITS, config
-        )
-
         context = {
             "staged_changes": staged_changes,
             "recent_commits": recent_commits,
@@ -433,6 +558,11 @@ def edit_commit_message(message: str, config: GitConfig) -> str:
     if not config.interactive:
         return message
 
+    # Only the interactive review needs prompt_toolkit, so keep it off the
+    # import path of non-interactive and manual-message runs.
+    import questionary
+    from rich.panel import Panel
+
     if config and config.verbose:
         debug_header("Editing commit message")
 
@@ -448,7 +578,7 @@ def edit_commit_message(message: str, config: GitConfig) -> str:
     # Ask if user wants to edit
     if questionary.confirm(
         "Would you like to edit this message?",
-        style=questionary.Style(QUESTIONARY_STYLE),
+        style=questionary_style(),
     ).ask():
         # Let user edit the message
         edited = cast(
@@ -456,7 +586,7 @@ def edit_commit_message(message: str, config: GitConfig) -> str:
             questionary.text(
                 "Edit commit message:",
                 default=message,
-                style=questionary.Style(QUESTIONARY_STYLE),
+                style=questionary_style(),
             ).ask(),
         )
 
@@ -485,20 +615,77 @@ def _strip_meta_commentary(message: str) -> str:
     lines = stripped.splitlines()
     title = lines[0].strip()
     body_lines = [line.strip() for line in lines[1:]]
-    meta_pattern = re.compile(
-        r"(guideline|prompt|instruction|format|conventional commit|meta commentary|"
-        r"adhere|adherence|best practice|requirements)",
-        re.IGNORECASE,
-    )
-
     cleaned_body = [
-        line for line in body_lines if line and not meta_pattern.search(line)
+        line
+        for line in body_lines
+        if line and not _META_COMMENTARY_PATTERN.search(line)
     ]
     if cleaned_body:
         return "\n".join([title, "", *cleaned_body])
     return title
 
 
+def _build_context_prompt(config: GitConfig) -> str:
+    """Gather repository context and render the simple or advanced prompt.
+
+    Args:
+        config: GitConfig instance containing configuration options.
+
+    Returns:
+        The prompt to send to the AI model.
+    """
+    context = get_commit_context(config)
+
+    if config and config.verbose:
+        debug_header("Creating AI prompt")
+
+    # Calculate context budget and apply smart truncation
+    context_window = config.context_window or DEFAULT_CONTEXT_WINDOW
+    max_prompt_tokens, reserved_response_tokens = calculate_context_budget(
+        context_window, config.prompt_type
+    )
+
+    # Apply context window management
+    if config.prompt_type == "simple":
+        # Simple mode: more aggressive truncation for local usage
+        truncated_context = truncate_context_for_window(
+            context, max_prompt_tokens, "simple"
+        )
+    else:
+        # Advanced mode: preserve more context for accuracy
+        truncated_context = truncate_context_for_window(
+            context, max_prompt_tokens, "advanced"
+        )
+
+    if config.prompt_type == "advanced":
+        return create_structured_advanced_commit_message_prompt(
+            truncated_context, config
+        )
+    return create_structured_simple_commit_message_prompt(truncated_context, config)
+
+
+# AIClient instances keyed by the config fields the client reads. Reusing one
+# keeps the OpenAI SDK's HTTP connection pool alive across the several
+# generations of an auto-group run instead of reconnecting for each group.
+_AI_CLIENTS: dict[tuple[str | None, int | None, bool], AIClient] = {}
+
+
+def _get_ai_client(config: GitConfig) -> AIClient:
+    """Return a shared AIClient for the model settings in ``config``.
+
+    Args:
+        config: GitConfig instance containing configuration options.
+
+    Returns:
+        AIClient: A client created on first use for these settings.
+    """
+    key = (config.ai_model, config.context_window, config.verbose)
+    client = _AI_CLIENTS.get(key)
+    if client is None:
+        client = _AI_CLIENTS[key] = AIClient(config)
+    return client
+
+
 def generate_commit_message(config: GitConfig) -> str:
     """Generate a commit message using AI.
 
@@ -518,45 +705,14 @@ def generate_commit_message(config: GitConfig) -> str:
             if config.prompt and config.prompt.strip():
                 debug_item("Prompt override", "enabled")
 
-        # Initialize AI client
-        ai_client = AIClient(config)
-
-        if config and config.verbose:
-            debug_header("Gathering repository context")
-        context = get_commit_context(config)
+        ai_client = _get_ai_client(config)
 
-        if config and config.verbose:
-            debug_header("Creating AI prompt")
-
-        # Calculate context budget and apply smart truncation
-        context_window = config.context_window or DEFAULT_CONTEXT_WINDOW
-        max_prompt_tokens, reserved_response_tokens = calculate_context_budget(
-            context_window, config.prompt_type
-        )
-
-        # Apply context window management
-        if config.prompt_type == "simple":
-            # Simple mode: more aggressive truncation for local usage
-            truncated_context = truncate_context_for_window(
-                context, max_prompt_tokens, "simple"
-            )
-        else:
-            # Advanced mode: preserve more context for accuracy
-            truncated_context = truncate_context_for_window(
-                context, max_prompt_tokens, "advanced"
-            )
-
-        # Create prompt based on configuration, allowing an explicit override.
+        # An explicit prompt override is sent verbatim, so the repository
+        # context (diffs, history, related commits) would go unused.
         if config.prompt and config.prompt.strip():
             prompt = config.prompt.strip()
-        elif config.prompt_type == "advanced":
-            prompt = create_structured_advanced_commit_message_prompt(
-                truncated_context, config
-            )
         else:
-            prompt = create_structured_simple_commit_message_prompt(
-                truncated_context, config
-            )
+            prompt = _build_context_prompt(config)
 
         # Send request to AI model
         messages = [{"role": "user", "content": prompt}]
@@ -5,12 +5,14 @@ OpenAI-compatible endpoints. It is responsible solely for network interaction
 and leaves prompt construction and message handling to other modules.
 """
 
+from __future__ import annotations
+
 from collections.abc import Callable
 from threading import Event, Thread
 from time import sleep
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import OpenAI
+from rich.markup import escape
 from rich.progress import Progress
 
 from git_acp.config import (
@@ -25,9 +27,28 @@ from git_acp.config import (
 from git_acp.git import GitError
 from git_acp.utils import OptionalConfig, debug_header, debug_item
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 # Type alias for progress factory injection
 ProgressFactory = Callable[[], Progress]
 
+# Trailing characters of a streamed reply echoed in the progress line.
+_STREAM_PREVIEW_CHARS: int = 60
+
+
+def _stream_preview(parts: list[str]) -> str:
+    """Describe a partially received reply for the progress line.
+
+    Args:
+        parts: Content deltas received so far.
+
+    Returns:
+        str: Progress description ending in the tail of the latest line.
+    """
+    tail = "".join(parts).rstrip().rsplit("\n", 1)[-1]
+    return f"Receiving AI response: {escape(tail[-_STREAM_PREVIEW_CHARS:])}"
+
 
 class AIClient:
     """Client for interacting with AI models via the OpenAI package."""
@@ -79,6 +100,10 @@ class AIClient:
             debug_item("Timeout", str(DEFAULT_AI_TIMEOUT))
             debug_item("Context window", str(self.context_window))
 
+        # Deferred: the openai SDK is slow to import and only needed once a
+        # client is actually created.
+        from openai import OpenAI
+
         try:
             self.client = OpenAI(
                 base_url=self.base_url,
@@ -154,7 +179,11 @@ class AIClient:
         Raises:
             GitError: With specific error context for failure scenarios.
             TimeoutError: If the request exceeds the configured timeout.
+            TypeError: If ``stream`` is passed; replies are always streamed.
         """
+        if "stream" in kwargs:
+            raise TypeError("chat_completion() always streams; do not pass 'stream'")
+
         try:
             if self.config and self.config.verbose:
                 debug_header("Sending chat completion request")
@@ -195,19 +224,28 @@ class AIClient:
                     total=100,
                 )
 
+                # The reply is streamed so the progress line can show text
+                # as soon as the first token arrives instead of a bare
+                # spinner for the whole generation.
                 response_event = Event()
-                response_data = {"response": None, "error": None}
+                response_parts: list[str] = []
+                response_data: dict[str, Exception | None] = {"error": None}
 
                 def make_request():
                     try:
-                        response_data["response"] = self.client.chat.completions.create(
+                        stream = self.client.chat.completions.create(
                             model=self.model,
                             messages=messages,
                             temperature=DEFAULT_TEMPERATURE,
                             timeout=DEFAULT_AI_TIMEOUT,
                             extra_body=extra_body,
+                            stream=True,
                             **kwargs,
                         )
+                        for chunk in stream:
+                            delta = chunk.choices[0].delta if chunk.choices else None
+                            if delta and delta.content:
+                                response_parts.append(delta.content)
                     except Exception as e:  # pragma: no cover
                         response_data["error"] = e
                     finally:
@@ -217,28 +255,35 @@ class AIClient:
                 thread.start()
 
                 elapsed = 0.0
+                received = 0
                 while not response_event.is_set() and elapsed < DEFAULT_AI_TIMEOUT:
                     progress.update(
                         task,
                         completed=int((elapsed / DEFAULT_AI_TIMEOUT) * 100),
                     )
+                    if len(response_parts) != received:
+                        received = len(response_parts)
+                        progress.update(
+                            task, description=_stream_preview(response_parts)
+                        )
                     sleep(0.1)
                     elapsed += 0.1
 
                 progress.update(task, completed=100)
 
-                if response_data["error"]:
-                    raise response_data["error"]
+                error = response_data["error"]
+                if error:
+                    raise error
                 if not response_event.is_set():
                     raise TimeoutError("Request timed out")
 
-                response = response_data["response"]
-                if not response or not response.choices:
+                content = "".join(response_parts)
+                if not content:
                     raise GitError(
                         "AI model returned an empty response. Please try again."
                     )
 
-                return response.choices[0].message.content
+                return content
 
         except TimeoutError:
             if self.config and self.config.verbose:
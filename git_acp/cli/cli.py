@@ -26,7 +26,9 @@ from git_acp.cli.workflow import EXIT_CODE_CANCELLED, GitWorkflow
 from git_acp.config import COLORS, DEFAULT_AUTO_GROUP_MAX_NON_TYPE_GROUPS
 from git_acp.git import (
     CommitType,
+    GitError,
     get_changed_files,
+    get_current_branch,
     group_changed_files,
     setup_signal_handlers,
     unstage_files,
@@ -49,9 +51,7 @@ def format_commit_message(commit_type: CommitType, message: str) -> str:
     Returns:
         The formatted commit message.
     """
-    lines = message.split("\n")
-    title = lines[0]
-    description = "\n".join(lines[1:])
+    title, _, description = message.partition("\n")
     return f"{commit_type.value}: {title}\n\n{description}".strip()
 
 
@@ -89,15 +89,18 @@ def _process_add_argument(add: str | None) -> tuple[str | None, bool]:
         return "", False
 
     items_to_process = shlex.split(add)
-    resolved_paths: list[str] = []
+    # Keys double as an order-preserving de-duplication of overlapping
+    # patterns; iglob streams matches instead of building a list per item.
+    resolved_paths: dict[str, None] = {}
     unmatched_items: list[str] = []
 
     for item in items_to_process:
-        expanded_paths = glob.glob(item, recursive=True)
-        if not expanded_paths:
+        matched = False
+        for path in glob.iglob(item, recursive=True):
+            resolved_paths[path] = None
+            matched = True
+        if not matched:
             unmatched_items.append(item)
-        else:
-            resolved_paths.extend(expanded_paths)
 
     if unmatched_items:
         warn = COLORS["warning"]
@@ -117,9 +120,7 @@ def _process_add_argument(add: str | None) -> tuple[str | None, bool]:
         )
         return "", False
 
-    # Remove duplicates while preserving order
-    unique_paths = list(dict.fromkeys(resolved_paths))
-    return _quote_paths(unique_paths), False
+    return _quote_paths(list(resolved_paths)), False
 
 
 @click.command()
@@ -310,7 +311,7 @@ def main(
     - AI Features: AI-powered commit message generation (-o, -i, -p, -pt)
     - General: Program behavior control (-nc, -v)
     """  # noqa: D301
-    setup_signal_handlers()
+    setup_signal_handlers(dry_run=dry_run)
 
     if run_setup_flag:
         from git_acp.config import run_setup
@@ -381,12 +382,28 @@ def main(
                 )
             )
 
+            # Resolve the push branch once for all groups instead of letting
+            # every per-group workflow shell out to git for the same answer.
+            # On failure, leave it unset so the workflow reports the error.
+            # Dry runs never push, so they skip the lookup entirely.
+            if not config.branch and not config.dry_run and groups:
+                try:
+                    config = replace(config, branch=get_current_branch())
+                except GitError:
+                    pass
+
             success_count = 0
             failure_count = 0
             cancelled_at_group: int | None = None
 
             for index, group in enumerate(groups, start=1):
-                staged_before = get_changed_files(config, staged_only=True)
+                # Dry-run workflows never stage, so the index cannot have
+                # changed since the empty-staging check above.
+                staged_before = (
+                    set()
+                    if config.dry_run
+                    else get_changed_files(config, staged_only=True)
+                )
                 if staged_before:
                     warn = COLORS["warning"]
                     rprint(
@@ -439,7 +456,8 @@ def main(
                 finally:
                     # Defensive cleanup in case a workflow exits before its
                     # handler-level cleanup runs.
-                    unstage_files(config)
+                    if not config.dry_run:
+                        unstage_files(config)
 
             border = "yellow" if cancelled_at_group else "green"
             if failure_count:
@@ -480,8 +498,10 @@ def main(
 
     except Exception as e:
         err = COLORS["error"]
-        content = f"[{err}]Critical error:\n{e}[/{err}]\n\nSuggestion: "
-        content += "Please check your git repository and configuration."
+        content = (
+            f"[{err}]Critical error:\n{e}[/{err}]\n\n"
+            "Suggestion: Please check your git repository and configuration."
+        )
         rprint(Panel(content, title="Critical Error", border_style="red"))
         sys.exit(1)
 
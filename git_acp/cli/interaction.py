@@ -3,21 +3,38 @@
 This module provides a Protocol for user interaction, enabling dependency
 injection for testing. Production code uses RichQuestionaryInteraction,
 while tests can use TestInteraction.
+
+``questionary`` (and the prompt_toolkit stack behind it) is imported lazily
+inside the prompting methods so that unattended runs (``--no-confirm``) never
+pay for initializing the terminal UI machinery.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sized
 from typing import Protocol, cast
 
-import questionary
 from rich import print as rprint
 from rich.panel import Panel
 from rich.prompt import Confirm
 from rich.text import Text
 
-from git_acp.config import COLORS, QUESTIONARY_STYLE
+from git_acp.config import COLORS
 from git_acp.git import CommitType, GitError
-from git_acp.utils import GitConfig
+from git_acp.utils import GitConfig, questionary_style
+
+# Styled labels and templates with the color markup resolved once at import
+# time; only the dynamic parts are filled in per call.
+_ERROR_PANEL_TEMPLATE = (
+    f"[{COLORS['error']}]{{error_msg}}[/{COLORS['error']}]"
+    "\n\nSuggestion: {suggestion}"
+)
+_ADDING_FILE_LABEL = f"[{COLORS['warning']}]Adding file:[/{COLORS['warning']}]"
+_ADDING_FILES_LABEL = f"[{COLORS['warning']}]Adding files:[/{COLORS['warning']}]"
+_AUTO_APPLY_LABEL = (
+    f"[{COLORS['ai_message_header']}]Auto-applying suggested commit type:"
+    f"[/{COLORS['ai_message_header']}]"
+)
 
 
 class CancelledByUserError(GitError):
@@ -126,12 +143,11 @@ class RichQuestionaryInteraction:
 
         if len(changed_files) == 1:
             selected_file = next(iter(changed_files))
-            rprint(
-                f"[{COLORS['warning']}]Adding file:[/{COLORS['warning']}] "
-                f"{selected_file}"
-            )
+            rprint(f"{_ADDING_FILE_LABEL} {selected_file}")
             return f'"{selected_file}"' if " " in selected_file else selected_file
 
+        import questionary
+
         choices = []
         for file in sorted(list(changed_files)):
             choices.append({"name": file, "value": file})
@@ -140,7 +156,7 @@ class RichQuestionaryInteraction:
         selected = questionary.checkbox(
             "Select files to commit:",
             choices=choices,
-            style=questionary.Style(QUESTIONARY_STYLE),
+            style=questionary_style(),
             instruction=(
                 "(Use arrow keys to move, <space> to select, <enter> to confirm)"
             ),
@@ -152,18 +168,17 @@ class RichQuestionaryInteraction:
             raise GitError("No files selected.")
 
         # If "All files" is selected, stage and display all changed files.
-        if "All files" in selected:
-            selected_files = sorted(changed_files)
-            rprint(f"[{COLORS['warning']}]Adding files:[/{COLORS['warning']}]")
-            for file in selected_files:
-                rprint(f"  - {file}")
-            return " ".join(f'"{f}"' if " " in f else f for f in selected_files)
-
-        rprint(f"[{COLORS['warning']}]Adding files:[/{COLORS['warning']}]")
-        for file in selected:
-            rprint(f"  - {file}")
+        selected_files = sorted(changed_files) if "All files" in selected else selected
+
+        # Render the whole listing in one print instead of one per file.
+        rprint(
+            "\n".join([
+                _ADDING_FILES_LABEL,
+                *(f"  - {file}" for file in selected_files),
+            ])
+        )
 
-        return " ".join(f'"{f}"' if " " in f else f for f in selected)
+        return " ".join(f'"{f}"' if " " in f else f for f in selected_files)
 
     def select_commit_type(
         self, suggested_type: CommitType, config: GitConfig, commit_message: str
@@ -184,11 +199,7 @@ class RichQuestionaryInteraction:
         """
         # Auto-select if skip_confirmation
         if config.skip_confirmation:
-            header = COLORS["ai_message_header"]
-            self.print_message(
-                f"[{header}]Auto-applying suggested commit type:[/{header}] "
-                f"{suggested_type.value}"
-            )
+            self.print_message(f"{_AUTO_APPLY_LABEL} {suggested_type.value}")
             return suggested_type
 
         if commit_message.strip():
@@ -200,6 +211,8 @@ class RichQuestionaryInteraction:
                 )
             )
 
+        import questionary
+
         commit_type_choices: list[questionary.Choice] = []
         for commit_type in CommitType:
             name = (
@@ -209,7 +222,7 @@ class RichQuestionaryInteraction:
             )
             choice = questionary.Choice(
                 title=name,
-                value=commit_type.value,
+                value=commit_type,
                 checked=False,
             )
             if commit_type == suggested_type:
@@ -217,7 +230,7 @@ class RichQuestionaryInteraction:
             else:
                 commit_type_choices.append(choice)
 
-        def validate_single(selected: list[str]) -> str | bool:
+        def validate_single(selected: Sized) -> str | bool:
             if len(selected) != 1:
                 return "Please select exactly one commit type"
             return True
@@ -225,7 +238,7 @@ class RichQuestionaryInteraction:
         selected_types = questionary.checkbox(
             "Select commit type (space to select, enter to confirm):",
             choices=commit_type_choices,
-            style=questionary.Style(QUESTIONARY_STYLE),
+            style=questionary_style(),
             instruction=" (suggested type marked)",
             validate=validate_single,
         ).ask()
@@ -235,7 +248,8 @@ class RichQuestionaryInteraction:
         elif not selected_types or len(selected_types) != 1:
             raise GitError("No commit type selected.")
 
-        return CommitType.from_str(selected_types[0])
+        # Choices carry the enum member itself, so no reverse lookup is needed.
+        return cast(CommitType, selected_types[0])
 
     def confirm(self, message: str) -> bool:
         """Ask user for confirmation using Rich Confirm.
@@ -264,8 +278,10 @@ class RichQuestionaryInteraction:
             suggestion: A suggestion for resolving the error.
             title: The panel title.
         """
-        err = COLORS["error"]
-        content = f"[{err}]{error_msg}[/{err}]\n\nSuggestion: {suggestion}"
+        content = _ERROR_PANEL_TEMPLATE.format_map({
+            "error_msg": error_msg,
+            "suggestion": suggestion,
+        })
         rprint(Panel(content, title=title, border_style="red"))
 
     def print_panel(self, content: str, title: str, style: str) -> None:
@@ -287,11 +303,13 @@ class RichQuestionaryInteraction:
         Raises:
             CancelledByUserError: If the prompt is cancelled.
         """
+        import questionary
+
         message = cast(
             str | None,
             questionary.text(
                 "Enter commit message:",
-                style=questionary.Style(QUESTIONARY_STYLE),
+                style=questionary_style(),
             ).ask(),
         )
         if message is None:
@@ -6,7 +6,9 @@ workflow using injected dependencies for user interaction.
 
 from __future__ import annotations
 
+import heapq
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import replace
 from typing import TYPE_CHECKING, Final, Literal, cast
 
@@ -14,17 +16,21 @@ from git_acp.ai import generate_commit_message
 from git_acp.cli.interaction import CancelledByUserError
 from git_acp.config import COLORS
 from git_acp.git import (
+    ChangeSignals,
     CommitType,
     GitError,
     classify_commit_type,
+    collect_change_signals,
     get_changed_files,
     get_current_branch,
     git_add,
     git_commit,
     git_push,
+    has_staged_changes,
     strip_conventional_prefix,
     unstage_files,
 )
+from git_acp.utils import call_with_deferred_debug, flush_debug_output
 from git_acp.utils.file_filter import filter_files_by_scope
 
 if TYPE_CHECKING:
@@ -37,6 +43,46 @@ CANCELLED: Final[Literal["cancelled"]] = "cancelled"
 StepResult = bool | Literal["cancelled"]
 CommitTypeResult = CommitType | None | Literal["cancelled"]
 
+# Longest "Adding files:" listing printed for -a; the rest are summarized.
+_MAX_FILES_PREVIEW: Final[int] = 50
+
+# Suggestion texts shared by several error paths, built once at import time.
+_RETRY_MESSAGE_SUGGESTION: Final[str] = "Please specify a message with -m or try again."
+_MISSING_MESSAGE_SUGGESTION: Final[str] = (
+    "Please specify a message with -m or use --ollama."
+)
+_VALID_COMMIT_TYPES_SUGGESTION: Final[str] = (
+    f"Use: {', '.join(ct.name.lower() for ct in CommitType)}."
+)
+
+
+# Rich-markup status lines; COLORS is resolved at import, so build them once.
+_ANALYZING_COMMIT_TYPE_MESSAGE: Final[str] = (
+    f"[{COLORS['bold']}]🤖 Analyzing changes to suggest commit type..."
+    f"[/{COLORS['bold']}]"
+)
+_USING_COMMIT_TYPE_PREFIX: Final[str] = (
+    f"[{COLORS['success']}]✓ Using specified commit type: "
+)
+_SUCCESS_CLOSE: Final[str] = f"[/{COLORS['success']}]"
+_COMMIT_TYPE_SELECTED_MESSAGE: Final[str] = (
+    f"[{COLORS['success']}]✓ Commit type selected successfully{_SUCCESS_CLOSE}"
+)
+_COMMIT_MESSAGE_HEADER: Final[str] = (
+    f"[{COLORS['ai_message_header']}]Commit Message:[/{COLORS['ai_message_header']}]\n"
+)
+_AUTO_COMMIT_HEADER: Final[str] = (
+    f"[{COLORS['ai_message_header']}]Auto-committing with message:"
+    f"[/{COLORS['ai_message_header']}]\n"
+)
+_DRY_RUN_BANNER: Final[str] = (
+    f"[{COLORS['status']}]🔍 DRY RUN MODE - No changes will be committed"
+    f"[/{COLORS['status']}]"
+)
+_DRY_RUN_COMMIT_HEADER: Final[str] = (
+    f"[{COLORS['success']}]Would commit with message:{_SUCCESS_CLOSE}\n"
+)
+
 
 class GitWorkflow:
     """Orchestrates the git add-commit-push workflow.
@@ -70,6 +116,10 @@ class GitWorkflow:
         self._files_from_cli = files_from_cli
         self.raw_add_patterns = raw_add_patterns
         self._commit_type_override = commit_type_override
+        self._branch_future: Future[str] | None = None
+        self._change_signals_future: Future[ChangeSignals] | None = None
+        self._change_signals_debug: list[str] = []
+        self._working_tree_files: set[str] | None = None
 
     def run(self) -> int:
         """Execute the git-acp workflow.
@@ -78,6 +128,8 @@ class GitWorkflow:
             Exit code (0 for success, non-zero for failure).
         """
         try:
+            self._prefetch_branch()
+
             # Handle interactive file selection if needed
             file_selection = self._handle_file_selection()
             if file_selection == CANCELLED:
@@ -133,7 +185,7 @@ class GitWorkflow:
             return 0
 
         except Exception as e:
-            unstage_files()
+            self._unstage_files()
             self.interaction.print_error(
                 f"An unexpected error occurred:\n{e}",
                 "Please report this issue if it persists.",
@@ -141,6 +193,82 @@ class GitWorkflow:
             )
             return 1
 
+    def _prefetch_branch(self) -> None:
+        """Start resolving the current branch in the background.
+
+        Branch detection is an independent read, so it overlaps with file
+        selection (a ``git status`` plus any interactive prompt) instead of
+        running after it. :meth:`_handle_branch_detection` collects the result.
+        """
+        if self.config.branch or self.config.dry_run:
+            return
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._branch_future = executor.submit(get_current_branch)
+        # Lets the submitted lookup finish without keeping the pool around.
+        executor.shutdown(wait=False)
+
+    def _prefetch_change_signals(self) -> None:
+        """Start reading the classifier's git inputs in the background.
+
+        Called right before AI message generation: the diff, numstat and
+        changed-file reads do not depend on the message, so they run while
+        the model responds instead of after it. Their verbose output is held
+        back until :meth:`_prefetched_change_signals` collects the result, so
+        it does not interleave with the context and AI progress output.
+        """
+        if self._commit_type_override:
+            return
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._change_signals_future = executor.submit(
+            call_with_deferred_debug,
+            self._change_signals_debug,
+            collect_change_signals,
+            self.config,
+        )
+        executor.shutdown(wait=False)
+
+    def _prefetched_change_signals(self) -> ChangeSignals | None:
+        """Return the prefetched classifier inputs, if any were gathered.
+
+        Returns:
+            The prefetched signals, or None so classification reads them itself.
+        """
+        if self._change_signals_future is None:
+            return None
+        wait((self._change_signals_future,))
+        flush_debug_output(self._change_signals_debug)
+        try:
+            return self._change_signals_future.result()
+        except Exception:
+            # Let classification re-read and report the failure itself.
+            return None
+
+    def _unstage_files(self) -> None:
+        """Reset the staging area on cancel or failure.
+
+        Dry-run never stages anything (``git_add`` returns early), so there is
+        nothing to undo and the ``git reset`` would only discard whatever the
+        user had staged before running the preview.
+        """
+        if self.config.dry_run:
+            return
+        unstage_files()
+
+    def _get_working_tree_files(self) -> set[str]:
+        """Return the changed files in the working tree, cached per run.
+
+        The file selection, the ``-a`` preview and the dry-run scope check all
+        ask the same ``git status`` question; only the first one runs git.
+        The cache is dropped once :func:`git_add` has modified the index, and
+        a failed read is not cached.
+
+        Returns:
+            Set of changed file paths.
+        """
+        if self._working_tree_files is None:
+            self._working_tree_files = get_changed_files(self.config)
+        return self._working_tree_files
+
     def _handle_file_selection(self) -> StepResult:
         """Handle file selection phase.
 
@@ -157,7 +285,7 @@ class GitWorkflow:
 
         # Interactive file selection
         try:
-            changed_files = get_changed_files(self.config)
+            changed_files = self._get_working_tree_files()
             changed_files = filter_files_by_scope(changed_files, self.raw_add_patterns)
             if not changed_files:
                 if self.config.skip_confirmation:
@@ -176,7 +304,7 @@ class GitWorkflow:
             return True
 
         except CancelledByUserError:
-            unstage_files()
+            self._unstage_files()
             self.interaction.print_panel(
                 "Operation cancelled by user.",
                 "Cancelled",
@@ -194,14 +322,22 @@ class GitWorkflow:
     def _handle_branch_detection(self) -> bool:
         """Detect current branch if not specified.
 
+        The branch is only needed for pushing, so detection is skipped in
+        dry-run mode.
+
         Returns:
-            True if branch is set, False on error.
+            True if branch is set (or not needed), False on error.
         """
-        if self.config.branch:
+        if self.config.branch or self.config.dry_run:
             return True
 
         try:
-            self.config = replace(self.config, branch=get_current_branch())
+            branch = (
+                self._branch_future.result()
+                if self._branch_future is not None
+                else get_current_branch()
+            )
+            self.config = replace(self.config, branch=branch)
             return True
         except GitError as e:
             self.interaction.print_error(
@@ -222,7 +358,7 @@ class GitWorkflow:
             # "All files" UX by listing the files being staged.
             if self._files_from_cli:
                 try:
-                    changed_files = get_changed_files(self.config)
+                    changed_files = self._get_working_tree_files()
                 except GitError:
                     changed_files = set()
 
@@ -238,11 +374,11 @@ class GitWorkflow:
                     )
 
                     if files_to_list:
-                        self.interaction.print_message("Adding files:")
-                        for file in sorted(files_to_list):
-                            self.interaction.print_message(f"  - {file}")
+                        self._print_files_preview(files_to_list)
 
             git_add(self.config.files, self.config)
+            if not self.config.dry_run:
+                self._working_tree_files = None
             return True
         except GitError as e:
             self.interaction.print_error(
@@ -252,6 +388,24 @@ class GitWorkflow:
             )
             return False
 
+    def _print_files_preview(self, files: set[str]) -> None:
+        """List the files being staged, capped at ``_MAX_FILES_PREVIEW``.
+
+        Only the alphabetically first paths are needed, so a bounded heap
+        selection replaces sorting the whole set. The listing is rendered in
+        a single print instead of one per file.
+
+        Args:
+            files: Files selected by the ``-a`` scope (non-empty).
+        """
+        listing = "Adding files:\n  - " + "\n  - ".join(
+            heapq.nsmallest(_MAX_FILES_PREVIEW, files)
+        )
+        hidden = len(files) - _MAX_FILES_PREVIEW
+        if hidden > 0:
+            listing += f"\n  … and {hidden} more files"
+        self.interaction.print_message(listing)
+
     def _check_staged_files(self) -> bool:
         """Check if any files were actually staged.
 
@@ -262,7 +416,7 @@ class GitWorkflow:
             True if files are staged, False if nothing was staged.
         """
         if self.config.dry_run:
-            changed_files = get_changed_files(self.config, staged_only=False)
+            changed_files = self._get_working_tree_files()
             scoped_files = filter_files_by_scope(changed_files, self.raw_add_patterns)
             if not scoped_files:
                 msg = (
@@ -278,8 +432,7 @@ class GitWorkflow:
                 return False
             return True
 
-        staged_files = get_changed_files(self.config, staged_only=True)
-        if not staged_files:
+        if not has_staged_changes(self.config):
             msg = (
                 f"No actual changes were found in the files/patterns "
                 f"specified by -a (resolved to: '{self.config.files}'). "
@@ -296,6 +449,7 @@ class GitWorkflow:
             True if message is ready, False on error.
         """
         if self.config.use_ollama:
+            self._prefetch_change_signals()
             try:
                 self.config = replace(
                     self.config,
@@ -310,12 +464,12 @@ class GitWorkflow:
                 if not self.interaction.confirm(
                     "Would you like to continue with a manual commit message?"
                 ):
-                    unstage_files()
+                    self._unstage_files()
                     return CANCELLED
                 try:
                     manual_message = self._prompt_manual_message()
                 except CancelledByUserError:
-                    unstage_files()
+                    self._unstage_files()
                     self.interaction.print_panel(
                         "Operation cancelled by user.",
                         "Cancelled",
@@ -323,18 +477,18 @@ class GitWorkflow:
                     )
                     return CANCELLED
                 except GitError as prompt_error:
-                    unstage_files()
+                    self._unstage_files()
                     self.interaction.print_error(
                         f"Error reading commit message:\n{prompt_error}",
-                        "Please specify a message with -m or try again.",
+                        _RETRY_MESSAGE_SUGGESTION,
                         "Commit Message Failed",
                     )
                     return False
                 if not manual_message:
-                    unstage_files()
+                    self._unstage_files()
                     self.interaction.print_error(
                         "No commit message provided.",
-                        "Please specify a message with -m or use --ollama.",
+                        _MISSING_MESSAGE_SUGGESTION,
                         "Missing Message",
                     )
                     return False
@@ -345,7 +499,7 @@ class GitWorkflow:
             try:
                 manual_message = self._prompt_manual_message()
             except CancelledByUserError:
-                unstage_files()
+                self._unstage_files()
                 self.interaction.print_panel(
                     "Operation cancelled by user.",
                     "Cancelled",
@@ -353,20 +507,20 @@ class GitWorkflow:
                 )
                 return CANCELLED
             except GitError as e:
-                unstage_files()
+                self._unstage_files()
                 self.interaction.print_error(
                     f"Error reading commit message:\n{e}",
-                    "Please specify a message with -m or try again.",
+                    _RETRY_MESSAGE_SUGGESTION,
                     "Commit Message Failed",
                 )
                 return False
             if manual_message:
                 self.config = replace(self.config, message=manual_message)
             else:
-                unstage_files()
+                self._unstage_files()
                 self.interaction.print_error(
                     "No commit message provided.",
-                    "Please specify a message with -m or use --ollama.",
+                    _MISSING_MESSAGE_SUGGESTION,
                     "Missing Message",
                 )
                 return False
@@ -392,25 +546,19 @@ class GitWorkflow:
         Returns:
             Selected commit type, or None on error.
         """
-        bold = COLORS["bold"]
-        success = COLORS["success"]
-
         # Use override if provided via -t flag
         if self._commit_type_override:
             try:
                 selected_type = CommitType.from_str(self._commit_type_override)
+                self.interaction.print_message(_ANALYZING_COMMIT_TYPE_MESSAGE)
                 self.interaction.print_message(
-                    f"[{bold}]🤖 Analyzing changes to suggest commit type...[/{bold}]"
-                )
-                self.interaction.print_message(
-                    f"[{success}]✓ Using specified commit type: "
-                    f"{selected_type.value}[/{success}]"
+                    _USING_COMMIT_TYPE_PREFIX + selected_type.value + _SUCCESS_CLOSE
                 )
                 return selected_type
             except GitError as e:
                 self.interaction.print_error(
                     f"Invalid commit type specified:\n{e}",
-                    "Use: feat, fix, docs, style, refactor, test, chore, revert.",
+                    _VALID_COMMIT_TYPES_SUGGESTION,
                     "Invalid Commit Type",
                 )
                 return None
@@ -418,7 +566,11 @@ class GitWorkflow:
         # Auto-classify commit type
         try:
             commit_message = self.config.message or ""
-            suggested_type = classify_commit_type(self.config, commit_message)
+            suggested_type = classify_commit_type(
+                self.config,
+                commit_message,
+                change_signals=self._prefetched_change_signals(),
+            )
         except GitError as e:
             self.interaction.print_error(
                 f"Error determining commit type:\n{e}",
@@ -427,17 +579,13 @@ class GitWorkflow:
             )
             return None
 
-        self.interaction.print_message(
-            f"[{bold}]🤖 Analyzing changes to suggest commit type...[/{bold}]"
-        )
+        self.interaction.print_message(_ANALYZING_COMMIT_TYPE_MESSAGE)
 
         try:
             selected_type = self.interaction.select_commit_type(
                 suggested_type, self.config, commit_message
             )
-            self.interaction.print_message(
-                f"[{success}]✓ Commit type selected successfully[/{success}]"
-            )
+            self.interaction.print_message(_COMMIT_TYPE_SELECTED_MESSAGE)
             return selected_type
         except CancelledByUserError:
             self.interaction.print_panel(
@@ -445,7 +593,7 @@ class GitWorkflow:
                 "Cancelled",
                 "yellow",
             )
-            unstage_files()
+            self._unstage_files()
             return CANCELLED
         except GitError as e:
             self.interaction.print_error(
@@ -465,9 +613,8 @@ class GitWorkflow:
             Formatted commit message.
         """
         message = self.config.message or ""
-        lines = message.split("\n")
-        title = strip_conventional_prefix(lines[0])
-        description = "\n".join(lines[1:])
+        first_line, _, description = message.partition("\n")
+        title = strip_conventional_prefix(first_line)
         return f"{commit_type.value}: {title}\n\n{description}".strip()
 
     def _handle_confirmation(self, formatted_message: str) -> bool:
@@ -479,14 +626,10 @@ class GitWorkflow:
         Returns:
             True to proceed, False to cancel.
         """
-        header = COLORS["ai_message_header"]
-
         if not self.config.skip_confirmation:
-            self.interaction.print_message(
-                f"[{header}]Commit Message:[/{header}]\n{formatted_message}"
-            )
+            self.interaction.print_message(_COMMIT_MESSAGE_HEADER + formatted_message)
             if not self.interaction.confirm("Do you want to proceed?"):
-                unstage_files()
+                self._unstage_files()
                 self.interaction.print_panel(
                     "Operation cancelled by user.",
                     "Cancelled",
@@ -497,10 +640,7 @@ class GitWorkflow:
             # Only show auto-commit message if not in dry-run mode
             # (dry-run will show its own message)
             if not self.config.dry_run:
-                self.interaction.print_message(
-                    f"[{header}]Auto-committing with message:[/{header}]\n"
-                    f"{formatted_message}"
-                )
+                self.interaction.print_message(_AUTO_COMMIT_HEADER + formatted_message)
 
         return True
 
@@ -553,27 +693,5 @@ class GitWorkflow:
         Args:
             formatted_message: The formatted commit message that would be used.
         """
-        status = COLORS["status"]
-        success = COLORS["success"]
-
-        self.interaction.print_message(
-            f"[{status}]🔍 DRY RUN MODE - No changes will be committed[/{status}]"
-        )
-        self.interaction.print_message(
-            f"[{success}]Would commit with message:[/{success}]\n{formatted_message}"
-        )
-
-        # Unstage files since we're not actually committing
-        try:
-            unstage_files()
-            self.interaction.print_message(
-                f"[{status}]Files have been unstaged (dry-run cleanup)[/{status}]"
-            )
-        except GitError:
-            # If unstaging fails, it's not critical for dry-run
-            if self.config.verbose:
-                message = (
-                    f"[{status}]Note: Could not unstage files "
-                    f"(dry-run cleanup)[/{status}]"
-                )
-                self.interaction.print_message(message)
+        self.interaction.print_message(_DRY_RUN_BANNER)
+        self.interaction.print_message(_DRY_RUN_COMMIT_HEADER + formatted_message)
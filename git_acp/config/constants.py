@@ -12,6 +12,8 @@ Categories:
     - Terminal: Terminal-specific configurations
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 from typing import Final
 
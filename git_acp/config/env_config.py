@@ -4,17 +4,21 @@ This module handles loading environment variables from the config file
 and provides fallback values from constants.
 """
 
+from __future__ import annotations
+
+import functools
 import os
 import sys
 from pathlib import Path
 from typing import Any
 
-from dotenv import load_dotenv
-
 
+@functools.cache
 def get_config_dir() -> Path:
     """Get the configuration directory path.
 
+    The home directory is resolved once per process.
+
     Returns:
         Path: The path to the configuration directory.
     """
@@ -27,8 +31,21 @@ def ensure_config_dir() -> None:
     config_dir.mkdir(parents=True, exist_ok=True)
 
 
+# Set once the config file has been looked for, so repeated calls within a
+# process do not stat and re-parse it.
+_env_loaded = False
+
+
 def load_env_config() -> None:
-    """Load environment variables from the config file."""
+    """Load environment variables from the config file.
+
+    Only the first call in a process touches the file system; later calls
+    return immediately.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+
     if os.getenv("GIT_ACP_ALLOW_TEST_ENV_LOAD") == "1":
         pass
     # Tests must be hermetic; do not read user-local configuration files.
@@ -38,9 +55,18 @@ def load_env_config() -> None:
     config_dir = get_config_dir()
     env_file = config_dir / ".env"
 
-    # Load from config dir if exists, otherwise use default values
+    # Load from config dir if exists, otherwise use default values. Most
+    # installs have no such file, so python-dotenv is only imported when
+    # there is something to parse.
     if env_file.exists():
+        from dotenv import load_dotenv
+
         load_dotenv(env_file)
+    _env_loaded = True
+
+
+# Spellings accepted as True when get_env casts to bool.
+_TRUTHY_VALUES: frozenset[str] = frozenset({"true", "1", "yes", "y"})
 
 
 def get_env(key: str, default: Any = None, type_cast: type | None = None) -> Any:
@@ -59,7 +85,7 @@ def get_env(key: str, default: Any = None, type_cast: type | None = None) -> Any
     if value is not None and type_cast is not None:
         try:
             if type_cast is bool:
-                return str(value).lower() in ("true", "1", "yes", "y")
+                return str(value).lower() in _TRUTHY_VALUES
             return type_cast(value)
         except (ValueError, TypeError):
             return default
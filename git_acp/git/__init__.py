@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from git_acp.git.classification import (
+    ChangeSignals,
     ClassificationResult,
     CommitType,
     FileCategory,
     classify_commit,
     classify_commit_type,
+    collect_change_signals,
     group_changed_files,
     strip_conventional_prefix,
 )
@@ -25,6 +27,8 @@ from git_acp.git.operations import (
     git_add,
     git_commit,
     git_push,
+    has_staged_changes,
+    run_git_check,
     run_git_command,
     setup_signal_handlers,
     unstage_files,
@@ -33,6 +37,7 @@ from git_acp.git.operations import (
 __all__ = [
     "GitError",
     "run_git_command",
+    "run_git_check",
     "get_current_branch",
     "git_add",
     "git_commit",
@@ -40,14 +45,17 @@ __all__ = [
     "get_changed_files",
     "unstage_files",
     "get_diff",
+    "has_staged_changes",
     "get_recent_commits",
     "find_related_commits",
     "analyze_commit_patterns",
+    "ChangeSignals",
     "ClassificationResult",
     "CommitType",
     "FileCategory",
     "classify_commit",
     "classify_commit_type",
+    "collect_change_signals",
     "classify_file_category",
     "categorize_changed_files",
     "group_changed_files",
@@ -14,9 +14,13 @@ Classification Priority:
     5. Default to CHORE - lowest priority
 """
 
+import functools
+import heapq
+import itertools
 import re
 import shlex
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -30,13 +34,21 @@ from git_acp.config import (
 from git_acp.git.diff import extract_added_lines, get_numstat
 from git_acp.git.file_classifier import (
     FileCategory,
-    _match_file_path_pattern,
+    _compile_path_patterns,
+    _matches_path_patterns,
+    _normalize_match_path,
     _normalize_path_separators,
     categorize_changed_files,
     is_file_excluded,
 )
 from git_acp.git.git_operations import GitError, get_changed_files, get_diff
-from git_acp.utils import OptionalConfig, debug_header, debug_item
+from git_acp.utils import (
+    OptionalConfig,
+    call_with_deferred_debug,
+    debug_header,
+    debug_item,
+    flush_debug_output,
+)
 from git_acp.utils.file_filter import filter_files_by_scope
 
 
@@ -104,6 +116,33 @@ class ClassificationResult:
     is_mixed: bool
 
 
+@dataclass(frozen=True)
+class ChangeSignals:
+    """Classifier inputs read from git that do not depend on the message.
+
+    Collecting these is the only I/O the classifier performs, so callers can
+    gather them ahead of time (e.g. while an AI message is being generated)
+    and pass them to :func:`classify_commit`.
+
+    Attributes:
+        changed_files: Changed paths, scoped to the user's file selection.
+        numstat: Line counts per file from ``git diff --numstat``.
+        diff_text: Raw diff for keyword matching, or None if unavailable.
+    """
+
+    changed_files: set[str]
+    numstat: dict[str, tuple[int, int]]
+    diff_text: str | None
+
+
+# FILE_PATH_PATTERNS with each commit type's patterns folded into one regex,
+# so a path is tested once per type rather than once per pattern.
+_FILE_PATH_TYPE_REGEXES: dict[str, re.Pattern[str]] = {
+    commit_type: _compile_path_patterns(patterns)
+    for commit_type, patterns in FILE_PATH_PATTERNS.items()
+}
+
+
 def get_changes(config: OptionalConfig = None) -> str:
     """Retrieve the staged or unstaged changes in the repository.
 
@@ -152,8 +191,8 @@ def group_changed_files(
 
     The grouping algorithm is designed to be pure and deterministic:
 
-    - Commit-type grouping comes first, using ``FILE_PATH_PATTERNS`` and the
-      existing ``_match_file_path_pattern()`` matcher.
+    - Commit-type grouping comes first, using ``FILE_PATH_PATTERNS`` with the
+      segment-aware semantics of ``_match_file_path_pattern()``.
     - Unmatched files fall back to grouping by a stable directory prefix
       (2-3 levels deep).
     - Unmatched root-level files (no directory) are grouped by file extension.
@@ -197,12 +236,11 @@ def group_changed_files(
 
     for file_path in remaining:
         matched_type: str | None = None
+        normalized = _normalize_match_path(file_path)
         for commit_type in commit_type_priority:
-            for pattern in FILE_PATH_PATTERNS.get(commit_type, []):
-                if _match_file_path_pattern(file_path, pattern):
-                    matched_type = commit_type
-                    break
-            if matched_type is not None:
+            compiled = _FILE_PATH_TYPE_REGEXES.get(commit_type)
+            if compiled is not None and _matches_path_patterns(normalized, compiled):
+                matched_type = commit_type
                 break
 
         if matched_type is None:
@@ -263,32 +301,49 @@ def group_changed_files(
     def merge_non_type_groups(
         groups: list[tuple[str, str, list[str]]], *, max_groups: int
     ) -> list[tuple[str, str, list[str]]]:
-        merged = list(groups)
-        while len(merged) > max_groups:
-            best_pair: tuple[int, int] | None = None
-            best_score: tuple[bool, int, int, str, str] | None = None
-
-            for i in range(len(merged) - 1):
-                kind_i, key_i, files_i = merged[i]
-                seg_i = key_segments(kind_i, key_i)
-                for j in range(i + 1, len(merged)):
-                    kind_j, key_j, files_j = merged[j]
-                    seg_j = key_segments(kind_j, key_j)
-                    same_kind = kind_i == kind_j
-                    prefix = common_prefix_len(seg_i, seg_j)
-                    combined_size = len(files_i) + len(files_j)
-                    a_key, b_key = sorted((key_i, key_j))
-                    score = (not same_kind, -prefix, combined_size, a_key, b_key)
-                    if best_score is None or score < best_score:
-                        best_score = score
-                        best_pair = (i, j)
-
-            if best_pair is None or best_score is None:
-                break
+        # A pair's score depends only on its two groups, so every pair is
+        # scored once and kept in a heap; pairs whose groups have since been
+        # merged away are skipped when popped. Groups are ordered by
+        # (kind, key, creation id), the position order of the kind/key-sorted
+        # list, so equal scores resolve to the same pair a full scan would.
+        alive: dict[int, tuple[str, str, list[str]]] = dict(enumerate(groups))
+        next_id = len(groups)
+
+        def order_key(group_id: int) -> tuple[str, str, int]:
+            kind, key, _ = alive[group_id]
+            return (kind, key, group_id)
+
+        def candidate(
+            a: int, b: int
+        ) -> tuple[
+            tuple[bool, int, int, str, str],
+            tuple[str, str, int],
+            tuple[str, str, int],
+            int,
+            int,
+        ]:
+            if order_key(b) < order_key(a):
+                a, b = b, a
+            kind_a, key_a, files_a = alive[a]
+            kind_b, key_b, files_b = alive[b]
+            prefix = common_prefix_len(
+                key_segments(kind_a, key_a), key_segments(kind_b, key_b)
+            )
+            combined_size = len(files_a) + len(files_b)
+            low_key, high_key = sorted((key_a, key_b))
+            score = (kind_a != kind_b, -prefix, combined_size, low_key, high_key)
+            return (score, order_key(a), order_key(b), a, b)
+
+        heap = [candidate(a, b) for a, b in itertools.combinations(alive, 2)]
+        heapq.heapify(heap)
+
+        while len(alive) > max_groups and heap:
+            *_, i, j = heapq.heappop(heap)
+            if i not in alive or j not in alive:
+                continue
 
-            i, j = best_pair
-            kind_i, key_i, files_i = merged[i]
-            kind_j, key_j, files_j = merged[j]
+            kind_i, key_i, files_i = alive.pop(i)
+            kind_j, key_j, files_j = alive.pop(j)
 
             seg_i = key_segments(kind_i, key_i)
             seg_j = key_segments(kind_j, key_j)
@@ -303,15 +358,14 @@ def group_changed_files(
             else:
                 new_key = min(key_i, key_j)
 
-            new_files = sorted({*files_i, *files_j})
+            new_id = next_id
+            next_id += 1
+            alive[new_id] = (new_kind, new_key, sorted({*files_i, *files_j}))
+            for other in alive:
+                if other != new_id:
+                    heapq.heappush(heap, candidate(new_id, other))
 
-            for idx in sorted((i, j), reverse=True):
-                merged.pop(idx)
-            merged.append((new_kind, new_key, new_files))
-
-            merged.sort(key=lambda item: (item[0], item[1]))
-
-        return merged
+        return [alive[group_id] for group_id in sorted(alive, key=order_key)]
 
     if max_non_type_groups is not None and max_non_type_groups > 0:
         non_type_groups = merge_non_type_groups(
@@ -354,11 +408,10 @@ def _classify_by_file_paths(
     type_scores: dict[str, int] = {}
 
     for file_path in changed_files:
-        for commit_type, patterns in FILE_PATH_PATTERNS.items():
-            for pattern in patterns:
-                if _match_file_path_pattern(file_path, pattern):
-                    type_scores[commit_type] = type_scores.get(commit_type, 0) + 1
-                    break  # One match per file per type is enough
+        normalized = _normalize_match_path(file_path)
+        for commit_type, compiled in _FILE_PATH_TYPE_REGEXES.items():
+            if _matches_path_patterns(normalized, compiled):
+                type_scores[commit_type] = type_scores.get(commit_type, 0) + 1
 
     if not type_scores:
         return None
@@ -381,9 +434,37 @@ def _classify_by_file_paths(
     return None
 
 
+@functools.cache
+def _compile_keywords(
+    keywords: tuple[str, ...],
+) -> tuple[tuple[str, str, re.Pattern[str] | None], ...]:
+    """Prepare a keyword list for repeated matching.
+
+    Keyed on the keyword tuple, so each ``COMMIT_TYPE_PATTERNS`` entry is
+    lowered, classified and compiled once per process instead of on every
+    message or diff checked.
+
+    Args:
+        keywords: Keywords of one commit type.
+
+    Returns:
+        ``(keyword, lowered, boundary)`` triples, skipping empty keywords.
+        ``boundary`` is a word-boundary regex for plain words, else None.
+    """
+    compiled: list[tuple[str, str, re.Pattern[str] | None]] = []
+    for keyword in keywords:
+        key = keyword.lower()
+        if not key:
+            continue
+        is_plain_word = bool(re.fullmatch(r"[a-z0-9]+(?: [a-z0-9]+)*", key))
+        boundary = re.compile(rf"\b{re.escape(key)}\b") if is_plain_word else None
+        compiled.append((keyword, key, boundary))
+    return tuple(compiled)
+
+
 def _check_keyword_pattern(
     keywords: list[str],
-    text: str,
+    lowered: str,
     *,
     use_word_boundaries: bool,
     config,
@@ -392,25 +473,19 @@ def _check_keyword_pattern(
 
     Args:
         keywords: Keywords to search for.
-        text: Text to search in.
+        lowered: Lowercased text to search in. Callers fold the text once and
+            reuse it for every commit type's keyword list.
         use_word_boundaries: Whether to apply word boundary matching.
         config: GitConfig instance for verbose logging.
 
     Returns:
         List of matched keywords.
     """
-    lowered = text.lower()
     matches: list[str] = []
 
-    for keyword in keywords:
-        key = keyword.lower()
-        if not key:
-            continue
-
-        is_plain_word = bool(re.fullmatch(r"[a-z0-9]+(?: [a-z0-9]+)*", key))
-        if use_word_boundaries and is_plain_word:
-            pattern = rf"\b{re.escape(key)}\b"
-            if re.search(pattern, lowered):
+    for keyword, key, boundary in _compile_keywords(tuple(keywords)):
+        if use_word_boundaries and boundary is not None:
+            if boundary.search(lowered):
                 matches.append(keyword)
         elif key in lowered:
             matches.append(keyword)
@@ -420,6 +495,12 @@ def _check_keyword_pattern(
     return matches
 
 
+# Pieces of a conventional-commit prefix, e.g. ``feat(scope) ✨``.
+_PREFIX_TYPE_REGEX = re.compile(r"^(?P<type>[a-z]+)(?P<rest>.*)$", flags=re.IGNORECASE)
+_PREFIX_SCOPE_REGEX = re.compile(r"^\([^\)]+\)")
+_PREFIX_WORD_CHAR_REGEX = re.compile(r"[A-Za-z0-9_]")
+
+
 def _parse_message_prefix(commit_title: str, config) -> CommitType | None:
     """Parse a conventional commit type from the message prefix.
 
@@ -443,7 +524,7 @@ def _parse_message_prefix(commit_title: str, config) -> CommitType | None:
     if not prefix:
         return None
 
-    match = re.match(r"^(?P<type>[a-z]+)(?P<rest>.*)$", prefix, flags=re.IGNORECASE)
+    match = _PREFIX_TYPE_REGEX.match(prefix)
     if not match:
         return None
 
@@ -452,14 +533,14 @@ def _parse_message_prefix(commit_title: str, config) -> CommitType | None:
 
     # Strip optional (scope)
     if rest.startswith("("):
-        scope_match = re.match(r"^\([^\)]+\)", rest)
+        scope_match = _PREFIX_SCOPE_REGEX.match(rest)
         if not scope_match:
             return None
         rest = rest[scope_match.end() :].strip()
 
     # Remaining characters (if any) must be non-alphanumeric. This prevents
     # false positives like "feat update: ...".
-    if rest and re.search(r"[A-Za-z0-9_]", rest):
+    if rest and _PREFIX_WORD_CHAR_REGEX.search(rest):
         return None
 
     try:
@@ -475,6 +556,31 @@ def _parse_message_prefix(commit_title: str, config) -> CommitType | None:
     return parsed_type
 
 
+@functools.cache
+def _conventional_prefix_pattern() -> re.Pattern[str]:
+    """Build the conventional-prefix regex once per process.
+
+    The pattern depends only on the :class:`CommitType` members, which are
+    fixed at import time, so it is compiled lazily and reused.
+
+    Returns:
+        Compiled pattern capturing the ``breaking`` marker and the ``body``.
+    """
+    commit_type_pattern = "|".join(
+        commit_type.name.lower() for commit_type in CommitType
+    )
+    _emojis = {
+        part for ct in CommitType for part in ct.value.split() if not part.isascii()
+    }
+    emoji_pattern = "|".join(re.escape(e) for e in sorted(_emojis))
+    return re.compile(
+        rf"^\s*(?:{emoji_pattern})?\s*(?:{commit_type_pattern})(?:\s+(?:{emoji_pattern}))?\s*"
+        rf"(?:\([^)]+\))?(?:\s+(?:{emoji_pattern}))?\s*"
+        r"(?P<breaking>!?):\s*(?P<body>.+)$",
+        flags=re.IGNORECASE,
+    )
+
+
 def strip_conventional_prefix(title: str) -> str:
     """Strip a conventional-commit prefix from a title when present.
 
@@ -494,20 +600,7 @@ def strip_conventional_prefix(title: str) -> str:
     if not title:
         return title
 
-    commit_type_pattern = "|".join(
-        commit_type.name.lower() for commit_type in CommitType
-    )
-    _emojis = {
-        part for ct in CommitType for part in ct.value.split() if not part.isascii()
-    }
-    emoji_pattern = "|".join(re.escape(e) for e in sorted(_emojis))
-    pattern = re.compile(
-        rf"^\s*(?:{emoji_pattern})?\s*(?:{commit_type_pattern})(?:\s+(?:{emoji_pattern}))?\s*"
-        rf"(?:\([^)]+\))?(?:\s+(?:{emoji_pattern}))?\s*"
-        r"(?P<breaking>!?):\s*(?P<body>.+)$",
-        flags=re.IGNORECASE,
-    )
-    match = pattern.match(title)
+    match = _conventional_prefix_pattern().match(title)
     if not match:
         return title
     return match.group("body").lstrip()
@@ -521,10 +614,82 @@ _KEYWORD_EXCLUDED_CATEGORIES: frozenset[FileCategory] = frozenset({
 })
 
 
+def _get_scoped_changed_files(config) -> set[str]:
+    """Return changed files, preferring staged ones, scoped to ``config.files``.
+
+    Args:
+        config: GitConfig instance.
+
+    Returns:
+        The changed file paths, or an empty set if git cannot list them.
+    """
+    try:
+        changed_files = get_changed_files(config, staged_only=True)
+        if not changed_files:
+            changed_files = get_changed_files(config, staged_only=False)
+        if (
+            changed_files
+            and isinstance(config.files, str)
+            and config.files
+            and config.files != "."
+        ):
+            changed_files = filter_files_by_scope(changed_files, config.files)
+    except GitError:
+        changed_files = set()
+    return changed_files
+
+
+def collect_change_signals(config) -> ChangeSignals:
+    """Read the message-independent classifier inputs from git.
+
+    Args:
+        config: GitConfig instance.
+
+    Returns:
+        ChangeSignals with the scoped changed files, numstat and diff text.
+    """
+    changed_files = _get_scoped_changed_files(config)
+
+    # The numstat and diff queries are independent git subprocesses, so the
+    # numstat runs in a worker while the diff is read on this thread. Its
+    # debug output is held back and printed when the result is collected.
+    numstat_debug: list[str] = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        numstat_future = executor.submit(
+            call_with_deferred_debug, numstat_debug, get_numstat, config
+        )
+
+        # Diff text for keyword matching
+        diff_text: str | None = None
+        try:
+            diff_text = get_changes(config)
+        except GitError:
+            pass
+
+        # Numstat (line impact)
+        wait((numstat_future,))
+        flush_debug_output(numstat_debug)
+        numstat: dict[str, tuple[int, int]] = {}
+        try:
+            numstat = numstat_future.result()
+        except GitError:
+            pass  # expected: no staged/unstaged changes
+        except Exception as err:
+            if config.verbose:
+                debug_item("Numstat unexpected error", str(err))
+
+    if config.verbose and numstat:
+        debug_item("Numstat files", str(len(numstat)))
+
+    return ChangeSignals(
+        changed_files=changed_files, numstat=numstat, diff_text=diff_text
+    )
+
+
 def _collect_signals(
     config,
     commit_message: str | None,
-    changed_files: set[str],
+    change_signals: ChangeSignals,
 ) -> dict:
     """Gather raw signals from all sources for the scoring classifier.
 
@@ -538,7 +703,7 @@ def _collect_signals(
     """
     prefix_type: CommitType | None = None
     commit_title = (commit_message or "").strip()
-    commit_title = commit_title.split("\n", maxsplit=1)[0].strip()
+    commit_title = commit_title.partition("\n")[0].strip()
     if commit_title:
         prefix_type = _parse_message_prefix(commit_title, config)
 
@@ -547,6 +712,7 @@ def _collect_signals(
         debug_item("Prefix type", prefix_type.name if prefix_type else "None")
 
     # File categories
+    changed_files = change_signals.changed_files
     file_categories = categorize_changed_files(changed_files) if changed_files else {}
 
     if config.verbose and file_categories:
@@ -555,42 +721,23 @@ def _collect_signals(
             ", ".join(f"{cat.name}({len(f)})" for cat, f in file_categories.items()),
         )
 
-    # Numstat (line impact)
-    numstat: dict[str, tuple[int, int]] = {}
-    try:
-        numstat = get_numstat(config)
-    except GitError:
-        pass  # expected: no staged/unstaged changes
-    except Exception as err:
-        if config.verbose:
-            debug_item("Numstat unexpected error", str(err))
-
-    if config.verbose and numstat:
-        debug_item("Numstat files", str(len(numstat)))
-
     # Message keyword hits
     message_keyword_hits: dict[str, list[str]] = {}
     if commit_message and commit_message.strip():
+        lowered_message = commit_message.lower()
         for type_name, keywords in COMMIT_TYPE_PATTERNS.items():
             matches = _check_keyword_pattern(
-                keywords, commit_message, use_word_boundaries=True, config=config
+                keywords, lowered_message, use_word_boundaries=True, config=config
             )
             if matches:
                 message_keyword_hits[type_name] = matches
 
-    # Diff text for keyword matching
-    diff_text: str | None = None
-    try:
-        diff_text = get_changes(config)
-    except GitError:
-        pass
-
     return {
         "prefix_type": prefix_type,
         "file_categories": file_categories,
-        "numstat": numstat,
+        "numstat": change_signals.numstat,
         "message_keyword_hits": message_keyword_hits,
-        "diff_text": diff_text,
+        "diff_text": change_signals.diff_text,
     }
 
 
@@ -691,7 +838,7 @@ def _score_commit_types(
         added_lines = extract_added_lines(diff_text, excluded_files)
         # Fall back to raw text when extract_added_lines returns nothing
         # (e.g. the input is not in unified diff format)
-        keyword_text = added_lines if added_lines else diff_text
+        keyword_text = (added_lines if added_lines else diff_text).lower()
 
         for type_name, keywords in COMMIT_TYPE_PATTERNS.items():
             matches = _check_keyword_pattern(
@@ -752,7 +899,12 @@ def _score_commit_types(
     return scores, confidence, is_mixed
 
 
-def classify_commit(config, commit_message: str | None = None) -> ClassificationResult:
+def classify_commit(
+    config,
+    commit_message: str | None = None,
+    *,
+    change_signals: ChangeSignals | None = None,
+) -> ClassificationResult:
     """Classify commit type using the weighted scoring system.
 
     Orchestrates the full flow:
@@ -764,6 +916,8 @@ def classify_commit(config, commit_message: str | None = None) -> Classification
     Args:
         config: GitConfig instance.
         commit_message: Optional commit message for keyword signals.
+        change_signals: Pre-collected git inputs from
+            :func:`collect_change_signals`. Collected here when omitted.
 
     Returns:
         ClassificationResult with commit_type, confidence, scores, is_mixed.
@@ -775,22 +929,9 @@ def classify_commit(config, commit_message: str | None = None) -> Classification
         if config.verbose:
             debug_header("Starting Commit Classification (Scoring)")
 
-        # Get changed files (with file-scoping to user selection)
-        try:
-            changed_files = get_changed_files(config, staged_only=True)
-            if not changed_files:
-                changed_files = get_changed_files(config, staged_only=False)
-            if (
-                changed_files
-                and isinstance(config.files, str)
-                and config.files
-                and config.files != "."
-            ):
-                changed_files = filter_files_by_scope(changed_files, config.files)
-        except GitError:
-            changed_files = set()
-
-        signals = _collect_signals(config, commit_message, changed_files)
+        if change_signals is None:
+            change_signals = collect_change_signals(config)
+        signals = _collect_signals(config, commit_message, change_signals)
 
         # Short-circuit: explicit prefix wins
         if signals["prefix_type"] is not None:
@@ -844,7 +985,12 @@ def classify_commit(config, commit_message: str | None = None) -> Classification
         ) from e
 
 
-def classify_commit_type(config, commit_message: str | None = None) -> CommitType:
+def classify_commit_type(
+    config,
+    commit_message: str | None = None,
+    *,
+    change_signals: ChangeSignals | None = None,
+) -> CommitType:
     """Classify the commit type based on file paths, message, and diff content.
 
     This is the backward-compatible API that delegates to the weighted
@@ -854,9 +1000,11 @@ def classify_commit_type(config, commit_message: str | None = None) -> CommitTyp
     Args:
         config: GitConfig instance containing configuration options.
         commit_message: The generated (and possibly edited) commit message.
+        change_signals: Optional pre-collected git inputs, see
+            :func:`collect_change_signals`.
 
     Returns:
         CommitType: The classified commit type.
     """
-    result = classify_commit(config, commit_message)
+    result = classify_commit(config, commit_message, change_signals=change_signals)
     return result.commit_type
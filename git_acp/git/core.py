@@ -12,16 +12,98 @@ class GitError(Exception):
 
 
 def run_git_command(
-    command: list[str], config: OptionalConfig = None
+    command: list[str],
+    config: OptionalConfig = None,
+    *,
+    read_only: bool = False,
+    stdin: str | None = None,
+    strip_output: bool = True,
 ) -> tuple[str, str]:
     """Execute a git command and return its output.
 
     Args:
         command: List of command arguments to execute.
         config: Optional configuration for verbose output.
+        read_only: Mark the command as pure introspection. Git is then run
+            with ``--no-optional-locks`` so that status/diff reads never take
+            ``index.lock`` to refresh the index opportunistically, and never
+            contend with a concurrent writer.
+        stdin: Text written to the command's standard input, e.g. for
+            ``--pathspec-from-file=-``.
+        strip_output: Strip surrounding whitespace from stdout. Pass False
+            for NUL-delimited (``-z``) output, whose first record may start
+            with a meaningful space.
 
     Returns:
         tuple[str, str]: Tuple of (stdout, stderr) from the command.
+    """
+    _, stdout, stderr = _execute_git_command(
+        _with_lock_flags(command, read_only),
+        config,
+        allowed_exit_codes=(0,),
+        stdin=stdin,
+        strip_output=strip_output,
+    )
+    return stdout, stderr
+
+
+def run_git_check(
+    command: list[str], config: OptionalConfig = None, *, read_only: bool = False
+) -> bool:
+    """Run a git predicate command and report whether it exited with 0.
+
+    Intended for commands such as ``git diff --quiet`` that answer a yes/no
+    question through their exit status (0 or 1) without producing output.
+
+    Args:
+        command: List of command arguments to execute.
+        config: Optional configuration for verbose output.
+        read_only: Run with ``--no-optional-locks``; see ``run_git_command``.
+
+    Returns:
+        True if the command exited with 0, False if it exited with 1.
+    """
+    returncode, _, _ = _execute_git_command(
+        _with_lock_flags(command, read_only), config, allowed_exit_codes=(0, 1)
+    )
+    return returncode == 0
+
+
+def _with_lock_flags(command: list[str], read_only: bool) -> list[str]:
+    """Insert ``--no-optional-locks`` into read-only git commands.
+
+    Args:
+        command: List of command arguments to execute.
+        read_only: Whether the command is pure introspection.
+
+    Returns:
+        The command to run.
+    """
+    if read_only and command[:1] == ["git"]:
+        return ["git", "--no-optional-locks", *command[1:]]
+    return command
+
+
+def _execute_git_command(
+    command: list[str],
+    config: OptionalConfig,
+    *,
+    allowed_exit_codes: tuple[int, ...],
+    stdin: str | None = None,
+    strip_output: bool = True,
+) -> tuple[int, str, str]:
+    """Run a git command and map failures onto GitError.
+
+    Args:
+        command: List of command arguments to execute.
+        config: Optional configuration for verbose output.
+        allowed_exit_codes: Exit codes that count as success.
+        stdin: Optional text to feed to the command's standard input.
+        strip_output: Whether to strip surrounding whitespace from stdout.
+
+    Returns:
+        tuple[int, str, str]: Exit code, stdout (stripped unless
+        ``strip_output`` is False) and stripped stderr.
 
     Raises:
         GitError: If the command fails or git is not available.
@@ -32,11 +114,15 @@ def run_git_command(
             debug_item("Command", " ".join(command))
 
         process = subprocess.Popen(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            command,
+            stdin=subprocess.PIPE if stdin is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
         )
-        stdout, stderr = process.communicate()
+        stdout, stderr = process.communicate(stdin)
 
-        if process.returncode != 0:
+        if process.returncode not in allowed_exit_codes:
             if config and config.verbose:
                 debug_header("Git Command Failed")
                 debug_item("Command", " ".join(command))
@@ -95,7 +181,9 @@ def run_git_command(
         if config and config.verbose and stdout.strip():
             debug_item("Command Output", stdout.strip())
 
-        return stdout.strip(), stderr.strip()
+        if strip_output:
+            stdout = stdout.strip()
+        return process.returncode, stdout, stderr.strip()
 
     except FileNotFoundError:
         if config and config.verbose:
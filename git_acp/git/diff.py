@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from git_acp.utils import DiffType, OptionalConfig, debug_header, debug_item
 
-from .core import GitError, run_git_command
+from .core import GitError, run_git_check, run_git_command
 from .file_classifier import is_file_excluded
 
 # Default line count assigned to binary files in numstat output
@@ -12,6 +14,28 @@ from .file_classifier import is_file_excluded
 _BINARY_LINE_COUNT: int = 10
 
 
+def _iter_status_paths(stdout: str) -> Iterator[str]:
+    """Yield the current path of each ``git status --porcelain -z`` record.
+
+    Records are ``XY PATH`` separated by NUL, so paths containing spaces or
+    non-ASCII characters arrive verbatim. A rename or copy is followed by an
+    extra record holding the original path, which is skipped.
+
+    Args:
+        stdout: Raw NUL-delimited status output.
+
+    Yields:
+        str: Path of each changed file as it exists in the working tree.
+    """
+    records = iter(stdout.split("\0"))
+    for record in records:
+        if len(record) < 4:
+            continue
+        if record[0] in "RC" or record[1] in "RC":
+            next(records, None)
+        yield record[3:]
+
+
 def get_changed_files(
     config: OptionalConfig = None, staged_only: bool = False
 ) -> set[str]:
@@ -30,35 +54,26 @@ def get_changed_files(
 
     if staged_only:
         stdout_staged_only, _ = run_git_command(
-            ["git", "diff", "--staged", "--name-only"], config
+            ["git", "diff", "--staged", "--name-only"], config, read_only=True
         )
         if config and config.verbose:
             debug_item("Raw git diff --staged --name-only output", stdout_staged_only)
         files = set(stdout_staged_only.splitlines())
     else:
+        # Unstripped: the first record's status may begin with a space.
         stdout_status, _ = run_git_command(
-            ["git", "status", "--porcelain", "-uall"], config
+            ["git", "status", "--porcelain", "-uall", "-z"],
+            config,
+            read_only=True,
+            strip_output=False,
         )
         if config and config.verbose:
-            debug_item("Raw git status --porcelain -uall output", stdout_status)
+            debug_item("Raw git status --porcelain -uall -z output", stdout_status)
 
-        def process_status_line(line: str) -> str | None:
-            if not line.strip():
-                return None
-            if config and config.verbose:
-                debug_item("Processing status line", line)
-            if " -> " in line:
-                path = line.split(" -> ")[-1].strip()
-            else:
-                path = line[2:].lstrip()
+        for path in _iter_status_paths(stdout_status):
             if config and config.verbose:
                 debug_item("Extracted path from status", path)
-            return path
-
-        for line in stdout_status.splitlines():
-            path = process_status_line(line)
-            if path:
-                files.add(path)
+            files.add(path)
 
     if files:
         excluded_files = {f for f in files if is_file_excluded(f)}
@@ -73,6 +88,23 @@ def get_changed_files(
     return files
 
 
+def has_staged_changes(config: OptionalConfig = None) -> bool:
+    """Check whether the index differs from ``HEAD``.
+
+    Uses ``git diff --cached --quiet``, which answers through its exit status
+    and stops at the first difference instead of listing every staged path.
+
+    Args:
+        config: Optional configuration for verbose output.
+
+    Returns:
+        bool: True if anything is staged.
+    """
+    return not run_git_check(
+        ["git", "diff", "--cached", "--quiet"], config, read_only=True
+    )
+
+
 def get_diff(
     diff_type: DiffType = "staged",
     config: OptionalConfig = None,
@@ -103,7 +135,7 @@ def get_diff(
             cmd.append("--")
             cmd.extend(files)
 
-        stdout, _ = run_git_command(cmd, config)
+        stdout, _ = run_git_command(cmd, config, read_only=True)
 
         if config and config.verbose:
             debug_item("Diff length", str(len(stdout)))
@@ -134,7 +166,7 @@ def get_numstat(config: OptionalConfig = None) -> dict[str, tuple[int, int]]:
             cmd.append(flag)
         cmd.append("--numstat")
         try:
-            out, _ = run_git_command(cmd, config)
+            out, _ = run_git_command(cmd, config, read_only=True)
             if out.strip():
                 stdout = out
                 break
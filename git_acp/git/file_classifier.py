@@ -8,8 +8,8 @@ phase of the scoring classifier.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from enum import Enum
-from pathlib import Path
 
 from git_acp.config import EXCLUDED_PATTERNS, FILE_CATEGORY_PATTERNS
 
@@ -33,8 +33,11 @@ class FileCategory(Enum):
     UNKNOWN = "unknown"
 
 
+_SEPARATOR_RUN_REGEX = re.compile(r"[\\/]+")
+
+
 def _normalize_path_separators(value: str) -> str:
-    return re.sub(r"[\\/]+", "/", value)
+    return _SEPARATOR_RUN_REGEX.sub("/", value)
 
 
 def _match_file_path_pattern(file_path: str, pattern: str) -> bool:
@@ -77,14 +80,125 @@ def _match_file_path_pattern(file_path: str, pattern: str) -> bool:
     return any(pattern_lower in seg for seg in file_segments)
 
 
+def _path_pattern_regex(pattern: str) -> str | None:
+    """Translate one path pattern into a regex with the matcher's semantics.
+
+    The regex is searched case-insensitively over the separator-normalized
+    path and agrees with :func:`_match_file_path_pattern`: a pattern without
+    ``/`` can never span two segments, so searching the joined path is the
+    same as testing each segment.
+
+    Args:
+        pattern: Pattern in the ``FILE_PATH_PATTERNS`` mini-language.
+
+    Returns:
+        The regex source, or ``None`` for a pattern that never matches.
+    """
+    pattern_lower = _normalize_path_separators(pattern).lower()
+    if not pattern_lower:
+        return None
+
+    if "/" in pattern_lower:
+        segments = [seg for seg in pattern_lower.strip("/").split("/") if seg]
+        if not segments:
+            return None
+        return f"(?:^|/){'/'.join(map(re.escape, segments))}(?:/|$)"
+
+    escaped = re.escape(pattern_lower)
+    if re.fullmatch(r"[a-z0-9_]+", pattern_lower):
+        return rf"\b{escaped}\b"
+    if pattern_lower.endswith("_"):
+        return f"(?:^|/){escaped}"
+    if pattern_lower.startswith("_"):
+        return f"{escaped}(?:/|$)"
+    return escaped
+
+
+# ``/.env$`` is an exact-basename match (``.env`` but not ``.env.example``)
+# rather than a segment pattern, and stays case-sensitive like the basename
+# comparison it replaces.
+_ENV_FILE_PATTERN = "/.env$"
+_ENV_FILE_REGEX = r"(?-i:(?:^|/)\.env$)"
+
+
+def _compile_path_patterns(
+    patterns: Iterable[str], *, exact_env_file: bool = False
+) -> re.Pattern[str]:
+    """Fold path patterns into one alternation searched per path.
+
+    Args:
+        patterns: Patterns in the ``FILE_PATH_PATTERNS`` mini-language.
+        exact_env_file: Treat the ``/.env$`` entry of ``EXCLUDED_PATTERNS`` as
+            an exact-basename match instead of a segment pattern.
+
+    Returns:
+        A pattern to run through :func:`_matches_path_patterns`.
+    """
+    alternatives = [
+        _ENV_FILE_REGEX
+        if exact_env_file and pattern == _ENV_FILE_PATTERN
+        else _path_pattern_regex(pattern)
+        for pattern in patterns
+    ]
+    combined = "|".join(alt for alt in alternatives if alt is not None)
+    return re.compile(combined or r"(?!)", flags=re.IGNORECASE)
+
+
+def _normalize_match_path(file_path: str) -> str:
+    """Normalize a path once for any number of compiled pattern searches.
+
+    Args:
+        file_path: Repository-relative file path.
+
+    Returns:
+        The path with ``/`` separators and no leading or trailing slash.
+    """
+    return _normalize_path_separators(file_path).strip("/")
+
+
+def _matches_path_patterns(normalized_path: str, compiled: re.Pattern[str]) -> bool:
+    """Check a normalized path against a compiled pattern group.
+
+    Args:
+        normalized_path: Output of :func:`_normalize_match_path`.
+        compiled: Output of :func:`_compile_path_patterns`.
+
+    Returns:
+        ``True`` if any pattern in the group matches, with the semantics of
+        :func:`_match_file_path_pattern`.
+    """
+    return bool(normalized_path) and compiled.search(normalized_path) is not None
+
+
+_EXCLUDED_REGEX = _compile_path_patterns(EXCLUDED_PATTERNS, exact_env_file=True)
+
+# Order matters: more specific categories first. STYLE is checked before
+# CONFIG (STYLE ⊂ CONFIG).
+_CATEGORY_ORDER = (
+    "DEPENDENCY",
+    "GENERATED",
+    "STYLE",
+    "CI",
+    "TEST",
+    "DOCS",
+    "BUILD",
+    "CONFIG",
+)
+_CATEGORY_REGEXES = tuple(
+    (FileCategory[name], _compile_path_patterns(FILE_CATEGORY_PATTERNS.get(name, [])))
+    for name in _CATEGORY_ORDER
+)
+
+
 def is_file_excluded(file_path: str) -> bool:
     """Check whether *file_path* matches any ``EXCLUDED_PATTERNS`` entry.
 
-    Uses :func:`_match_file_path_pattern` for consistent segment-aware
-    matching, the same matcher used by file-category and commit-type
-    classification. The ``/.env$`` pattern is special-cased because it
-    represents an exact-basename match (``.env`` but not
-    ``.env.example``) that cannot be expressed as a literal substring.
+    Matching is segment-aware, with the same semantics as
+    :func:`_match_file_path_pattern` (the matcher used by file-category and
+    commit-type classification), but every pattern is folded into a single
+    regex compiled at import so each path costs one ``search``. The
+    ``/.env$`` pattern is an exact-basename match (``.env`` but not
+    ``.env.example``).
 
     Args:
         file_path: Repository-relative file path to check.
@@ -92,14 +206,7 @@ def is_file_excluded(file_path: str) -> bool:
     Returns:
         ``True`` if the file path matches any exclusion pattern.
     """
-    for pattern in EXCLUDED_PATTERNS:
-        if pattern == "/.env$":
-            if Path(file_path).name == ".env":
-                return True
-            continue
-        if _match_file_path_pattern(file_path, pattern):
-            return True
-    return False
+    return _matches_path_patterns(_normalize_match_path(file_path), _EXCLUDED_REGEX)
 
 
 def classify_file_category(path: str) -> FileCategory:
@@ -120,23 +227,10 @@ def classify_file_category(path: str) -> FileCategory:
     Returns:
         The matching FileCategory, or PRODUCTION for unmatched files.
     """
-    # Order matters: more specific categories first.
-    category_order = [
-        "DEPENDENCY",
-        "GENERATED",
-        "STYLE",  # before CONFIG (STYLE ⊂ CONFIG)
-        "CI",
-        "TEST",
-        "DOCS",
-        "BUILD",
-        "CONFIG",
-    ]
-
-    for category_name in category_order:
-        patterns = FILE_CATEGORY_PATTERNS.get(category_name, [])
-        for pattern in patterns:
-            if _match_file_path_pattern(path, pattern):
-                return FileCategory[category_name]
+    normalized = _normalize_match_path(path)
+    for category, compiled in _CATEGORY_REGEXES:
+        if _matches_path_patterns(normalized, compiled):
+            return category
 
     return FileCategory.PRODUCTION
 
@@ -8,6 +8,7 @@ It also implements ``get_changed_files`` directly so that tests can patch the
 
 from git_acp.utils import OptionalConfig, debug_header, debug_item
 
+from .diff import _iter_status_paths
 from .file_classifier import is_file_excluded
 from .operations import (
     GitError,
@@ -53,35 +54,26 @@ def get_changed_files(
 
     if staged_only:
         stdout_staged_only, _ = run_git_command(
-            ["git", "diff", "--staged", "--name-only"], config
+            ["git", "diff", "--staged", "--name-only"], config, read_only=True
         )
         if config and config.verbose:
             debug_item("Raw git diff --staged --name-only output", stdout_staged_only)
         files = set(stdout_staged_only.splitlines())
     else:
+        # Unstripped: the first record's status may begin with a space.
         stdout_status, _ = run_git_command(
-            ["git", "status", "--porcelain", "-uall"], config
+            ["git", "status", "--porcelain", "-uall", "-z"],
+            config,
+            read_only=True,
+            strip_output=False,
         )
         if config and config.verbose:
-            debug_item("Raw git status --porcelain -uall output", stdout_status)
+            debug_item("Raw git status --porcelain -uall -z output", stdout_status)
 
-        def process_status_line(line: str) -> str | None:
-            if not line.strip():
-                return None
-            if config and config.verbose:
-                debug_item("Processing status line", line)
-            if " -> " in line:
-                path = line.split(" -> ")[-1].strip()
-            else:
-                path = line[2:].lstrip()
+        for path in _iter_status_paths(stdout_status):
             if config and config.verbose:
                 debug_item("Extracted path from status", path)
-            return path
-
-        for line in stdout_status.splitlines():
-            path = process_status_line(line)
-            if path:
-                files.add(path)
+            files.add(path)
 
     if files:
         excluded_files = {f for f in files if is_file_excluded(f)}
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from collections import Counter
 from collections.abc import Mapping, Sequence
 
@@ -11,6 +10,32 @@ from git_acp.utils import OptionalConfig, debug_header, debug_item, debug_json
 
 from .core import GitError, run_git_command
 
+# Control characters used to frame ``git log`` output so commit subjects and
+# author names can never be confused with the framing itself.
+_LOG_RECORD_SEP = "\x1e"
+_LOG_FIELD_SEP = "\x1f"
+_LOG_PRETTY_FORMAT = (
+    f"--pretty=format:{_LOG_RECORD_SEP}%h{_LOG_FIELD_SEP}%s"
+    f"{_LOG_FIELD_SEP}%an{_LOG_FIELD_SEP}%ad"
+)
+
+
+def _parse_commit_header(header: str) -> dict[str, str] | None:
+    """Parse one commit header written with ``_LOG_PRETTY_FORMAT``.
+
+    Args:
+        header: The header line of a record, without the record separator.
+
+    Returns:
+        Commit dictionary with hash, message, author and date, or None when
+        the line is not a well-formed header.
+    """
+    fields = header.split(_LOG_FIELD_SEP)
+    if len(fields) != 4:
+        return None
+    commit_hash, message, author, date = fields
+    return {"hash": commit_hash, "message": message, "author": author, "date": date}
+
 
 def get_recent_commits(
     num_commits: int = DEFAULT_NUM_RECENT_COMMITS, config: OptionalConfig = None
@@ -33,26 +58,16 @@ def get_recent_commits(
             debug_item("Number of commits", str(num_commits))
 
         stdout, _ = run_git_command(
-            [
-                "git",
-                "log",
-                f"-{num_commits}",
-                '--pretty=format:{"hash":"%h","message":"%s","author":"%an","date":"%ad"}',
-                "--date=short",
-            ],
+            ["git", "log", f"-{num_commits}", _LOG_PRETTY_FORMAT, "--date=short"],
             config,
+            read_only=True,
         )
 
-        if not stdout:
-            return []
-
         commits = []
-        for line in stdout.splitlines():
-            try:
-                commit = json.loads(line)
+        for record in stdout.split(_LOG_RECORD_SEP):
+            commit = _parse_commit_header(record.rstrip("\n"))
+            if commit is not None:
                 commits.append(commit)
-            except json.JSONDecodeError:
-                continue
 
         if config and config.verbose:
             debug_item("Found commits", str(len(commits)))
@@ -70,6 +85,10 @@ def find_related_commits(
 ) -> list[dict[str, str]]:
     """Find commits related to the current changes.
 
+    The candidate commits and the files each one touched are read with a
+    single ``git log --name-only`` call rather than one ``git show`` per
+    commit.
+
     Args:
         diff_content: The diff content to analyze for related files.
         num_commits: Maximum number of related commits to return.
@@ -81,49 +100,49 @@ def find_related_commits(
     Raises:
         GitError: If unable to find related commits.
     """
-    try:
-        all_commits = get_recent_commits(num_commits * 2, config)
-        related_commits: list[dict[str, str]] = []
-
-        current_files = set()
-        for line in diff_content.splitlines():
-            if line.startswith("+++ b/") or line.startswith("--- a/"):
-                file_path = line[6:]
-                if file_path != "/dev/null":
-                    current_files.add(file_path)
-
-        for commit in all_commits:
-            try:
-                stdout, _ = run_git_command(
-                    [
-                        "git",
-                        "show",
-                        "--name-only",
-                        "--pretty=format:",
-                        commit["hash"],
-                    ],
-                    config,
-                )
-
-                commit_files = set(stdout.splitlines())
-                if current_files & commit_files:
-                    related_commits.append(commit)
-                    if len(related_commits) >= num_commits:
-                        break
-
-            except GitError:
-                continue
+    current_files = set()
+    for line in diff_content.splitlines():
+        if line.startswith("+++ b/") or line.startswith("--- a/"):
+            file_path = line[6:]
+            if file_path != "/dev/null":
+                current_files.add(file_path)
 
-        if config and config.verbose:
-            debug_header("Related commits found:")
-            for commit in related_commits:
-                debug_json(commit)
-
-        return related_commits
+    if not current_files:
+        return []
 
+    try:
+        stdout, _ = run_git_command(
+            [
+                "git",
+                "log",
+                f"-{num_commits * 2}",
+                "--name-only",
+                _LOG_PRETTY_FORMAT,
+                "--date=short",
+            ],
+            config,
+            read_only=True,
+        )
     except GitError as e:
         raise GitError(f"Failed to find related commits: {str(e)}") from e
 
+    related_commits: list[dict[str, str]] = []
+    for record in stdout.split(_LOG_RECORD_SEP):
+        header, _, files = record.partition("\n")
+        commit = _parse_commit_header(header)
+        if commit is None or current_files.isdisjoint(files.splitlines()):
+            continue
+        related_commits.append(commit)
+        if len(related_commits) >= num_commits:
+            break
+
+    if config and config.verbose:
+        debug_header("Related commits found:")
+        for commit in related_commits:
+            debug_json(commit)
+
+    return related_commits
+
 
 def analyze_commit_patterns(
     commits: Sequence[Mapping[str, str | None]],
@@ -1,7 +1,7 @@
 """Re-exports for git operations subpackage."""
 
-from .core import GitError, run_git_command
-from .diff import get_changed_files, get_diff
+from .core import GitError, run_git_check, run_git_command
+from .diff import get_changed_files, get_diff, has_staged_changes
 from .history import analyze_commit_patterns, find_related_commits, get_recent_commits
 from .management import (
     create_branch,
@@ -23,6 +23,7 @@ from .staging import (
 __all__ = [
     "GitError",
     "run_git_command",
+    "run_git_check",
     "get_current_branch",
     "git_add",
     "git_commit",
@@ -30,6 +31,7 @@ __all__ = [
     "get_changed_files",
     "unstage_files",
     "get_diff",
+    "has_staged_changes",
     "get_recent_commits",
     "find_related_commits",
     "analyze_commit_patterns",
@@ -7,16 +7,12 @@ import signal
 import sys
 
 from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
 
 from git_acp.config import DEFAULT_REMOTE
 from git_acp.utils import OptionalConfig, debug_header, debug_item, status, success
 
 from .core import GitError, run_git_command
 
-console = Console()
-
 
 def get_current_branch(config: OptionalConfig = None) -> str:
     """Get the name of the current git branch.
@@ -34,7 +30,7 @@ def get_current_branch(config: OptionalConfig = None) -> str:
         if config and config.verbose:
             debug_header("Getting Current Branch")
         stdout, _ = run_git_command(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], config
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"], config, read_only=True
         )
         if not stdout:
             raise GitError(
@@ -51,6 +47,24 @@ def get_current_branch(config: OptionalConfig = None) -> str:
         raise GitError(msg) from e
 
 
+# Set once git rejects --pathspec-from-file (added in git 2.26), so later
+# adds in the same process go straight to the argument form.
+_stdin_pathspecs_unsupported = False
+
+
+def _rejects_stdin_pathspecs(error: GitError) -> bool:
+    """Tell whether *error* is git refusing ``--pathspec-from-file``.
+
+    Args:
+        error: The error raised for the ``git add`` call.
+
+    Returns:
+        True if git reported the option as unknown.
+    """
+    message = str(error).lower()
+    return "unknown option" in message and "pathspec-from-file" in message
+
+
 def git_add(files: str, config: OptionalConfig = None) -> None:
     """Add files to git staging area.
 
@@ -61,6 +75,8 @@ def git_add(files: str, config: OptionalConfig = None) -> None:
     Raises:
         GitError: If files cannot be added.
     """
+    global _stdin_pathspecs_unsupported
+    cmd: list[str] = ["git", "add"]
     try:
         if config and config.dry_run:
             if config.verbose:
@@ -76,16 +92,40 @@ def git_add(files: str, config: OptionalConfig = None) -> None:
             if files == ".":
                 if config and config.verbose:
                     debug_item("Adding all files", ".")
-                run_git_command(["git", "add", "."], config)
+                cmd = ["git", "add", "."]
+                run_git_command(cmd, config)
             else:
-                file_list = shlex.split(files)
+                # Overlapping selections (e.g. a glob plus one of its
+                # matches) would otherwise send the same pathspec twice.
+                file_list = list(dict.fromkeys(shlex.split(files)))
                 if config and config.verbose:
                     debug_item("Parsed file list", str(file_list))
-                for file in file_list:
+                if not _stdin_pathspecs_unsupported:
+                    # Paths go over stdin, NUL-separated: one process start
+                    # and one index.lock acquisition no matter how many
+                    # files, with no argv growth towards ARG_MAX and no
+                    # quoting concerns.
+                    cmd = [
+                        "git",
+                        "add",
+                        "--pathspec-from-file=-",
+                        "--pathspec-file-nul",
+                    ]
                     if config and config.verbose:
-                        debug_item("Adding file", file)
-                        debug_item("Git command", f"git add {file}")
-                    run_git_command(["git", "add", file], config)
+                        debug_item("Git command", shlex.join(cmd))
+                        debug_item("Pathspecs", str(len(file_list)))
+                    try:
+                        run_git_command(cmd, config, stdin="\0".join(file_list))
+                    except GitError as e:
+                        if not _rejects_stdin_pathspecs(e):
+                            raise
+                        _stdin_pathspecs_unsupported = True
+                if _stdin_pathspecs_unsupported:
+                    # git < 2.26: pass the paths as arguments instead.
+                    cmd = ["git", "add", "--", *file_list]
+                    if config and config.verbose:
+                        debug_item("Git command", shlex.join(cmd))
+                    run_git_command(cmd, config)
 
         success("Files added successfully")
     except GitError as e:
@@ -93,7 +133,7 @@ def git_add(files: str, config: OptionalConfig = None) -> None:
             debug_header("Git Add Failed")
             debug_item("Error", str(e))
             debug_item("Files", files)
-            debug_item("Command", "git add " + files)
+            debug_item("Command", shlex.join(cmd))
         raise GitError(f"Failed to add files to staging area: {str(e)}") from e
 
 
@@ -181,11 +221,22 @@ def unstage_files(config: OptionalConfig = None) -> None:
         raise GitError(f"Failed to unstage files: {str(e)}") from e
 
 
-def setup_signal_handlers() -> None:
-    """Set up signal handlers for graceful interruption of git operations."""
+def setup_signal_handlers(*, dry_run: bool = False) -> None:
+    """Set up signal handlers for graceful interruption of git operations.
+
+    Args:
+        dry_run: Whether this run is a dry run. Dry runs never stage
+            anything, so an interrupt leaves the index as the user had it
+            instead of resetting it.
+    """
 
     def signal_handler(signum, frame):
-        unstage_files()
+        # Only needed on interrupt, so keep the panel renderer off the
+        # import path of every git operation.
+        from rich.panel import Panel
+
+        if not dry_run:
+            unstage_files()
         rprint(
             Panel(
                 "Operation cancelled by user.", title="Cancelled", border_style="yellow"
@@ -1,10 +1,13 @@
 """Utility functions and types for git-acp."""
 
 from git_acp.utils.formatting import (
+    call_with_deferred_debug,
     debug_header,
     debug_item,
     debug_json,
     debug_preview,
+    flush_debug_output,
+    questionary_style,
     status,
     success,
     warning,
@@ -12,10 +15,13 @@ from git_acp.utils.formatting import (
 from git_acp.utils.types import DiffType, GitConfig, OptionalConfig, PromptType
 
 __all__ = [
+    "call_with_deferred_debug",
     "debug_header",
     "debug_item",
     "debug_json",
     "debug_preview",
+    "flush_debug_output",
+    "questionary_style",
     "status",
     "success",
     "warning",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 # Use Path.match for consistent glob semantics (including **/ handling).
 import shlex
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -15,50 +16,98 @@ def filter_files_by_scope(files: set[str], add_patterns: str | None) -> set[str]
         add_patterns: Raw -a patterns string (or None).
 
     Returns:
-        Filtered set of files within the provided scope patterns.
+        Filtered set of files within the provided scope patterns. When the
+        scope selects everything, ``files`` itself is returned rather than a
+        copy, so callers must treat the result as read-only.
     """
     if add_patterns is None:
-        return set(files)
+        return files
 
     stripped = add_patterns.strip()
     if stripped in {".", "./"}:
-        return set(files)
+        return files
 
     targets = shlex.split(add_patterns)
     if any(target in {".", "./"} for target in targets):
-        return set(files)
+        return files
     if not targets:
         return set()
 
+    literal_targets: set[str] = set()
+    glob_targets: list[tuple[str, list[str]]] = []
+    for target in targets:
+        normalized = _normalize_target(target)
+        if not normalized:
+            continue
+        literal_targets.add(normalized)
+        if "*" in normalized or "?" in normalized or "[" in normalized:
+            glob_targets.append((normalized, _glob_patterns(normalized)))
+
     filtered: set[str] = set()
     for path in files:
-        for target in targets:
-            if not target:
-                continue
-            normalized = target
-            if normalized.startswith("./"):
-                normalized = normalized[2:]
-            normalized = normalized.rstrip("/")
-            if not normalized:
+        if any(prefix in literal_targets for prefix in _path_prefixes(path)):
+            filtered.add(path)
+            continue
+        for normalized, patterns in glob_targets:
+            if (
+                "/" not in normalized
+                and "/" in path
+                and ("?" in normalized or "[" in normalized)
+            ):
                 continue
-            if path == normalized or path.startswith(f"{normalized}/"):
+            if any(Path(path).match(pattern) for pattern in patterns):
                 filtered.add(path)
                 break
-            if "*" in normalized or "?" in normalized or "[" in normalized:
-                if "/" not in normalized and "?" in normalized and "/" in path:
-                    continue
-                if "/" not in normalized and "[" in normalized and "/" in path:
-                    continue
-                if "/" in normalized:
-                    patterns = [normalized]
-                    if "**/" in normalized:
-                        patterns.append(normalized.replace("**/", ""))
-                elif "*" in normalized:
-                    patterns = [normalized, f"**/{normalized}"]
-                else:
-                    patterns = [normalized]
-                if any(Path(path).match(pattern) for pattern in patterns):
-                    filtered.add(path)
-                    break
 
     return filtered
+
+
+def _normalize_target(target: str) -> str:
+    """Strip a leading ``./`` and trailing slashes from a scope target.
+
+    Args:
+        target: Raw scope target token.
+
+    Returns:
+        Normalized target, or an empty string when nothing remains.
+    """
+    normalized = target.removeprefix("./")
+    return normalized.rstrip("/")
+
+
+def _glob_patterns(normalized: str) -> list[str]:
+    """Expand a glob target into the patterns matched with ``Path.match``.
+
+    Args:
+        normalized: Normalized target containing glob characters.
+
+    Returns:
+        Patterns to try against each path.
+    """
+    if "/" in normalized:
+        patterns = [normalized]
+        if "**/" in normalized:
+            patterns.append(normalized.replace("**/", ""))
+        return patterns
+    if "*" in normalized:
+        return [normalized, f"**/{normalized}"]
+    return [normalized]
+
+
+def _path_prefixes(path: str) -> Iterator[str]:
+    """Yield every directory prefix of ``path`` followed by the path itself.
+
+    A literal target selects a path when it equals one of these prefixes,
+    so membership checks replace a scan over every target per path.
+
+    Args:
+        path: Repository-relative file path.
+
+    Yields:
+        ``"a"``, ``"a/b"``, ... up to the full path.
+    """
+    index = path.find("/")
+    while index != -1:
+        yield path[:index]
+        index = path.find("/", index + 1)
+    yield path
@@ -4,17 +4,97 @@ This module provides functions for formatting and displaying output in the termi
 including debug information, success messages, warnings, and status updates.
 """
 
+from __future__ import annotations
+
+import functools
 import json
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from rich import print as rprint
 from rich.console import Console
 from rich.markup import escape
 from rich.status import Status
 
-from git_acp.config import COLORS, MAX_DEBUG_VALUE_CHARS, TERMINAL_WIDTH
+from git_acp.config import (
+    COLORS,
+    MAX_DEBUG_VALUE_CHARS,
+    QUESTIONARY_STYLE,
+    TERMINAL_WIDTH,
+)
+
+if TYPE_CHECKING:
+    from questionary import Style
 
 console = Console(width=TERMINAL_WIDTH)
 
+# COLORS is fixed once git_acp.config is imported, so the markup tags around
+# every message are rendered here once rather than on each call.
+_HEADER_OPEN = f"[{COLORS['debug_header']}]"
+_HEADER_CLOSE = f"[/{COLORS['debug_header']}]"
+_VALUE_OPEN = f"[{COLORS['debug_value']}]"
+_VALUE_CLOSE = f"[/{COLORS['debug_value']}]"
+_SUCCESS_TAG = f"[{COLORS['success']}]"
+_WARNING_TAG = f"[{COLORS['warning']}]"
+_STATUS_TAG = f"[{COLORS['status']}]"
+
+_T = TypeVar("_T")
+
+# Per-thread destination for debug lines; unset means print them directly.
+_debug_state = threading.local()
+
+
+def _emit_debug(markup: str) -> None:
+    """Print one debug line, or hold it if this thread is deferring output.
+
+    Args:
+        markup: The rich markup line to print.
+    """
+    buffer: list[str] | None = getattr(_debug_state, "buffer", None)
+    if buffer is None:
+        rprint(markup)
+    else:
+        buffer.append(markup)
+
+
+def call_with_deferred_debug(
+    lines: list[str], func: Callable[..., _T], /, *args: Any, **kwargs: Any
+) -> _T:
+    """Call *func*, collecting its debug output in *lines* instead of printing.
+
+    Meant to be submitted to a worker thread: the caller passes the result
+    list to :func:`flush_debug_output` once it collects the worker's result,
+    so verbose output appears in the order the results are used rather than
+    interleaved with the main thread's.
+
+    Args:
+        lines: List that receives the rendered debug lines.
+        func: The function to call.
+        *args: Positional arguments for *func*.
+        **kwargs: Keyword arguments for *func*.
+
+    Returns:
+        Whatever *func* returns.
+    """
+    previous = getattr(_debug_state, "buffer", None)
+    _debug_state.buffer = lines
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _debug_state.buffer = previous
+
+
+def flush_debug_output(lines: list[str]) -> None:
+    """Print debug lines held by :func:`call_with_deferred_debug` and clear them.
+
+    Args:
+        lines: The collected debug lines.
+    """
+    for markup in lines:
+        _emit_debug(markup)
+    lines.clear()
+
 
 def debug_header(message: str) -> None:
     """Print a debug header message with appropriate styling.
@@ -22,7 +102,7 @@ def debug_header(message: str) -> None:
     Args:
         message: The debug header message to display
     """
-    rprint(f"[{COLORS['debug_header']}]Debug - {message}[/{COLORS['debug_header']}]")
+    _emit_debug(f"{_HEADER_OPEN}Debug - {message}{_HEADER_CLOSE}")
 
 
 def debug_item(label: str, value: str | None = None) -> None:
@@ -44,12 +124,12 @@ def debug_item(label: str, value: str | None = None) -> None:
                 f"total {total_len}]"
             )
         safe_value = escape(value)
-        rprint(
-            f"[{COLORS['debug_header']}]  • {label}:[/{COLORS['debug_header']}] "
-            f"[{COLORS['debug_value']}]{safe_value}[/{COLORS['debug_value']}]"
+        _emit_debug(
+            f"{_HEADER_OPEN}  • {label}:{_HEADER_CLOSE} "
+            f"{_VALUE_OPEN}{safe_value}{_VALUE_CLOSE}"
         )
     else:
-        rprint(f"[{COLORS['debug_header']}]  • {label}[/{COLORS['debug_header']}]")
+        _emit_debug(f"{_HEADER_OPEN}  • {label}{_HEADER_CLOSE}")
 
 
 def debug_json(data: dict, indent: int = 4) -> None:
@@ -60,8 +140,7 @@ def debug_json(data: dict, indent: int = 4) -> None:
         indent: Number of spaces to use for indentation
     """
     json_data = json.dumps(data, indent=indent).replace("\\n", "\\n    ")
-    formatted = f"[{COLORS['debug_value']}]{json_data}[{COLORS['debug_value']}]"
-    rprint(formatted)
+    _emit_debug(f"{_VALUE_OPEN}{json_data}{_VALUE_OPEN}")
 
 
 def debug_preview(text: str, num_lines: int = 10) -> None:
@@ -71,12 +150,9 @@ def debug_preview(text: str, num_lines: int = 10) -> None:
         text: The text content to preview
         num_lines: Maximum number of lines to display
     """
-    preview = text.split("\n")[:num_lines]
-    rprint(
-        f"[{COLORS['debug_value']}]"
-        + "\n".join(preview)
-        + f"\n...[{COLORS['debug_value']}]"
-    )
+    # maxsplit stops splitting once the preview lines are found.
+    preview = "\n".join(text.split("\n", num_lines)[:num_lines])
+    _emit_debug(f"{_VALUE_OPEN}{preview}\n...{_VALUE_OPEN}")
 
 
 def success(message: str) -> None:
@@ -85,7 +161,7 @@ def success(message: str) -> None:
     Args:
         message: The success message to display
     """
-    rprint(f"[{COLORS['success']}]✓[{COLORS['success']}] {message}")
+    rprint(f"{_SUCCESS_TAG}✓{_SUCCESS_TAG} {message}")
 
 
 def warning(message: str) -> None:
@@ -94,7 +170,7 @@ def warning(message: str) -> None:
     Args:
         message: The warning message to display
     """
-    rprint(f"[{COLORS['warning']}]Warning: {message}[{COLORS['warning']}]")
+    rprint(f"{_WARNING_TAG}Warning: {message}{_WARNING_TAG}")
 
 
 def status(message: str) -> Status:
@@ -106,4 +182,19 @@ def status(message: str) -> Status:
     Returns:
         Console.status: A status context manager for use in with statements
     """
-    return console.status(f"[{COLORS['status']}]{message}")
+    return console.status(f"{_STATUS_TAG}{message}")
+
+
+@functools.cache
+def questionary_style() -> Style:
+    """Return the shared questionary prompt style.
+
+    The style rules are parsed once and reused by every prompt. questionary
+    is imported on first use so non-interactive runs never load it.
+
+    Returns:
+        The parsed ``QUESTIONARY_STYLE``.
+    """
+    from questionary import Style
+
+    return Style(QUESTIONARY_STYLE)
@@ -4,12 +4,16 @@ This module contains tests for the AI utilities used in commit message generatio
 including AI client initialization, context gathering, and message generation.
 """
 
+import json
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from git_acp.ai.ai_utils import (
+    _AI_CLIENTS,
     AIClient,
+    _estimate_context_tokens,
+    _iter_lines,
     _strip_meta_commentary,
     calculate_context_budget,
     create_structured_advanced_commit_message_prompt,
@@ -27,10 +31,22 @@ from git_acp.config import (
     DEFAULT_FALLBACK_BASE_URL,
 )
 from git_acp.git import GitError
-from git_acp.utils import GitConfig
+from git_acp.utils import GitConfig, debug_item
 
 
 # Test fixtures
+@pytest.fixture(autouse=True)
+def clear_ai_client_cache():
+    """Drop shared AI clients so each test sees its own patched AIClient.
+
+    Yields:
+        None: Control returns to the test.
+    """
+    _AI_CLIENTS.clear()
+    yield
+    _AI_CLIENTS.clear()
+
+
 @pytest.fixture
 def mock_config():
     """Create a mock GitConfig instance.
@@ -70,20 +86,15 @@ def mock_context():
 
 @pytest.fixture
 def mock_openai_response():
-    """Create a mock OpenAI API response.
+    """Create a mock streamed OpenAI API response.
 
     Returns:
-        A mock response object with choices.
+        A list of chunks whose deltas spell the commit message.
     """
-    mock_message = Mock()
-    mock_message.content = "feat: test commit message"
-
-    mock_choice = Mock()
-    mock_choice.message = mock_message
-
-    mock_response = Mock()
-    mock_response.choices = [mock_choice]
-    return mock_response
+    return [
+        Mock(choices=[Mock(delta=Mock(content=part))])
+        for part in ("feat: test ", "commit message")
+    ]
 
 
 # AIClient Tests
@@ -92,7 +103,7 @@ class TestAIClient:
 
     def test_init_success(self, mock_config):
         """Test successful AIClient initialization."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             client = AIClient(mock_config)
             assert client.config == mock_config
             mock_openai.assert_called_once_with(
@@ -103,20 +114,20 @@ class TestAIClient:
 
     def test_init_invalid_url(self, mock_config):
         """Test AIClient initialization with invalid URL."""
-        with patch("git_acp.ai.client.OpenAI", side_effect=ValueError("Invalid URL")):
+        with patch("openai.OpenAI", side_effect=ValueError("Invalid URL")):
             with pytest.raises(GitError, match="Invalid Ollama server URL"):
                 AIClient(mock_config)
 
     def test_init_connection_error(self, mock_config):
         """Test AIClient initialization with connection error."""
-        with patch("git_acp.ai.client.OpenAI", side_effect=ConnectionError()):
+        with patch("openai.OpenAI", side_effect=ConnectionError()):
             with pytest.raises(GitError, match="Could not connect to Ollama server"):
                 AIClient(mock_config)
 
     def test_init_fallback_url(self, mock_config):
         """Test AIClient uses fallback URL when primary fails."""
         with patch(
-            "git_acp.ai.client.OpenAI",
+            "openai.OpenAI",
             side_effect=[ConnectionError(), MagicMock()],
         ) as mock_openai:
             client = AIClient(mock_config)
@@ -129,7 +140,7 @@ class TestAIClient:
 
     def test_chat_completion_success(self, mock_config, mock_openai_response):
         """Test successful chat completion."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_client = Mock()
             mock_client.chat.completions.create.return_value = mock_openai_response
             mock_openai.return_value = mock_client
@@ -143,7 +154,7 @@ class TestAIClient:
 
     def test_chat_completion_timeout(self, mock_config):
         """Test chat completion timeout."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_client = Mock()
             mock_client.chat.completions.create.side_effect = TimeoutError()
             mock_openai.return_value = mock_client
@@ -179,11 +190,47 @@ def test_get_commit_context(mock_config):
 
 def test_get_commit_context_error(mock_config):
     """Test commit context gathering with error."""
-    with patch("git_acp.ai.ai_utils.get_diff", side_effect=GitError("Test error")):
+    with (
+        patch("git_acp.ai.ai_utils.get_diff", side_effect=GitError("Test error")),
+        patch("git_acp.ai.ai_utils.get_recent_commits", return_value=[]),
+    ):
+        with pytest.raises(GitError, match="Failed to gather commit context"):
+            get_commit_context(mock_config)
+
+
+def test_get_commit_context__history_error_propagates(mock_config):
+    """Surface a failed history read from the worker as a context error."""
+    with (
+        patch("git_acp.ai.ai_utils.get_diff", return_value="diff"),
+        patch("git_acp.ai.ai_utils.find_related_commits", return_value=[]),
+        patch(
+            "git_acp.ai.ai_utils.get_recent_commits",
+            side_effect=GitError("log failed"),
+        ),
+    ):
         with pytest.raises(GitError, match="Failed to gather commit context"):
             get_commit_context(mock_config)
 
 
+def test_get_commit_context__history_debug_follows_its_header(mock_config, capsys):
+    """Print the history worker's verbose lines under "Fetching commit history"."""
+
+    def recent_commits(num_commits, config):
+        debug_item("History worker", str(num_commits))
+        return []
+
+    mock_config.verbose = True
+    with (
+        patch("git_acp.ai.ai_utils.get_diff", return_value="diff"),
+        patch("git_acp.ai.ai_utils.find_related_commits", return_value=[]),
+        patch("git_acp.ai.ai_utils.get_recent_commits", side_effect=recent_commits),
+    ):
+        get_commit_context(mock_config)
+
+    out = capsys.readouterr().out
+    assert out.index("Fetching commit history") < out.index("History worker")
+
+
 # Prompt Creation Tests
 def test_create_advanced_prompt(mock_context, mock_config):
     """Test advanced commit message prompt creation."""
@@ -197,6 +244,37 @@ def test_create_advanced_prompt(mock_context, mock_config):
     assert "Do NOT include a commit type prefix" in prompt
 
 
+def test_create_advanced_prompt__lists_commit_messages_as_bullets(mock_config):
+    """Render recent and related messages as bullets, or (none) when empty."""
+    context = {
+        "commit_patterns": {"types": {}, "scopes": {}},
+        "recent_commits": [{"message": "feat: one"}, {"message": "fix: two\nbody"}],
+        "related_commits": [],
+        "staged_changes": "diff",
+    }
+
+    prompt = create_structured_advanced_commit_message_prompt(context, mock_config)
+
+    assert (
+        "- Recent commit patterns:\n  - feat: one\n  - fix: two\n    body\n" in prompt
+    )
+    assert "- Related work: (none)\n" in prompt
+
+
+def test_create_advanced_prompt__common_type_prefers_first_on_ties(mock_config):
+    """Pick the most frequent type, keeping the first one seen on a tie."""
+    context = {
+        "commit_patterns": {"types": {"fix": 2, "feat": 2, "docs": 1}, "scopes": {}},
+        "recent_commits": [],
+        "related_commits": [],
+        "staged_changes": "diff",
+    }
+
+    prompt = create_structured_advanced_commit_message_prompt(context, mock_config)
+
+    assert "- Most common commit type: `fix`" in prompt
+
+
 def test_create_simple_prompt(mock_context, mock_config):
     """Test simple commit message prompt creation."""
     prompt = create_structured_simple_commit_message_prompt(mock_context, mock_config)
@@ -351,6 +429,36 @@ class TestContextManagement:
         # Advanced mode should be less restrictive
         assert len(result["commit_patterns"]["types"]) <= 5
 
+    def test_estimate_context_tokens_matches_full_serialization(self):
+        """Measure the context exactly as json.dumps of the whole dict would."""
+        changes = 'diff --git a/x "quoted"\n\t+caf\u00e9 \\ line\n' * 50
+        context = {
+            "staged_changes": changes,
+            "recent_commits": [{"message": "feat: test"}],
+            "commit_patterns": {"types": {"feat": 1}, "scopes": {}},
+        }
+
+        encoded_len = len(json.dumps(changes))
+
+        assert _estimate_context_tokens(context, encoded_len) == estimate_tokens(
+            json.dumps(context, indent=2)
+        )
+
+    @pytest.mark.parametrize("text", ["", "a", "a\n", "\n\n", "a\nb\n\nc"])
+    def test_iter_lines_matches_str_split(self, text: str) -> None:
+        """Yield the same lines as splitting on newlines."""
+        assert list(_iter_lines(text)) == text.split("\n")
+
+    def test_truncate_context_for_window_reports_remaining_lines(self):
+        """Count the dropped lines without materializing the whole diff."""
+        context = {"staged_changes": "\n".join(f"line {i:04d}" for i in range(2000))}
+
+        result = truncate_context_for_window(context, 600, "simple")
+
+        kept = result["staged_changes"].split("\n")
+        assert kept[-1] == f"... [truncated {2000 - (len(kept) - 1)} lines]"
+        assert kept[:-1] == [f"line {i:04d}" for i in range(len(kept) - 1)]
+
     def test_truncate_context_for_window_preserves_minimum_changes(self):
         """Test that truncation preserves minimum required changes context."""
         large_change = "change\n" * 1000
@@ -426,11 +534,28 @@ def test_generate_commit_message__uses_prompt_override(mock_context) -> None:
         assert result == "feat: generated message"
         mock_adv.assert_not_called()
         mock_simple.assert_not_called()
+        mock_get_context.assert_not_called()
 
         call_args = mock_client.chat_completion.call_args
         assert call_args.args[0][0]["content"] == override_prompt
 
 
+def test_generate_commit_message__reuses_client_across_calls(mock_config) -> None:
+    """Create one AIClient for repeated generations with the same settings."""
+    with (
+        patch("git_acp.ai.ai_utils.AIClient") as mock_client_class,
+        patch("git_acp.ai.ai_utils.get_commit_context", return_value={}),
+        patch("git_acp.ai.ai_utils._build_context_prompt", return_value="prompt"),
+    ):
+        mock_client_class.return_value.chat_completion.return_value = "feat: x"
+
+        generate_commit_message(mock_config)
+        generate_commit_message(mock_config)
+
+    mock_client_class.assert_called_once_with(mock_config)
+    assert mock_client_class.return_value.chat_completion.call_count == 2
+
+
 def test_generate_commit_message_error(mock_config):
     """Test commit message generation with error."""
     with patch("git_acp.ai.ai_utils.AIClient", side_effect=GitError("Test error")):
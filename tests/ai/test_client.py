@@ -6,6 +6,9 @@ enabling comprehensive testing without external API calls.
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterator
+from threading import Event
 from typing import Any, cast
 from unittest.mock import MagicMock, Mock, patch
 
@@ -63,24 +66,29 @@ def verbose_config() -> GitConfig:
     )
 
 
+def _stream_chunks(*parts: str | None) -> list[Mock]:
+    """Build streamed completion chunks carrying the given content deltas.
+
+    Args:
+        *parts: Content of each chunk's delta.
+
+    Returns:
+        list[Mock]: Chunks shaped like ``ChatCompletionChunk``.
+    """
+    return [Mock(choices=[Mock(delta=Mock(content=part))]) for part in parts]
+
+
 @pytest.fixture
 def mock_openai_client() -> MagicMock:
     """Create a mock OpenAI client with chat.completions.create method.
 
     Returns:
-        MagicMock: Mock client returning 'feat: test commit message'.
+        MagicMock: Mock client streaming 'feat: test commit message'.
     """
     client = MagicMock()
-    mock_message = Mock()
-    mock_message.content = "feat: test commit message"
-
-    mock_choice = Mock()
-    mock_choice.message = mock_message
-
-    mock_response = Mock()
-    mock_response.choices = [mock_choice]
-
-    client.chat.completions.create.return_value = mock_response
+    client.chat.completions.create.return_value = _stream_chunks(
+        "feat: ", "test commit ", "message"
+    )
     return client
 
 
@@ -119,7 +127,7 @@ class TestAIClientInjection:
         self, mock_config: GitConfig
     ) -> None:
         """Create default OpenAI client when none is injected."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai_class:
+        with patch("openai.OpenAI") as mock_openai_class:
             mock_openai_class.return_value = MagicMock()
             client = AIClient(mock_config)
 
@@ -192,6 +200,42 @@ class TestChatCompletionWithInjection:
         call_kwargs = mock_openai_client.chat.completions.create.call_args
         assert call_kwargs.kwargs["model"] == DEFAULT_AI_MODEL
         assert call_kwargs.kwargs["temperature"] == DEFAULT_TEMPERATURE
+        assert call_kwargs.kwargs["stream"] is True
+
+    def test_chat_completion__shows_streamed_text_in_progress(
+        self,
+        mock_config: GitConfig,
+        mock_openai_client: MagicMock,
+        mock_progress_factory: MagicMock,
+    ) -> None:
+        """Echo the tail of the reply in the progress line as it streams in."""
+        release = Event()
+
+        def slow_stream() -> Iterator[Mock]:
+            yield from _stream_chunks("feat: add [bold]x[/bold]")
+            release.wait(timeout=5)
+            yield from _stream_chunks("\n\nbody")
+
+        mock_openai_client.chat.completions.create.return_value = slow_stream()
+        progress = mock_progress_factory.return_value
+
+        def fake_sleep(_: float) -> None:
+            if any("description" in c.kwargs for c in progress.update.call_args_list):
+                release.set()
+            time.sleep(0.01)
+
+        client = AIClient(
+            mock_config,
+            _openai_client=mock_openai_client,
+            _progress_factory=mock_progress_factory,
+        )
+        with patch("git_acp.ai.client.sleep", side_effect=fake_sleep):
+            result = client.chat_completion([{"role": "user", "content": "test"}])
+
+        assert result == "feat: add [bold]x[/bold]\n\nbody"
+        progress.update.assert_any_call(
+            0, description=r"Receiving AI response: feat: add \[bold]x\[/bold]"
+        )
 
     def test_chat_completion__uses_config_model_override(
         self,
@@ -286,7 +330,10 @@ class TestChatCompletionWithInjection:
         mock_progress_factory: MagicMock,
     ) -> None:
         """Raise GitError when AI returns empty response."""
-        mock_openai_client.chat.completions.create.return_value = Mock(choices=[])
+        mock_openai_client.chat.completions.create.return_value = [
+            Mock(choices=[]),
+            *_stream_chunks(None, ""),
+        ]
 
         client = AIClient(
             mock_config,
@@ -303,7 +350,7 @@ class TestChatCompletionWithInjection:
         mock_openai_client: MagicMock,
         mock_progress_factory: MagicMock,
     ) -> None:
-        """Raise GitError when AI returns None response."""
+        """Report a client that returns no stream as a failed request."""
         mock_openai_client.chat.completions.create.return_value = None
 
         client = AIClient(
@@ -312,9 +359,27 @@ class TestChatCompletionWithInjection:
             _progress_factory=mock_progress_factory,
         )
 
-        with pytest.raises(GitError, match="empty response"):
+        with pytest.raises(GitError, match="AI request failed"):
             client.chat_completion([{"role": "user", "content": "test"}])
 
+    def test_chat_completion__rejects_stream_kwarg(
+        self,
+        mock_config: GitConfig,
+        mock_openai_client: MagicMock,
+        mock_progress_factory: MagicMock,
+    ) -> None:
+        """Refuse a caller-supplied ``stream`` instead of clashing with ours."""
+        client = AIClient(
+            mock_config,
+            _openai_client=mock_openai_client,
+            _progress_factory=mock_progress_factory,
+        )
+
+        with pytest.raises(TypeError, match="always streams"):
+            client.chat_completion([{"role": "user", "content": "test"}], stream=False)
+
+        mock_openai_client.chat.completions.create.assert_not_called()
+
     def test_chat_completion__handles_connection_error(
         self,
         mock_config: GitConfig,
@@ -507,7 +572,7 @@ class TestInitErrorHandling:
 
     def test_init__raises_on_invalid_url(self, mock_config: GitConfig) -> None:
         """Raise GitError when URL is invalid."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = ValueError("Invalid URL")
 
             with pytest.raises(GitError, match="Invalid Ollama server URL"):
@@ -515,7 +580,7 @@ class TestInitErrorHandling:
 
     def test_init__raises_on_generic_value_error(self, mock_config: GitConfig) -> None:
         """Raise GitError on generic ValueError during init."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = ValueError("Some other error")
 
             with pytest.raises(GitError, match="Invalid AI configuration"):
@@ -525,7 +590,7 @@ class TestInitErrorHandling:
         self, mock_config: GitConfig
     ) -> None:
         """Try fallback URL when primary connection fails."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             # First call fails, second succeeds
             mock_openai.side_effect = [ConnectionError(), MagicMock()]
 
@@ -541,7 +606,7 @@ class TestInitErrorHandling:
         self, mock_config: GitConfig
     ) -> None:
         """Raise GitError when both primary and fallback connections fail."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = [ConnectionError(), ConnectionError()]
 
             with patch(
@@ -554,7 +619,7 @@ class TestInitErrorHandling:
         self, mock_config: GitConfig
     ) -> None:
         """Raise GitError when no fallback is configured."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = ConnectionError()
 
             with patch("git_acp.ai.client.DEFAULT_FALLBACK_BASE_URL", None):
@@ -563,7 +628,7 @@ class TestInitErrorHandling:
 
     def test_init__raises_on_generic_exception(self, mock_config: GitConfig) -> None:
         """Raise GitError on generic exception during init."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = RuntimeError("Unexpected")
 
             with pytest.raises(GitError, match="Failed to initialize AI client"):
@@ -578,7 +643,7 @@ class TestInitErrorHandling:
         verbose_config: GitConfig,
     ) -> None:
         """Log initialization details in verbose mode."""
-        with patch("git_acp.ai.client.OpenAI"):
+        with patch("openai.OpenAI"):
             AIClient(verbose_config)
 
             mock_debug_header.assert_any_call("Initializing AI client")
@@ -593,7 +658,7 @@ class TestInitErrorHandling:
         verbose_config: GitConfig,
     ) -> None:
         """Log fallback attempt in verbose mode."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = [ConnectionError(), MagicMock()]
 
             with patch(
@@ -614,7 +679,7 @@ class TestInitErrorHandling:
         verbose_config: GitConfig,
     ) -> None:
         """Log connection error details when no fallback is configured."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = ConnectionError()
 
             with patch("git_acp.ai.client.DEFAULT_FALLBACK_BASE_URL", None):
@@ -633,7 +698,7 @@ class TestInitErrorHandling:
         verbose_config: GitConfig,
     ) -> None:
         """Log generic exception details during init in verbose mode."""
-        with patch("git_acp.ai.client.OpenAI") as mock_openai:
+        with patch("openai.OpenAI") as mock_openai:
             mock_openai.side_effect = RuntimeError("Unexpected error")
 
             with pytest.raises(GitError):
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import ANY, MagicMock, call, patch
 
+import pytest
 from click.testing import CliRunner
 
 from git_acp.cli.cli import main
 from git_acp.cli.workflow import EXIT_CODE_CANCELLED
+from git_acp.git import GitError
 
 
 class TestCliAutoGroup:
@@ -17,6 +20,17 @@ class TestCliAutoGroup:
         """Set up a Click runner."""
         self.runner = CliRunner()
 
+    @pytest.fixture(autouse=True)
+    def mock_current_branch(self) -> Iterator[MagicMock]:
+        """Keep branch resolution away from the real repository.
+
+        Yields:
+            The patched ``get_current_branch`` mock.
+        """
+        with patch("git_acp.cli.cli.get_current_branch") as mock_branch:
+            mock_branch.return_value = "main"
+            yield mock_branch
+
     @patch("git_acp.cli.cli.unstage_files")
     @patch("git_acp.cli.cli.GitWorkflow")
     @patch("git_acp.cli.cli.group_changed_files")
@@ -82,6 +96,32 @@ class TestCliAutoGroup:
         assert second_config.files == "b.py"
         assert first_config is not second_config
 
+    @patch("git_acp.cli.cli.unstage_files")
+    @patch("git_acp.cli.cli.GitWorkflow")
+    @patch("git_acp.cli.cli.group_changed_files")
+    @patch("git_acp.cli.cli.get_changed_files")
+    def test_auto_group_dry_run_skips_per_group_staging_checks(
+        self,
+        mock_get_changed_files: MagicMock,
+        mock_group_changed_files: MagicMock,
+        mock_workflow_cls: MagicMock,
+        mock_unstage: MagicMock,
+    ) -> None:
+        """Leave the index alone between groups when nothing is staged."""
+        mock_get_changed_files.side_effect = [
+            set(),  # initial staged-only check
+            {"a.py", "b.py"},  # changed-files set
+        ]
+        mock_group_changed_files.return_value = [["a.py"], ["b.py"]]
+        mock_workflow_cls.return_value.run.return_value = 0
+
+        result = self.runner.invoke(main, ["--auto-group", "--no-confirm", "--dry-run"])
+
+        assert result.exit_code == 0
+        assert mock_workflow_cls.call_count == 2
+        assert mock_get_changed_files.call_count == 2
+        mock_unstage.assert_not_called()
+
     @patch("git_acp.cli.cli.unstage_files")
     @patch("git_acp.cli.cli.GitWorkflow")
     @patch("git_acp.cli.cli.group_changed_files")
@@ -232,3 +272,50 @@ class TestCliAutoGroup:
         assert mock_unstage.call_args_list == [call(ANY), call(ANY)]
         assert "Auto-group cancelled at group 2/3" in result.output
         assert "1 group(s) committed successfully" in result.output
+
+    @patch("git_acp.cli.cli.unstage_files")
+    @patch("git_acp.cli.cli.GitWorkflow")
+    @patch("git_acp.cli.cli.group_changed_files")
+    @patch("git_acp.cli.cli.get_changed_files")
+    def test_auto_group_resolves_branch_once_for_all_groups(
+        self,
+        mock_get_changed_files: MagicMock,
+        mock_group_changed_files: MagicMock,
+        mock_workflow_cls: MagicMock,
+        mock_unstage: MagicMock,
+        mock_current_branch: MagicMock,
+    ) -> None:
+        """Look up the current branch once and hand it to every group."""
+        mock_get_changed_files.side_effect = [set(), {"a.py", "b.py"}, set(), set()]
+        mock_group_changed_files.return_value = [["a.py"], ["b.py"]]
+        mock_workflow_cls.return_value.run.return_value = 0
+
+        result = self.runner.invoke(main, ["--auto-group", "--no-confirm"])
+
+        assert result.exit_code == 0
+        mock_current_branch.assert_called_once_with()
+        branches = [c.args[0].branch for c in mock_workflow_cls.call_args_list]
+        assert branches == ["main", "main"]
+
+    @patch("git_acp.cli.cli.unstage_files")
+    @patch("git_acp.cli.cli.GitWorkflow")
+    @patch("git_acp.cli.cli.group_changed_files")
+    @patch("git_acp.cli.cli.get_changed_files")
+    def test_auto_group_leaves_branch_unset_when_detection_fails(
+        self,
+        mock_get_changed_files: MagicMock,
+        mock_group_changed_files: MagicMock,
+        mock_workflow_cls: MagicMock,
+        mock_unstage: MagicMock,
+        mock_current_branch: MagicMock,
+    ) -> None:
+        """Defer branch errors to the workflow, which reports them per group."""
+        mock_current_branch.side_effect = GitError("detached HEAD")
+        mock_get_changed_files.side_effect = [set(), {"a.py"}, set()]
+        mock_group_changed_files.return_value = [["a.py"]]
+        mock_workflow_cls.return_value.run.return_value = 1
+
+        result = self.runner.invoke(main, ["--auto-group", "--no-confirm"])
+
+        assert result.exit_code == 1
+        assert mock_workflow_cls.call_args.args[0].branch is None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from git_acp import __version__
@@ -12,6 +13,17 @@ from git_acp.cli.cli import main
 from git_acp.git import CommitType
 
 
+@pytest.fixture(autouse=True)
+def mock_change_signals_prefetch():
+    """Keep the AI-path classifier prefetch from reading the real repository.
+
+    Yields:
+        MagicMock: The patched ``collect_change_signals``.
+    """
+    with patch("git_acp.cli.workflow.collect_change_signals") as mock_collect:
+        yield mock_collect
+
+
 class TestCli(unittest.TestCase):
     """Tests for the CLI entry point."""
 
@@ -24,14 +36,16 @@ class TestCli(unittest.TestCase):
     @patch("git_acp.cli.workflow.git_commit")
     @patch("git_acp.cli.workflow.generate_commit_message")
     @patch("git_acp.cli.workflow.get_changed_files")
+    @patch("git_acp.cli.workflow.has_staged_changes", return_value=True)
     @patch("git_acp.cli.workflow.git_add")
     @patch("git_acp.cli.workflow.classify_commit_type")
-    @patch("glob.glob")
+    @patch("glob.iglob")
     def test_cli_add_path_has_changes(
         self,
         mock_glob: MagicMock,
         mock_classify: MagicMock,
         mock_git_add: MagicMock,
+        mock_has_staged: MagicMock,
         mock_get_changed_files: MagicMock,
         mock_generate_commit_message: MagicMock,
         mock_git_commit: MagicMock,
@@ -57,7 +71,7 @@ class TestCli(unittest.TestCase):
         mock_git_push.assert_called()
 
     @patch("git_acp.cli.cli.sys.exit")
-    @patch("glob.glob")
+    @patch("glob.iglob")
     def test_cli_add_path_no_changes(
         self,
         mock_glob: MagicMock,
@@ -78,14 +92,16 @@ class TestCli(unittest.TestCase):
     @patch("git_acp.cli.workflow.git_commit")
     @patch("git_acp.cli.workflow.generate_commit_message")
     @patch("git_acp.cli.workflow.get_changed_files")
+    @patch("git_acp.cli.workflow.has_staged_changes", return_value=True)
     @patch("git_acp.cli.workflow.git_add")
     @patch("git_acp.cli.workflow.classify_commit_type")
-    @patch("glob.glob")
+    @patch("glob.iglob")
     def test_cli_add_dot_lists_files(
         self,
         mock_glob: MagicMock,
         mock_classify: MagicMock,
         mock_git_add: MagicMock,
+        mock_has_staged: MagicMock,
         mock_get_changed_files: MagicMock,
         mock_generate_commit_message: MagicMock,
         mock_git_commit: MagicMock,
@@ -179,6 +195,27 @@ class TestCli(unittest.TestCase):
         enum_types = [ct.name.lower() for ct in CommitType]
         self.assertEqual(list(CLI_COMMIT_TYPE_CHOICES), enum_types)
 
+    @patch("git_acp.cli.cli.rprint")
+    def test_process_add_argument__deduplicates_overlapping_patterns(
+        self, mock_rprint: MagicMock
+    ) -> None:
+        """Overlapping -a patterns yield each path once and flag misses."""
+        from git_acp.cli.cli import _process_add_argument
+
+        matches = {
+            "src/**/*.py": iter(["src/a.py", "src/my b.py"]),
+            "src/a.py": iter(["src/a.py"]),
+            "nope/*.py": iter([]),
+        }
+        with patch("glob.iglob", side_effect=lambda item, **_: matches[item]):
+            files, should_exit = _process_add_argument(
+                "'src/**/*.py' src/a.py 'nope/*.py'"
+            )
+
+        self.assertEqual(files, 'src/a.py "src/my b.py"')
+        self.assertFalse(should_exit)
+        self.assertIn("nope/*.py", mock_rprint.call_args.args[0])
+
 
 if __name__ == "__main__":
     unittest.main()
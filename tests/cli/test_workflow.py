@@ -13,12 +13,23 @@ import pytest
 from git_acp.cli.interaction import CancelledByUserError, TestInteraction
 from git_acp.cli.workflow import EXIT_CODE_CANCELLED, GitWorkflow
 from git_acp.git import CommitType, GitError
-from git_acp.utils import GitConfig
+from git_acp.utils import GitConfig, debug_item
 
 
 # -----------------------------------------------------------------------------
 # Fixtures
 # -----------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def mock_change_signals_prefetch():
+    """Keep the AI-path classifier prefetch from reading the real repository.
+
+    Yields:
+        MagicMock: The patched ``collect_change_signals``.
+    """
+    with patch("git_acp.cli.workflow.collect_change_signals") as mock_collect:
+        yield mock_collect
+
+
 @pytest.fixture
 def mock_config() -> GitConfig:
     """Create a non-interactive GitConfig instance.
@@ -363,6 +374,56 @@ class TestGitWorkflow:
         mock_generate.assert_called_once()
         assert workflow.config.message == "AI generated message"
 
+    @patch("git_acp.cli.workflow.classify_commit_type")
+    @patch("git_acp.cli.workflow.generate_commit_message")
+    @patch("git_acp.cli.workflow.git_add")
+    @patch("git_acp.cli.workflow.git_commit")
+    @patch("git_acp.cli.workflow.git_push")
+    def test_workflow_run__prefetches_classifier_inputs_during_ai(
+        self,
+        mock_push: MagicMock,
+        mock_commit: MagicMock,
+        mock_add: MagicMock,
+        mock_generate: MagicMock,
+        mock_classify: MagicMock,
+        mock_change_signals_prefetch: MagicMock,
+        mock_config: GitConfig,
+    ) -> None:
+        """Hand the signals gathered during AI generation to the classifier."""
+        mock_config.use_ollama = True
+        mock_config.message = None
+        mock_generate.return_value = "AI generated message"
+        mock_classify.return_value = CommitType.CHORE
+        signals = mock_change_signals_prefetch.return_value
+
+        workflow = GitWorkflow(mock_config, TestInteraction())
+
+        assert workflow.run() == 0
+        mock_change_signals_prefetch.assert_called_once_with(mock_config)
+        assert mock_classify.call_args.kwargs["change_signals"] is signals
+
+    @patch("git_acp.cli.workflow.classify_commit_type")
+    @patch("git_acp.cli.workflow.git_add")
+    @patch("git_acp.cli.workflow.git_commit")
+    @patch("git_acp.cli.workflow.git_push")
+    def test_workflow_run__manual_message_skips_prefetch(
+        self,
+        mock_push: MagicMock,
+        mock_commit: MagicMock,
+        mock_add: MagicMock,
+        mock_classify: MagicMock,
+        mock_change_signals_prefetch: MagicMock,
+        mock_config: GitConfig,
+    ) -> None:
+        """Let the classifier read git itself when there is no AI wait to hide."""
+        mock_classify.return_value = CommitType.CHORE
+
+        workflow = GitWorkflow(mock_config, TestInteraction())
+
+        assert workflow.run() == 0
+        mock_change_signals_prefetch.assert_not_called()
+        assert mock_classify.call_args.kwargs["change_signals"] is None
+
     @patch("git_acp.cli.workflow.classify_commit_type")
     @patch("git_acp.cli.workflow.git_add")
     @patch("git_acp.cli.workflow.git_commit")
@@ -419,12 +480,55 @@ class TestGitWorkflow:
         assert result is True
         mock_add.assert_called_once_with(mock_config.files, mock_config)
 
-        # First message is the header, followed by per-file lines.
-        assert interaction.messages[0] == "Adding files:"
-        listed_files = interaction.messages[1:]
-        assert any("tests/ai/test_ai_utils.py" in msg for msg in listed_files)
-        assert any("tests/git/test_history.py" in msg for msg in listed_files)
-        assert all("git_acp/cli/workflow.py" not in msg for msg in listed_files)
+        # The header and per-file lines are rendered as one message.
+        assert interaction.messages == [
+            "Adding files:\n  - tests/ai/test_ai_utils.py\n"
+            "  - tests/git/test_history.py"
+        ]
+
+    @patch("git_acp.cli.workflow._MAX_FILES_PREVIEW", 2)
+    @patch("git_acp.cli.workflow.get_changed_files")
+    @patch("git_acp.cli.workflow.git_add")
+    def test_handle_git_add__caps_cli_add_preview(
+        self,
+        mock_add: MagicMock,
+        mock_get_changed: MagicMock,
+        mock_config: GitConfig,
+    ) -> None:
+        """List the first files alphabetically and summarize the remainder."""
+        mock_config.files = "."
+        mock_get_changed.return_value = {"d.py", "b.py", "a.py", "c.py"}
+
+        interaction = TestInteraction()
+        workflow = GitWorkflow(
+            mock_config, interaction, files_from_cli=True, raw_add_patterns="."
+        )
+
+        assert workflow._handle_git_add() is True
+        assert interaction.messages == [
+            "Adding files:\n  - a.py\n  - b.py\n  … and 2 more files"
+        ]
+
+    @patch("git_acp.cli.workflow.get_changed_files")
+    @patch("git_acp.cli.workflow.has_staged_changes", return_value=False)
+    def test_check_staged_files__uses_index_probe(
+        self,
+        mock_has_staged: MagicMock,
+        mock_get_changed: MagicMock,
+        mock_config: GitConfig,
+    ) -> None:
+        """Report an empty -a scope from the index probe, not a staged listing."""
+        from git_acp.cli.interaction import TestInteraction
+        from git_acp.cli.workflow import GitWorkflow
+
+        mock_config.files = "docs"
+        interaction = TestInteraction()
+        workflow = GitWorkflow(mock_config, interaction, files_from_cli=True)
+
+        assert workflow._check_staged_files() is False
+        mock_has_staged.assert_called_once_with(mock_config)
+        mock_get_changed.assert_not_called()
+        assert any("No Changes Staged" in panel[1] for panel in interaction.panels)
 
     @patch("git_acp.cli.workflow.unstage_files")
     @patch("git_acp.cli.workflow.git_push")
@@ -473,6 +577,11 @@ class TestGitWorkflow:
         assert any("Would commit with message" in msg for msg in interaction.messages)
         mock_commit.assert_not_called()
         mock_push.assert_not_called()
+        mock_branch.assert_not_called()
+        # The -a preview and the dry-run scope check share one status read.
+        mock_get_changed.assert_called_once()
+        # Nothing was staged, so there is nothing to reset either.
+        mock_unstage.assert_not_called()
 
     @patch("git_acp.cli.workflow.unstage_files")
     @patch("git_acp.cli.workflow.git_push")
@@ -784,6 +893,80 @@ class TestWorkflowErrorPaths:
         mock_unstage.assert_called_once_with()
 
 
+class TestBranchPrefetch:
+    """Tests for resolving the branch in the background."""
+
+    @patch("git_acp.cli.workflow.get_current_branch")
+    def test_prefetched_branch_is_used_by_detection(
+        self, mock_branch: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Collect the background lookup instead of querying git again."""
+        mock_branch.return_value = "dev"
+        mock_config.branch = None
+        workflow = GitWorkflow(mock_config, TestInteraction())
+
+        workflow._prefetch_branch()
+
+        assert workflow._branch_future is not None
+        assert workflow._handle_branch_detection() is True
+        assert workflow.config.branch == "dev"
+        mock_branch.assert_called_once_with()
+
+    @patch("git_acp.cli.workflow.get_current_branch")
+    def test_prefetch_error_is_reported_by_detection(
+        self, mock_branch: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Surface a failed background lookup as a branch detection error."""
+        mock_branch.side_effect = GitError("detached HEAD")
+        mock_config.branch = None
+        interaction = TestInteraction()
+        workflow = GitWorkflow(mock_config, interaction)
+
+        workflow._prefetch_branch()
+
+        assert workflow._handle_branch_detection() is False
+        assert interaction.errors[0][2] == "Branch Detection Failed"
+
+    @patch("git_acp.cli.workflow.get_current_branch")
+    def test_prefetch_skipped_when_branch_known_or_dry_run(
+        self, mock_branch: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Do not start a lookup whose result would never be used."""
+        GitWorkflow(mock_config, TestInteraction())._prefetch_branch()
+        mock_config.branch = None
+        mock_config.dry_run = True
+        GitWorkflow(mock_config, TestInteraction())._prefetch_branch()
+
+        mock_branch.assert_not_called()
+
+
+class TestChangeSignalsPrefetch:
+    """Tests for gathering classifier inputs in the background."""
+
+    def test_prefetch_debug_output_waits_for_collection(
+        self,
+        mock_change_signals_prefetch: MagicMock,
+        mock_config: GitConfig,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Print the worker's verbose lines only once its result is used."""
+
+        def collect(config: GitConfig) -> str:
+            debug_item("Prefetch worker", "numstat")
+            return "signals"
+
+        mock_change_signals_prefetch.side_effect = collect
+        workflow = GitWorkflow(mock_config, TestInteraction())
+
+        workflow._prefetch_change_signals()
+        assert workflow._change_signals_future is not None
+        workflow._change_signals_future.result()
+        assert "Prefetch worker" not in capsys.readouterr().out
+
+        assert workflow._prefetched_change_signals() == "signals"
+        assert "Prefetch worker" in capsys.readouterr().out
+
+
 class TestFormatCommitMessage:
     """Test commit message formatting."""
 
@@ -885,3 +1068,78 @@ class TestWorkflowFormatMessage:
         workflow = GitWorkflow(config, TestInteraction())
 
         assert workflow._format_message(CommitType.FEAT) == "feat ✨: add new feature"
+
+
+class TestRichQuestionaryInteraction:
+    """Tests for the production interaction implementation."""
+
+    def test_select_commit_type__skip_confirmation_does_not_import_questionary(
+        self, mock_config: GitConfig
+    ) -> None:
+        """Auto-apply the suggestion without loading the prompt machinery."""
+        from git_acp.cli.interaction import RichQuestionaryInteraction
+
+        interaction = RichQuestionaryInteraction()
+        with (
+            patch.dict("sys.modules", {"questionary": None}),
+            patch("git_acp.cli.interaction.rprint"),
+        ):
+            result = interaction.select_commit_type(
+                CommitType.FIX, mock_config, "fix bug"
+            )
+
+        assert result == CommitType.FIX
+
+    def test_select_files__prints_listing_once(self) -> None:
+        """Render the selected files in a single print call."""
+        from git_acp.cli.interaction import RichQuestionaryInteraction
+
+        interaction = RichQuestionaryInteraction()
+        with (
+            patch("questionary.checkbox") as mock_checkbox,
+            patch("git_acp.cli.interaction.rprint") as mock_rprint,
+        ):
+            mock_checkbox.return_value.ask.return_value = ["All files"]
+            result = interaction.select_files({"b.py", "my file.py", "a.py"})
+
+        assert result == 'a.py b.py "my file.py"'
+        mock_rprint.assert_called_once()
+        printed = mock_rprint.call_args.args[0]
+        assert printed.endswith("  - a.py\n  - b.py\n  - my file.py")
+
+    def test_print_error__fills_template_without_reinterpreting_braces(self) -> None:
+        """Insert message text verbatim into the error panel body."""
+        from git_acp.cli.interaction import RichQuestionaryInteraction
+        from git_acp.config import COLORS
+
+        interaction = RichQuestionaryInteraction()
+        with patch("git_acp.cli.interaction.rprint") as mock_rprint:
+            interaction.print_error("bad {ref}", "try {this}", "Oops")
+
+        panel = mock_rprint.call_args.args[0]
+        err = COLORS["error"]
+        assert panel.renderable == (
+            f"[{err}]bad {{ref}}[/{err}]\n\nSuggestion: try {{this}}"
+        )
+        assert panel.title == "Oops"
+
+    def test_select_commit_type__returns_selected_enum_member(
+        self, mock_config: GitConfig
+    ) -> None:
+        """Return the CommitType carried by the chosen option."""
+        from git_acp.cli.interaction import RichQuestionaryInteraction
+
+        mock_config.skip_confirmation = False
+        interaction = RichQuestionaryInteraction()
+        with (
+            patch("questionary.checkbox") as mock_checkbox,
+            patch("git_acp.cli.interaction.rprint"),
+        ):
+            mock_checkbox.return_value.ask.return_value = [CommitType.DOCS]
+            result = interaction.select_commit_type(
+                CommitType.FIX, mock_config, "fix bug"
+            )
+
+        assert result is CommitType.DOCS
+        choices = mock_checkbox.call_args.kwargs["choices"]
+        assert choices[0].value is CommitType.FIX
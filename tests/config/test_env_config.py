@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from git_acp.config import env_config
 from git_acp.config.env_config import (
     ensure_config_dir,
     get_config_dir,
@@ -15,6 +16,20 @@ from git_acp.config.env_config import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_env_loaded(monkeypatch):
+    """Let each test observe a process that has not loaded the env file yet."""
+    monkeypatch.setattr(env_config, "_env_loaded", False)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_dir_cache():
+    """Resolve the config directory again for each test."""
+    get_config_dir.cache_clear()
+    yield
+    get_config_dir.cache_clear()
+
+
 class TestEnvConfig:
     """Test suite for environment configuration handling."""
 
@@ -24,13 +39,21 @@ class TestEnvConfig:
         mock_home.return_value = Path("/test/home")
         assert get_config_dir() == Path("/test/home/.config/git-acp")
 
+    @patch("pathlib.Path.home")
+    def test_get_config_dir_resolves_home_once(self, mock_home):
+        """Repeated calls should reuse the first resolved path."""
+        mock_home.return_value = Path("/test/home")
+        first = get_config_dir()
+        assert get_config_dir() is first
+        mock_home.assert_called_once()
+
     @patch("pathlib.Path.mkdir")
     def test_ensure_config_dir_creation(self, mock_mkdir):
         """Should create directory with parents if not exists."""
         ensure_config_dir()
         mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
-    @patch("git_acp.config.env_config.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_load_env_config_with_existing_file(self, mock_load):
         """Should load .env file when present."""
         with (
@@ -41,7 +64,7 @@ class TestEnvConfig:
 
         mock_load.assert_called_once_with(get_config_dir() / ".env")
 
-    @patch("git_acp.config.env_config.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_load_env_config_missing_file(self, mock_load):
         """Should not attempt load when .env missing."""
         with (
@@ -52,6 +75,19 @@ class TestEnvConfig:
 
         mock_load.assert_not_called()
 
+    @patch("dotenv.load_dotenv")
+    def test_load_env_config_runs_once(self, mock_load):
+        """Should read the config file only on the first call."""
+        with (
+            patch.dict(os.environ, {"GIT_ACP_ALLOW_TEST_ENV_LOAD": "1"}),
+            patch("pathlib.Path.exists", return_value=True) as mock_exists,
+        ):
+            load_env_config()
+            load_env_config()
+
+        mock_load.assert_called_once()
+        mock_exists.assert_called_once()
+
     @pytest.mark.parametrize(
         "env_value, cast_type, expected",
         [
@@ -1,26 +1,72 @@
 """Tests for git_acp.git.classification module."""
 
+import re
+from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from git_acp.config import COMMIT_TYPE_PATTERNS, FILE_PATH_PATTERNS
+from git_acp.config import (
+    COMMIT_TYPE_PATTERNS,
+    EXCLUDED_PATTERNS,
+    FILE_CATEGORY_PATTERNS,
+    FILE_PATH_PATTERNS,
+)
 from git_acp.git.classification import (
+    ChangeSignals,
     CommitType,
     FileCategory,
+    _check_keyword_pattern,
     _classify_by_file_paths,
+    _compile_keywords,
     classify_commit_type,
     get_changes,
     strip_conventional_prefix,
 )
 from git_acp.git.diff import extract_added_lines
 from git_acp.git.file_classifier import (
+    _compile_path_patterns,
+    _match_file_path_pattern,
+    _matches_path_patterns,
+    _normalize_match_path,
+    _normalize_path_separators,
+    _path_pattern_regex,
     categorize_changed_files,
     classify_file_category,
     is_file_excluded,
 )
 from git_acp.git.git_operations import GitError
 
+_SAMPLE_PATHS = (
+    ".env",
+    "config/.env",
+    ".env.example",
+    "config/.env.local",
+    "src/.ENV",
+    "__pycache__/module.cpython-311.pyc",
+    "pkg/__PYCACHE__/x.py",
+    "my__pycache__x/y.py",
+    "node_modules/react/index.js",
+    "web/Node_Modules/x.js",
+    ".venv/bin/python",
+    "src/main.py",
+    "src/deadlock.py",
+    "poetry.lock",
+    "tests/test_main.py",
+    "test_main.py",
+    "src/foo_test.py",
+    "docs/index.md",
+    "README.md",
+    ".github/workflows/ci.yml",
+    "Dockerfile",
+    "requirements-dev.txt",
+    "pyproject.toml",
+    "build/lib/x.py",
+    "dist/pkg.whl",
+    "/abs//double/slash/",
+    "",
+)
+
 
 class TestCommitType:
     """Tests for CommitType enum."""
@@ -240,6 +286,30 @@ class TestClassification:
         result = classify_commit_type(mock_config, commit_message="fix something")
         assert result == CommitType.TEST
 
+    @patch("git_acp.git.classification.get_numstat")
+    @patch("git_acp.git.classification.get_changed_files")
+    @patch("git_acp.git.classification.get_diff")
+    def test_prefetched_change_signals_skip_git_reads(
+        self,
+        mock_get_diff,
+        mock_get_files,
+        mock_get_numstat,
+        mock_config,
+    ):
+        """Classify from pre-collected signals without querying git again."""
+        signals = ChangeSignals(
+            changed_files={"tests/test_module.py"}, numstat={}, diff_text=""
+        )
+
+        result = classify_commit_type(
+            mock_config, commit_message="fix something", change_signals=signals
+        )
+
+        assert result == CommitType.TEST
+        mock_get_files.assert_not_called()
+        mock_get_diff.assert_not_called()
+        mock_get_numstat.assert_not_called()
+
     @patch("git_acp.git.classification.get_numstat")
     @patch("git_acp.git.classification.get_changed_files")
     @patch("git_acp.git.classification.get_diff")
@@ -618,6 +688,37 @@ class TestClassifyCommitTypeEdgeCases:
         assert result == CommitType.CHORE
 
 
+class TestCheckKeywordPattern:
+    """Tests for keyword matching against commit messages and diffs."""
+
+    def test_check_keyword_pattern__word_boundaries_only_for_plain_words(
+        self,
+    ) -> None:
+        """Plain words need whole-word hits; other keywords match as substrings."""
+        config = MagicMock(verbose=False)
+        keywords = ["Fix", "bug fix", "", "hot-", ".lock"]
+
+        assert _check_keyword_pattern(
+            keywords,
+            "prefix the bug fixed hot-path in poetry.lock",
+            use_word_boundaries=True,
+            config=config,
+        ) == ["hot-", ".lock"]
+        assert _check_keyword_pattern(
+            keywords, "prefix", use_word_boundaries=False, config=config
+        ) == ["Fix"]
+
+    def test_compile_keywords__reuses_compiled_table(self) -> None:
+        """Each keyword tuple is prepared once and then served from cache."""
+        keywords = ("unique-kw-for-cache-test", "word")
+
+        first = _compile_keywords(keywords)
+
+        assert _compile_keywords(tuple(keywords)) is first
+        assert first[0][2] is None
+        assert first[1][2] is not None
+
+
 class TestStripConventionalPrefix:
     """Tests for stripping conventional prefixes from commit titles."""
 
@@ -802,6 +903,55 @@ class TestIsFileExcluded:
         # matching should not flag it because 'lock' is not a full segment.
         assert not is_file_excluded("src/deadlock.py")
 
+    def test_is_file_excluded__agrees_with_per_pattern_matcher(self) -> None:
+        """The combined regex gives the same answer as looping the patterns."""
+        for path in _SAMPLE_PATHS:
+            expected = Path(path).name == ".env" or any(
+                _match_file_path_pattern(path, pattern)
+                for pattern in EXCLUDED_PATTERNS
+                if pattern != "/.env$"
+            )
+            assert is_file_excluded(path) is expected, path
+
+
+class TestPathPatternRegex:
+    """Tests for translating path patterns into regexes."""
+
+    def test_path_pattern_regex__agrees_with_matcher_for_configured_patterns(
+        self,
+    ) -> None:
+        """Every configured pattern translates to an equivalent regex."""
+        patterns = {
+            pattern
+            for table in (FILE_PATH_PATTERNS, FILE_CATEGORY_PATTERNS)
+            for group in table.values()
+            for pattern in group
+        }
+        for pattern in patterns:
+            source = _path_pattern_regex(pattern)
+            regex = re.compile(source, re.IGNORECASE) if source else None
+            for path in _SAMPLE_PATHS:
+                normalized = _normalize_path_separators(path).strip("/")
+                got = bool(normalized and regex and regex.search(normalized))
+                assert got is _match_file_path_pattern(path, pattern), (
+                    pattern,
+                    path,
+                )
+
+    def test_compile_path_patterns__agrees_with_any_pattern_in_group(self) -> None:
+        """A compiled group matches exactly when one of its patterns does."""
+        for patterns in (*FILE_PATH_PATTERNS.values(), [], ["", "//"]):
+            compiled = _compile_path_patterns(patterns)
+            for path in _SAMPLE_PATHS:
+                expected = any(_match_file_path_pattern(path, p) for p in patterns)
+                got = _matches_path_patterns(_normalize_match_path(path), compiled)
+                assert got is expected, (patterns, path)
+
+    def test_path_pattern_regex__rejects_empty_patterns(self) -> None:
+        """Patterns that can never match translate to None."""
+        assert _path_pattern_regex("") is None
+        assert _path_pattern_regex("//") is None
+
 
 # ---------------------------------------------------------------------------
 # Phase 3: Regression tests for known misclassification patterns
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from git_acp.git.core import GitError, run_git_command
+from git_acp.git.core import GitError, run_git_check, run_git_command
 from git_acp.utils import GitConfig
 
 
@@ -62,6 +63,76 @@ class TestRunGitCommand:
         assert stdout == "output"
         assert stderr == ""
 
+    @patch("subprocess.Popen")
+    def test_run_git_command__read_only_skips_optional_locks(
+        self, mock_popen: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Run read-only commands with --no-optional-locks."""
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = ("", "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        run_git_command(["git", "status", "--porcelain"], mock_config, read_only=True)
+        run_git_command(["git", "add", "x.py"], mock_config)
+
+        commands = [c.args[0] for c in mock_popen.call_args_list]
+        assert commands == [
+            ["git", "--no-optional-locks", "status", "--porcelain"],
+            ["git", "add", "x.py"],
+        ]
+
+    @pytest.mark.parametrize(("returncode", "expected"), [(0, True), (1, False)])
+    @patch("subprocess.Popen")
+    def test_run_git_check__maps_exit_status(
+        self,
+        mock_popen: MagicMock,
+        mock_config: GitConfig,
+        returncode: int,
+        expected: bool,
+    ) -> None:
+        """Report exit 0 as True and exit 1 as False without raising."""
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = ("", "")
+        mock_process.returncode = returncode
+        mock_popen.return_value = mock_process
+
+        assert run_git_check(["git", "diff", "--quiet"], mock_config) is expected
+
+    @patch("subprocess.Popen")
+    def test_run_git_check__raises_on_other_exit_codes(
+        self, mock_popen: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Raise GitError when the predicate itself fails."""
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = ("", "fatal: not a git repository")
+        mock_process.returncode = 128
+        mock_popen.return_value = mock_process
+
+        with pytest.raises(GitError, match="Not a git repository"):
+            run_git_check(["git", "diff", "--quiet"], mock_config)
+
+    @patch("subprocess.Popen")
+    def test_run_git_command__feeds_stdin(
+        self, mock_popen: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Open a stdin pipe only when input is given, and write it once."""
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = ("", "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        run_git_command(["git", "add", "--pathspec-from-file=-"], stdin="a\0b")
+        run_git_command(["git", "status"], mock_config)
+
+        first, second = mock_popen.call_args_list
+        assert first.kwargs["stdin"] is subprocess.PIPE
+        assert second.kwargs["stdin"] is None
+        assert [c.args for c in mock_process.communicate.call_args_list] == [
+            ("a\0b",),
+            (None,),
+        ]
+
     @patch("subprocess.Popen")
     def test_run_git_command__strips_output(
         self, mock_popen: MagicMock, mock_config: GitConfig
@@ -77,6 +148,22 @@ class TestRunGitCommand:
         assert stdout == "output"
         assert stderr == "error"
 
+    @patch("subprocess.Popen")
+    def test_run_git_command__keeps_output_when_not_stripping(
+        self, mock_popen: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Return NUL-delimited stdout untouched when stripping is disabled."""
+        mock_process = MagicMock()
+        mock_process.communicate.return_value = (" M bar.txt\0 M foo.txt\0", "")
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+
+        stdout, _ = run_git_command(
+            ["git", "status", "--porcelain", "-z"], mock_config, strip_output=False
+        )
+
+        assert stdout == " M bar.txt\0 M foo.txt\0"
+
     @patch("subprocess.Popen")
     def test_run_git_command__raises_on_nonzero_exit(
         self, mock_popen: MagicMock, mock_config: GitConfig
@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
+import subprocess
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from git_acp.git.core import GitError
-from git_acp.git.diff import get_changed_files, get_diff
+from git_acp.git.diff import get_changed_files, get_diff, has_staged_changes
 from git_acp.utils import GitConfig
 
 
+def _commit_files(repo: Path, *names: str) -> None:
+    """Create a repository at *repo* with one commit holding *names*.
+
+    Args:
+        repo: Directory to initialise.
+        *names: Files to create and commit.
+    """
+    git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t"]
+    subprocess.run([*git, "init", "-q"], check=True)
+    for name in names:
+        (repo / name).write_text("original\n")
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+
+
 class TestGetChangedFiles:
     """Tests for get_changed_files function."""
 
@@ -34,10 +51,29 @@ class TestGetChangedFiles:
         result = get_changed_files(config=mock_config, staged_only=True)
 
         mock_run.assert_called_once_with(
-            ["git", "diff", "--staged", "--name-only"], mock_config
+            ["git", "diff", "--staged", "--name-only"], mock_config, read_only=True
         )
         assert result == {"file1.py", "file2.py"}
 
+    @pytest.mark.parametrize(
+        ("index_clean", "expected"), [(True, False), (False, True)]
+    )
+    @patch("git_acp.git.diff.run_git_check")
+    def test_has_staged_changes__uses_quiet_diff(
+        self,
+        mock_check: MagicMock,
+        mock_config: GitConfig,
+        index_clean: bool,
+        expected: bool,
+    ) -> None:
+        """Answer from the exit status of git diff --cached --quiet."""
+        mock_check.return_value = index_clean
+
+        assert has_staged_changes(mock_config) is expected
+        mock_check.assert_called_once_with(
+            ["git", "diff", "--cached", "--quiet"], mock_config, read_only=True
+        )
+
     @patch("git_acp.git.diff.run_git_command")
     def test_get_changed_files__staged_only_empty(
         self, mock_run: MagicMock, mock_config: GitConfig
@@ -55,7 +91,7 @@ class TestGetChangedFiles:
     ) -> None:
         """Parse porcelain status output correctly."""
         mock_run.return_value = (
-            " M modified.py\nA  added.py\n?? untracked.py\nMM both_modified.py",
+            " M modified.py\0A  added.py\0?? untracked.py\0MM both_modified.py\0",
             "",
         )
 
@@ -67,16 +103,48 @@ class TestGetChangedFiles:
         assert "both_modified.py" in result
 
     @patch("git_acp.git.diff.run_git_command")
-    def test_get_changed_files__handles_rename_arrow(
+    def test_get_changed_files__handles_rename_record(
+        self, mock_run: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Keep the new path of a rename and skip its original-path record."""
+        mock_run.return_value = ("R  new name.py\0old name.py\0 M other.py\0", "")
+
+        result = get_changed_files(config=mock_config, staged_only=False)
+
+        assert result == {"new name.py", "other.py"}
+        mock_run.assert_called_once_with(
+            ["git", "status", "--porcelain", "-uall", "-z"],
+            mock_config,
+            read_only=True,
+            strip_output=False,
+        )
+
+    def test_get_changed_files__keeps_first_path_of_real_status(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_config: GitConfig,
+    ) -> None:
+        """Read a real repository whose first status record starts with a space."""
+        _commit_files(tmp_path, "bar.txt", "foo.txt")
+        (tmp_path / "bar.txt").write_text("changed\n")
+        (tmp_path / "foo.txt").write_text("changed\n")
+        monkeypatch.chdir(tmp_path)
+
+        result = get_changed_files(config=mock_config, staged_only=False)
+
+        assert result == {"bar.txt", "foo.txt"}
+
+    @patch("git_acp.git.diff.run_git_command")
+    def test_get_changed_files__keeps_paths_with_spaces_verbatim(
         self, mock_run: MagicMock, mock_config: GitConfig
     ) -> None:
-        """Handle renamed files with arrow notation."""
-        mock_run.return_value = ("R  old_name.py -> new_name.py", "")
+        """Return unquoted paths with spaces and non-ASCII characters."""
+        mock_run.return_value = ("?? docs/read me.md\0 M caf\u00e9.py\0", "")
 
         result = get_changed_files(config=mock_config, staged_only=False)
 
-        assert "new_name.py" in result
-        assert "old_name.py" not in result
+        assert result == {"docs/read me.md", "caf\u00e9.py"}
 
     @patch("git_acp.git.diff.run_git_command")
     def test_get_changed_files__excludes_pycache(
@@ -84,9 +152,9 @@ class TestGetChangedFiles:
     ) -> None:
         """Exclude __pycache__ files from results."""
         mock_run.return_value = (
-            " M valid.py\n"
-            " M __pycache__/module.cpython-39.pyc\n"
-            " M src/__pycache__/other.pyc",
+            " M valid.py\0"
+            " M __pycache__/module.cpython-39.pyc\0"
+            " M src/__pycache__/other.pyc\0",
             "",
         )
 
@@ -100,11 +168,8 @@ class TestGetChangedFiles:
     def test_get_changed_files__skips_empty_lines(
         self, mock_run: MagicMock, mock_config: GitConfig
     ) -> None:
-        """Skip empty lines in status output."""
-        mock_run.return_value = (
-            " M file1.py\n\n   \n M file2.py",
-            "",
-        )
+        """Skip empty records in status output."""
+        mock_run.return_value = (" M file1.py\0\0 M file2.py\0", "")
 
         result = get_changed_files(config=mock_config, staged_only=False)
 
@@ -197,7 +262,9 @@ class TestGetDiff:
 
         result = get_diff(diff_type="staged", config=mock_config)
 
-        mock_run.assert_called_once_with(["git", "diff", "--staged"], mock_config)
+        mock_run.assert_called_once_with(
+            ["git", "diff", "--staged"], mock_config, read_only=True
+        )
         assert result == "diff --staged output"
 
     @patch("git_acp.git.diff.run_git_command")
@@ -209,7 +276,7 @@ class TestGetDiff:
 
         result = get_diff(diff_type="unstaged", config=mock_config)
 
-        mock_run.assert_called_once_with(["git", "diff"], mock_config)
+        mock_run.assert_called_once_with(["git", "diff"], mock_config, read_only=True)
         assert result == "diff output"
 
     @patch("git_acp.git.diff.run_git_command")
@@ -219,7 +286,9 @@ class TestGetDiff:
 
         result = get_diff()
 
-        mock_run.assert_called_once_with(["git", "diff", "--staged"], None)
+        mock_run.assert_called_once_with(
+            ["git", "diff", "--staged"], None, read_only=True
+        )
         assert result == "staged diff"
 
     @patch("git_acp.git.diff.run_git_command")
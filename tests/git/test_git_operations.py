@@ -1,5 +1,6 @@
 """Tests for git_acp.git.git_operations helper functions."""
 
+import subprocess
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -65,7 +66,7 @@ class TestDiffOperations:
         mock_run.return_value = ("diff output", "")
         result = get_diff("staged")
         assert result == "diff output"
-        mock_run.assert_called_with(["git", "diff", "--staged"], None)
+        mock_run.assert_called_with(["git", "diff", "--staged"], None, read_only=True)
 
     @patch("git_acp.git.diff.run_git_command")
     def test_get_diff_unstaged(self, mock_run) -> None:
@@ -73,19 +74,31 @@ class TestDiffOperations:
         mock_run.return_value = ("diff output", "")
         result = get_diff("unstaged")
         assert result == "diff output"
-        mock_run.assert_called_with(["git", "diff"], None)
+        mock_run.assert_called_with(["git", "diff"], None, read_only=True)
 
 
 class TestChangedFiles:
     """Tests for get_changed_files helper."""
 
+    def test_keeps_first_path_of_real_status(self, tmp_path, monkeypatch) -> None:
+        """Keep the first letter of a path whose status record starts with a space."""
+        git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run([*git, "init", "-q"], check=True)
+        (tmp_path / "bar.txt").write_text("original\n")
+        subprocess.run([*git, "add", "."], check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+        (tmp_path / "bar.txt").write_text("changed\n")
+        monkeypatch.chdir(tmp_path)
+
+        assert get_changed_files() == {"bar.txt"}
+
     @patch("git_acp.git.git_operations.run_git_command")
     def test_file_exclusion(self, mock_run) -> None:
         """Exclude __pycache__ files from changed file list."""
         mock_run.return_value = (
-            "MM tests/__init__.py\n"
-            "A  src/new_feature.py\n"
-            "D  __pycache__/old.cpython-38.pyc",
+            "MM tests/__init__.py\0"
+            "A  src/new_feature.py\0"
+            "D  __pycache__/old.cpython-38.pyc\0",
             "",
         )
         files = get_changed_files()
@@ -103,7 +116,7 @@ class TestChangedFiles:
         result = get_changed_files(config=mock_config, staged_only=True)
 
         mock_run_git_command.assert_called_once_with(
-            ["git", "diff", "--staged", "--name-only"], mock_config
+            ["git", "diff", "--staged", "--name-only"], mock_config, read_only=True
         )
         assert result == {"file1.py", "folder/file2.py"}
 
@@ -116,7 +129,7 @@ class TestChangedFiles:
         result = get_changed_files(config=mock_config, staged_only=True)
 
         mock_run_git_command.assert_called_once_with(
-            ["git", "diff", "--staged", "--name-only"], mock_config
+            ["git", "diff", "--staged", "--name-only"], mock_config, read_only=True
         )
         assert result == set()
 
@@ -136,7 +149,7 @@ class TestChangedFiles:
         result = get_changed_files(config=mock_config, staged_only=True)
 
         mock_run_git_command.assert_called_once_with(
-            ["git", "diff", "--staged", "--name-only"], mock_config
+            ["git", "diff", "--staged", "--name-only"], mock_config, read_only=True
         )
         # Depending on the actual EXCLUDED_PATTERNS loaded by git_operations
         assert result == {"file1.py", "folder/file2.py"}
@@ -302,9 +315,9 @@ class TestChangedFilesUnittest(
         """Exclude __pycache__ files from changed file list (unittest style)."""
         mock_config = GitConfig(verbose=False)
         mock_run.return_value = (
-            "MM tests/__init__.py\n"
-            "A  src/new_feature.py\n"
-            "D  __pycache__/old.cpython-38.pyc",
+            "MM tests/__init__.py\0"
+            "A  src/new_feature.py\0"
+            "D  __pycache__/old.cpython-38.pyc\0",
             "",
         )
         files = get_changed_files(config=mock_config)
@@ -322,7 +335,7 @@ class TestChangedFilesUnittest(
         result = get_changed_files(config=mock_config, staged_only=True)
 
         mock_run_git_command.assert_called_once_with(
-            ["git", "diff", "--staged", "--name-only"], mock_config
+            ["git", "diff", "--staged", "--name-only"], mock_config, read_only=True
         )
         self.assertEqual(result, {"file1.py", "folder/file2.py"})
 
@@ -335,7 +348,7 @@ class TestChangedFilesUnittest(
         result = get_changed_files(config=mock_config, staged_only=True)
 
         mock_run_git_command.assert_called_once_with(
-            ["git", "diff", "--staged", "--name-only"], mock_config
+            ["git", "diff", "--staged", "--name-only"], mock_config, read_only=True
         )
         self.assertEqual(result, set())
 
@@ -354,7 +367,7 @@ class TestChangedFilesUnittest(
         result = get_changed_files(config=mock_config, staged_only=True)
 
         mock_run_git_command.assert_called_once_with(
-            ["git", "diff", "--staged", "--name-only"], mock_config
+            ["git", "diff", "--staged", "--name-only"], mock_config, read_only=True
         )
         self.assertEqual(result, {"file1.py", "folder/file2.py"})
 
@@ -398,9 +411,9 @@ class TestChangedFilesVerbose:
     def test_get_changed_files__verbose_with_rename(
         self, mock_run, mock_debug_header, mock_debug_item
     ) -> None:
-        """Handle renamed files with arrow notation in verbose mode."""
+        """Handle NUL-separated rename records in verbose mode."""
         mock_config = GitConfig(verbose=True)
-        mock_run.return_value = ("R  old.py -> new.py", "")
+        mock_run.return_value = ("R  new.py\0old.py\0", "")
 
         result = get_changed_files(config=mock_config, staged_only=False)
 
@@ -428,9 +441,9 @@ class TestChangedFilesVerbose:
 
     @patch("git_acp.git.git_operations.run_git_command")
     def test_get_changed_files__empty_line_handling(self, mock_run) -> None:
-        """Skip empty lines in status output."""
+        """Skip empty records in status output."""
         mock_config = GitConfig(verbose=False)
-        mock_run.return_value = (" M file1.py\n\n   \n M file2.py", "")
+        mock_run.return_value = (" M file1.py\0\0 M file2.py\0", "")
 
         result = get_changed_files(config=mock_config, staged_only=False)
 
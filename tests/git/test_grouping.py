@@ -169,3 +169,17 @@ def test_max_non_type_groups_merges_directory_groups_deterministically() -> None
 
     assert len(groups) == 2
     assert sorted([path for group in groups for path in group]) == sorted(files)
+
+
+def test_max_non_type_groups_merges_many_groups_by_shared_prefix() -> None:
+    """Collapse many directory groups, merging siblings before strangers."""
+    files = {f"pkg/mod{i:02d}/sub/a.py" for i in range(30)} | {
+        f"other{i:02d}/x/y.py" for i in range(30)
+    }
+
+    groups = group_changed_files(files, max_non_type_groups=2)
+
+    assert len(groups) == 2
+    assert sorted(path for group in groups for path in group) == sorted(files)
+    pkg_group = next(group for group in groups if group[0].startswith("pkg/"))
+    assert all(path.startswith("pkg/") for path in pkg_group)
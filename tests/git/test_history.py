@@ -15,6 +15,24 @@ from git_acp.git.history import (
 from git_acp.utils import GitConfig
 
 
+def _log_output(*commits: tuple[str, str, list[str]]) -> str:
+    """Build ``git log --name-only`` output in the framed format.
+
+    Args:
+        *commits: ``(hash, message, files)`` tuples, newest first.
+
+    Returns:
+        The stripped stdout ``run_git_command`` would return.
+    """
+    records = [
+        "\x1e"
+        + "\x1f".join([commit_hash, message, "Dev", "2024-01-01"])
+        + "".join(f"\n{path}" for path in files)
+        for commit_hash, message, files in commits
+    ]
+    return "\n\n".join(records)
+
+
 class TestGetRecentCommits:
     """Tests for get_recent_commits function."""
 
@@ -33,15 +51,11 @@ class TestGetRecentCommits:
         self, mock_run: MagicMock, mock_config: GitConfig
     ) -> None:
         """Parse and return commit history as list of dicts."""
-        json_line_1 = (
-            '{"hash":"abc1234","message":"feat: add feature",'
-            '"author":"Dev","date":"2024-01-01"}'
-        )
-        json_line_2 = (
-            '{"hash":"def5678","message":"fix: bug fix",'
-            '"author":"Dev","date":"2024-01-02"}'
+        mock_run.return_value = (
+            "\x1eabc1234\x1ffeat: add feature\x1fDev\x1f2024-01-01\n"
+            "\x1edef5678\x1ffix: bug fix\x1fDev\x1f2024-01-02",
+            "",
         )
-        mock_run.return_value = (f"{json_line_1}\n{json_line_2}", "")
 
         result = get_recent_commits(num_commits=5, config=mock_config)
 
@@ -49,6 +63,7 @@ class TestGetRecentCommits:
         assert result[0]["hash"] == "abc1234"
         assert result[0]["message"] == "feat: add feature"
         assert result[1]["hash"] == "def5678"
+        assert result[1]["date"] == "2024-01-02"
 
     @patch("git_acp.git.history.run_git_command")
     def test_get_recent_commits__returns_empty_list_on_no_commits(
@@ -62,25 +77,31 @@ class TestGetRecentCommits:
         assert result == []
 
     @patch("git_acp.git.history.run_git_command")
-    def test_get_recent_commits__skips_invalid_json(
+    def test_get_recent_commits__skips_malformed_records(
         self, mock_run: MagicMock, mock_config: GitConfig
     ) -> None:
-        """Skip lines that cannot be parsed as JSON."""
-        valid_1 = (
-            '{"hash":"abc1234","message":"valid","author":"Dev","date":"2024-01-01"}'
-        )
-        valid_2 = (
-            '{"hash":"def5678","message":"also valid",'
-            '"author":"Dev","date":"2024-01-02"}'
-        )
+        """Skip records that do not have exactly four fields."""
         mock_run.return_value = (
-            f"{valid_1}\ninvalid json line\n{valid_2}",
+            _log_output(("abc1234", "valid", []))
+            + "\n\x1emalformed record\n"
+            + _log_output(("def5678", "also valid", [])),
             "",
         )
 
         result = get_recent_commits(config=mock_config)
 
-        assert len(result) == 2
+        assert [c["hash"] for c in result] == ["abc1234", "def5678"]
+
+    @patch("git_acp.git.history.run_git_command")
+    def test_get_recent_commits__keeps_messages_with_quotes(
+        self, mock_run: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Keep subjects that would have broken the previous JSON framing."""
+        mock_run.return_value = (_log_output(("abc", 'fix: "quoted" \\ path', [])), "")
+
+        result = get_recent_commits(config=mock_config)
+
+        assert result[0]["message"] == 'fix: "quoted" \\ path'
 
     @patch("git_acp.git.history.run_git_command")
     def test_get_recent_commits__raises_on_git_error(
@@ -105,10 +126,7 @@ class TestGetRecentCommits:
         verbose_config: GitConfig,
     ) -> None:
         """Log debug output in verbose mode."""
-        mock_run.return_value = (
-            '{"hash":"abc","message":"test","author":"Dev","date":"2024-01-01"}',
-            "",
-        )
+        mock_run.return_value = (_log_output(("abc", "test", [])), "")
 
         get_recent_commits(config=verbose_config)
 
@@ -143,44 +161,59 @@ class TestFindRelatedCommits:
         return GitConfig(verbose=True)
 
     @patch("git_acp.git.history.run_git_command")
-    @patch("git_acp.git.history.get_recent_commits")
     def test_find_related_commits__finds_commits_with_matching_files(
         self,
-        mock_get_recent: MagicMock,
         mock_run: MagicMock,
         mock_config: GitConfig,
     ) -> None:
         """Find commits that modified the same files as the diff."""
-        mock_get_recent.return_value = [
-            {"hash": "abc123", "message": "feat: add file"},
-            {"hash": "def456", "message": "fix: update file"},
-        ]
-        # First call for abc123 returns src/file.py
-        # Second call for def456 returns different file
-        mock_run.side_effect = [
-            ("src/file.py", ""),
-            ("other/file.py", ""),
-        ]
+        mock_run.return_value = (
+            _log_output(
+                ("abc123", "feat: add file", ["src/file.py"]),
+                ("def456", "fix: update file", ["other/file.py"]),
+            ),
+            "",
+        )
 
         diff_content = "+++ b/src/file.py\n--- a/src/file.py"
         result = find_related_commits(diff_content, num_commits=5, config=mock_config)
 
-        assert len(result) == 1
-        assert result[0]["hash"] == "abc123"
+        assert result == [
+            {
+                "hash": "abc123",
+                "message": "feat: add file",
+                "author": "Dev",
+                "date": "2024-01-01",
+            }
+        ]
+
+    @patch("git_acp.git.history.run_git_command")
+    def test_find_related_commits__uses_single_log_query(
+        self,
+        mock_run: MagicMock,
+        mock_config: GitConfig,
+    ) -> None:
+        """Read candidates and their files with one git log call."""
+        mock_run.return_value = (_log_output(("abc", "one", ["src/file.py"])), "")
+
+        find_related_commits("+++ b/src/file.py", num_commits=3, config=mock_config)
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[:3] == ["git", "log", "-6"]
+        assert "--name-only" in cmd
 
     @patch("git_acp.git.history.run_git_command")
-    @patch("git_acp.git.history.get_recent_commits")
     def test_find_related_commits__returns_empty_when_no_matches(
         self,
-        mock_get_recent: MagicMock,
         mock_run: MagicMock,
         mock_config: GitConfig,
     ) -> None:
         """Return empty list when no commits match."""
-        mock_get_recent.return_value = [
-            {"hash": "abc123", "message": "feat: unrelated"},
-        ]
-        mock_run.return_value = ("unrelated/file.py", "")
+        mock_run.return_value = (
+            _log_output(("abc123", "feat: unrelated", ["unrelated/file.py"])),
+            "",
+        )
 
         diff_content = "+++ b/src/file.py\n--- a/src/file.py"
         result = find_related_commits(diff_content, config=mock_config)
@@ -188,39 +221,34 @@ class TestFindRelatedCommits:
         assert result == []
 
     @patch("git_acp.git.history.run_git_command")
-    @patch("git_acp.git.history.get_recent_commits")
     def test_find_related_commits__limits_results(
         self,
-        mock_get_recent: MagicMock,
         mock_run: MagicMock,
         mock_config: GitConfig,
     ) -> None:
         """Limit results to requested number of commits."""
-        mock_get_recent.return_value = [
-            {"hash": "abc", "message": "one"},
-            {"hash": "def", "message": "two"},
-            {"hash": "ghi", "message": "three"},
-        ]
-        mock_run.return_value = ("src/file.py", "")
+        mock_run.return_value = (
+            _log_output(
+                ("abc", "one", ["src/file.py"]),
+                ("def", "two", ["src/file.py"]),
+                ("ghi", "three", ["src/file.py"]),
+            ),
+            "",
+        )
 
         diff_content = "+++ b/src/file.py"
         result = find_related_commits(diff_content, num_commits=2, config=mock_config)
 
-        assert len(result) == 2
+        assert [c["hash"] for c in result] == ["abc", "def"]
 
     @patch("git_acp.git.history.run_git_command")
-    @patch("git_acp.git.history.get_recent_commits")
     def test_find_related_commits__skips_dev_null(
         self,
-        mock_get_recent: MagicMock,
         mock_run: MagicMock,
         mock_config: GitConfig,
     ) -> None:
         """Ignore /dev/null in diff paths."""
-        mock_get_recent.return_value = [
-            {"hash": "abc", "message": "delete file"},
-        ]
-        mock_run.return_value = ("", "")
+        mock_run.return_value = (_log_output(("abc", "delete file", [])), "")
 
         diff_content = "+++ b/src/file.py\n--- a//dev/null"
         result = find_related_commits(diff_content, config=mock_config)
@@ -229,59 +257,57 @@ class TestFindRelatedCommits:
         assert "/dev/null" not in str(result)
 
     @patch("git_acp.git.history.run_git_command")
-    @patch("git_acp.git.history.get_recent_commits")
-    def test_find_related_commits__handles_git_error_gracefully(
+    def test_find_related_commits__keeps_messages_with_quotes(
         self,
-        mock_get_recent: MagicMock,
         mock_run: MagicMock,
         mock_config: GitConfig,
     ) -> None:
-        """Continue on git show errors for individual commits."""
-        mock_get_recent.return_value = [
-            {"hash": "abc", "message": "one"},
-            {"hash": "def", "message": "two"},
-        ]
-        # First commit fails, second succeeds
-        mock_run.side_effect = [
-            GitError("commit not found"),
-            ("src/file.py", ""),
-        ]
+        """Parse subjects containing characters that would break JSON."""
+        mock_run.return_value = (
+            _log_output(("abc", 'fix: handle "quoted" \\ paths', ["src/file.py"])),
+            "",
+        )
 
-        diff_content = "+++ b/src/file.py"
-        result = find_related_commits(diff_content, config=mock_config)
+        result = find_related_commits("+++ b/src/file.py", config=mock_config)
 
-        assert len(result) == 1
-        assert result[0]["hash"] == "def"
+        assert result[0]["message"] == 'fix: handle "quoted" \\ paths'
 
-    @patch("git_acp.git.history.get_recent_commits")
-    def test_find_related_commits__raises_on_get_recent_error(
-        self, mock_get_recent: MagicMock, mock_config: GitConfig
+    @patch("git_acp.git.history.run_git_command")
+    def test_find_related_commits__skips_git_when_diff_has_no_files(
+        self,
+        mock_run: MagicMock,
+        mock_config: GitConfig,
     ) -> None:
-        """Raise GitError when getting recent commits fails."""
-        mock_get_recent.side_effect = GitError("not a repository")
+        """Return early without querying history when no paths are found."""
+        result = find_related_commits("no file headers here", config=mock_config)
+
+        assert result == []
+        mock_run.assert_not_called()
+
+    @patch("git_acp.git.history.run_git_command")
+    def test_find_related_commits__raises_on_git_error(
+        self, mock_run: MagicMock, mock_config: GitConfig
+    ) -> None:
+        """Raise GitError when reading the history fails."""
+        mock_run.side_effect = GitError("not a repository")
 
         with pytest.raises(GitError) as exc:
-            find_related_commits("diff", config=mock_config)
+            find_related_commits("+++ b/src/file.py", config=mock_config)
 
         assert "Failed to find related commits" in str(exc.value)
 
     @patch("git_acp.git.history.run_git_command")
-    @patch("git_acp.git.history.get_recent_commits")
     @patch("git_acp.git.history.debug_header")
     @patch("git_acp.git.history.debug_json")
     def test_find_related_commits__verbose_logs_debug(
         self,
         mock_debug_json: MagicMock,
         mock_debug_header: MagicMock,
-        mock_get_recent: MagicMock,
         mock_run: MagicMock,
         verbose_config: GitConfig,
     ) -> None:
         """Log debug output in verbose mode."""
-        mock_get_recent.return_value = [
-            {"hash": "abc", "message": "test"},
-        ]
-        mock_run.return_value = ("src/file.py", "")
+        mock_run.return_value = (_log_output(("abc", "test", ["src/file.py"])), "")
 
         find_related_commits("+++ b/src/file.py", config=verbose_config)
 
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from git_acp.git import staging
 from git_acp.git.core import GitError
 from git_acp.git.staging import (
     get_current_branch,
@@ -21,6 +22,11 @@ from git_acp.git.staging import (
 )
 from git_acp.utils import GitConfig
 
+_PATHSPEC_ADD = ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"]
+_OLD_GIT_ERROR = GitError(
+    "Git command failed: error: unknown option `pathspec-from-file=-'"
+)
+
 
 class TestGetCurrentBranch:
     """Tests for get_current_branch function."""
@@ -46,7 +52,7 @@ class TestGetCurrentBranch:
 
         assert result == "main"
         mock_run.assert_called_once_with(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], mock_config
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"], mock_config, read_only=True
         )
 
     @patch("git_acp.git.staging.run_git_command")
@@ -125,6 +131,11 @@ class TestGetCurrentBranch:
 class TestGitAdd:
     """Tests for git_add function."""
 
+    @pytest.fixture(autouse=True)
+    def _stdin_pathspecs_supported(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test as if git accepts pathspecs on stdin."""
+        monkeypatch.setattr(staging, "_stdin_pathspecs_unsupported", False)
+
     @pytest.fixture
     def mock_config(self) -> GitConfig:
         """Return a mock config object."""
@@ -172,9 +183,28 @@ class TestGitAdd:
 
         git_add("file1.py file2.py", config=mock_config)
 
-        assert mock_run.call_count == 2
-        mock_run.assert_any_call(["git", "add", "file1.py"], mock_config)
-        mock_run.assert_any_call(["git", "add", "file2.py"], mock_config)
+        mock_run.assert_called_once_with(
+            _PATHSPEC_ADD, mock_config, stdin="file1.py\0file2.py"
+        )
+
+    @patch("git_acp.git.staging.success")
+    @patch("git_acp.git.staging.status")
+    @patch("git_acp.git.staging.run_git_command")
+    def test_git_add__deduplicates_paths(
+        self,
+        mock_run: MagicMock,
+        mock_status: MagicMock,
+        mock_success: MagicMock,
+        mock_config: GitConfig,
+    ) -> None:
+        """Send each path once, keeping first-seen order."""
+        mock_run.return_value = ("", "")
+        mock_status.return_value.__enter__ = MagicMock()
+        mock_status.return_value.__exit__ = MagicMock()
+
+        git_add("b.py a.py b.py a.py", config=mock_config)
+
+        mock_run.assert_called_once_with(_PATHSPEC_ADD, mock_config, stdin="b.py\0a.py")
 
     @patch("git_acp.git.staging.success")
     @patch("git_acp.git.staging.status")
@@ -194,7 +224,7 @@ class TestGitAdd:
         git_add('"file with spaces.py"', config=mock_config)
 
         mock_run.assert_called_once_with(
-            ["git", "add", "file with spaces.py"], mock_config
+            _PATHSPEC_ADD, mock_config, stdin="file with spaces.py"
         )
 
     @patch("git_acp.git.staging.success")
@@ -303,6 +333,51 @@ class TestGitAdd:
 
         mock_debug_header.assert_called_with("Git Add Failed")
 
+    @patch("git_acp.git.staging.success")
+    @patch("git_acp.git.staging.status")
+    @patch("git_acp.git.staging.run_git_command")
+    def test_git_add__falls_back_to_arguments_on_old_git(
+        self,
+        mock_run: MagicMock,
+        mock_status: MagicMock,
+        mock_success: MagicMock,
+        mock_config: GitConfig,
+    ) -> None:
+        """Pass paths as arguments once git rejects --pathspec-from-file."""
+        mock_run.side_effect = [_OLD_GIT_ERROR, ("", ""), ("", "")]
+
+        git_add("a.py -b.py", config=mock_config)
+        git_add("c.py", config=mock_config)
+
+        assert mock_run.call_args_list == [
+            ((_PATHSPEC_ADD, mock_config), {"stdin": "a.py\0-b.py"}),
+            ((["git", "add", "--", "a.py", "-b.py"], mock_config),),
+            ((["git", "add", "--", "c.py"], mock_config),),
+        ]
+        assert mock_success.call_count == 2
+
+    @patch("git_acp.git.staging.success")
+    @patch("git_acp.git.staging.status")
+    @patch("git_acp.git.staging.run_git_command")
+    @patch("git_acp.git.staging.debug_item")
+    def test_git_add__verbose_error_logs_command_that_ran(
+        self,
+        mock_debug_item: MagicMock,
+        mock_run: MagicMock,
+        mock_status: MagicMock,
+        mock_success: MagicMock,
+        verbose_config: GitConfig,
+    ) -> None:
+        """Log the pathspec command, not a reconstructed argv form."""
+        mock_run.side_effect = GitError("error")
+
+        with pytest.raises(GitError):
+            git_add("a.py b.py", config=verbose_config)
+
+        mock_debug_item.assert_any_call(
+            "Command", "git add --pathspec-from-file=- --pathspec-file-nul"
+        )
+
 
 class TestGitCommit:
     """Tests for git_commit function."""
@@ -619,3 +694,21 @@ class TestSetupSignalHandlers:
         assert exc.value.code == 1
         mock_unstage.assert_called_once()
         mock_rprint.assert_called_once()
+
+    @patch("git_acp.git.staging.run_git_command")
+    @patch("git_acp.git.staging.rprint")
+    def test_setup_signal_handlers__dry_run_keeps_index(
+        self, mock_rprint: MagicMock, mock_run: MagicMock
+    ) -> None:
+        """Interrupting a dry run exits without running git reset."""
+        setup_signal_handlers(dry_run=True)
+
+        handler = signal.getsignal(signal.SIGINT)
+        typed_handler = cast(Callable[[int, FrameType | None], None], handler)
+
+        with pytest.raises(SystemExit) as exc:
+            typed_handler(signal.SIGINT, None)
+
+        assert exc.value.code == 1
+        mock_run.assert_not_called()
+        mock_rprint.assert_called_once()
@@ -20,6 +20,13 @@ class TestFilterFilesByScope:
         assert filter_files_by_scope(files, ".") == files
         assert filter_files_by_scope(files, "./") == files
 
+    def test_select_all_scope_returns_input_without_copying(self) -> None:
+        """Return the input set itself when the scope selects everything."""
+        files = {"a.py", "dir/c.md"}
+        assert filter_files_by_scope(files, None) is files
+        assert filter_files_by_scope(files, "./") is files
+        assert filter_files_by_scope(files, "a.py .") is files
+
     def test_returns_all_files_for_dot_token_among_patterns(self) -> None:
         """Return all files when '.' is included among patterns."""
         files = {"a.py", "b.txt", "dir/c.md"}
@@ -132,3 +139,13 @@ class TestFilterFilesByScope:
         files = {"a.txt", "dir/b.txt", "dir/sub/c.txt", "other/d.py"}
         result = filter_files_by_scope(files, "*.txt")
         assert result == {"a.txt", "dir/b.txt", "dir/sub/c.txt"}
+
+    def test_directory_target_does_not_match_sibling_with_shared_prefix(self) -> None:
+        """Match directory targets on path components, not raw string prefixes."""
+        files = {"a/x.py", "a-b/y.py", "ab.py", "a/b/c/z.py"}
+        assert filter_files_by_scope(files, "a a-b/") == {
+            "a/x.py",
+            "a-b/y.py",
+            "a/b/c/z.py",
+        }
+        assert filter_files_by_scope(files, "a/b") == {"a/b/c/z.py"}
@@ -1,5 +1,9 @@
 """Unit tests for formatting utilities."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from git_acp.config import TERMINAL_WIDTH
 from git_acp.utils import formatting
 
@@ -84,3 +88,53 @@ def test_success__displays_message(capsys):
     captured = capsys.readouterr()
     assert "✓" in captured.out
     assert "Operation completed" in captured.out
+
+
+def test_questionary_style_is_built_once():
+    """Reuse one parsed prompt style across calls."""
+    formatting.questionary_style.cache_clear()
+
+    first = formatting.questionary_style()
+
+    assert formatting.questionary_style() is first
+
+
+def test_call_with_deferred_debug__holds_worker_output_until_flushed(capsys):
+    """Print a worker's debug lines only when the caller flushes them."""
+    lines: list[str] = []
+
+    def worker() -> str:
+        formatting.debug_header("Worker step")
+        formatting.debug_item("Worker value", "42")
+        return "done"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(formatting.call_with_deferred_debug, lines, worker)
+        assert future.result() == "done"
+
+    formatting.debug_header("Main step")
+    assert "Worker" not in capsys.readouterr().out
+
+    formatting.flush_debug_output(lines)
+    out = capsys.readouterr().out
+    assert "Worker step" in out
+    assert "42" in out
+    assert lines == []
+
+
+def test_call_with_deferred_debug__restores_direct_output_after_error(capsys):
+    """Keep lines gathered before a failure and print directly afterwards."""
+    lines: list[str] = []
+
+    def failing() -> None:
+        formatting.debug_item("Before failure")
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        formatting.call_with_deferred_debug(lines, failing)
+
+    formatting.debug_item("Direct")
+    out = capsys.readouterr().out
+    assert "Direct" in out
+    assert "Before failure" not in out
+    assert len(lines) == 1